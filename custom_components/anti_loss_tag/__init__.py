@@ -5,13 +5,27 @@ from __future__ import annotations
 
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
+from .advertisement_router import AdvertisementRouter
+from .battery_scheduler import BatteryPollScheduler
 from .const import DOMAIN
 from .device import AntiLossTagDevice
 from .connection_manager import BleConnectionManager
+from .presence_monitor import PresenceTimerWheel
+from .startup_planner import StartupPlanner
+from .update_batcher import EntityUpdateBatcher
+from .utils.constants import (
+    BATTERY_SCHEDULER_MAX_CONCURRENT,
+    BATTERY_SCHEDULER_MAX_PER_MINUTE,
+    ENTITY_UPDATE_BATCH_INTERVAL_SECONDS,
+    PRESENCE_WHEEL_SLOTS,
+    PRESENCE_WHEEL_TICK_SECONDS,
+    STARTUP_MIN_DELAY_SECONDS,
+    STARTUP_SECONDS_PER_CONNECT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +37,14 @@ PLATFORMS: list[Platform] = [
     Platform.EVENT,
 ]
 
+# 需要显式停止的全局共享组件（持有定时器或蓝牙回调）
+_SHARED_HELPERS_WITH_SHUTDOWN = (
+    "_battery_scheduler",
+    "_presence_wheel",
+    "_update_batcher",
+    "_advert_router",
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up BLE Anti-Loss Tag from a config entry."""
@@ -31,6 +53,52 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # 全局 BLE 连接槽位管理器（限制同时保持的 GATT 连接数，提升多设备稳定性）
     hass.data[DOMAIN].setdefault("_conn_mgr", BleConnectionManager(max_connections=3))
 
+    # 全局电量轮询调度器（单个最小堆 + 全局并发/每分钟预算）
+    hass.data[DOMAIN].setdefault(
+        "_battery_scheduler",
+        BatteryPollScheduler(
+            hass.loop,
+            conn_mgr=hass.data[DOMAIN]["_conn_mgr"],
+            max_concurrent=BATTERY_SCHEDULER_MAX_CONCURRENT,
+            max_per_minute=BATTERY_SCHEDULER_MAX_PER_MINUTE,
+        ),
+    )
+
+    # 全局启动错峰规划器（按车队规模与连接槽位数分配首次连接/读取时隙）
+    hass.data[DOMAIN].setdefault(
+        "_startup_planner",
+        StartupPlanner(
+            # 读取时计算，新增/删除/禁用条目后窗口随之变化
+            fleet_size=lambda: len(
+                hass.config_entries.async_entries(
+                    DOMAIN, include_ignore=False, include_disabled=False
+                )
+            ),
+            slot_capacity=hass.data[DOMAIN]["_conn_mgr"].max_connections,
+            seconds_per_connect=STARTUP_SECONDS_PER_CONNECT,
+            min_delay=STARTUP_MIN_DELAY_SECONDS,
+        ),
+    )
+
+    # 全局实体更新批处理器（同一 tick 内多设备的状态写入合并刷新）
+    hass.data[DOMAIN].setdefault(
+        "_update_batcher",
+        EntityUpdateBatcher(hass.loop, interval=ENTITY_UPDATE_BATCH_INTERVAL_SECONDS),
+    )
+
+    # 全局广播路由器（只注册一个 FFE0 回调，按地址分发到各设备）
+    hass.data[DOMAIN].setdefault("_advert_router", AdvertisementRouter(hass))
+
+    # 全局离线检测时间轮（按各标签实测广播间隔判定离开，未学习到间隔时使用兜底超时）
+    hass.data[DOMAIN].setdefault(
+        "_presence_wheel",
+        PresenceTimerWheel(
+            hass.loop,
+            tick_seconds=PRESENCE_WHEEL_TICK_SECONDS,
+            slots=PRESENCE_WHEEL_SLOTS,
+        ),
+    )
+
     device = AntiLossTagDevice(hass=hass, entry=entry)
     entry.runtime_data = device
 
@@ -58,4 +126,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     device.async_stop()
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+
+    if unload_ok and not any(
+        other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        # 最后一个条目卸载：停止全局组件并移除，重新加载时按当前配置重建
+        _async_shutdown_shared(hass)
+
     return unload_ok
+
+
+def _async_shutdown_shared(hass: HomeAssistant) -> None:
+    """Stop and drop the integration-wide helpers stored in hass.data."""
+    shared = hass.data.pop(DOMAIN, {})
+    for key in _SHARED_HELPERS_WITH_SHUTDOWN:
+        helper = shared.get(key)
+        if helper is not None:
+            helper.async_shutdown()
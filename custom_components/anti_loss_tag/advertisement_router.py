@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+
+from homeassistant.components import bluetooth
+from homeassistant.core import HomeAssistant, callback
+
+from .const import SERVICE_UUID_FFE0
+
+_LOGGER = logging.getLogger(__name__)
+
+AdvertisementCallback = Callable[
+    [bluetooth.BluetoothServiceInfoBleak, bluetooth.BluetoothChange], None
+]
+
+
+class AdvertisementRouter:
+    """
+    集成级广播路由器：
+    - 全集成只向 HA 注册一个按 FFE0 服务 UUID 匹配的回调（与 manifest.json 一致），
+      而不是每个标签各注册一个 address 匹配器
+    - 按规范化（大写）地址 O(1) 查表分发到已挂载的设备
+    - 第一个设备挂载时注册，最后一个设备卸载时注销
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize advertisement router."""
+        self.hass = hass
+        self._routes: dict[str, AdvertisementCallback] = {}
+        self._cancel_callback: Callable[[], None] | None = None
+        self._routed = 0
+        self._unrouted = 0
+
+    @property
+    def attached(self) -> int:
+        """Return number of attached devices."""
+        return len(self._routes)
+
+    @property
+    def registered(self) -> bool:
+        """Return True while the HA bluetooth callback is registered."""
+        return self._cancel_callback is not None
+
+    @property
+    def routed(self) -> int:
+        """Return number of advertisements delivered to a device."""
+        return self._routed
+
+    @property
+    def unrouted(self) -> int:
+        """Return number of FFE0 advertisements with no attached device."""
+        return self._unrouted
+
+    @callback
+    def async_attach(
+        self, address: str, advert_callback: AdvertisementCallback
+    ) -> Callable[[], None]:
+        """Route advertisements for an address; return a detach callable."""
+        key = address.upper()
+        self._routes[key] = advert_callback
+        if self._cancel_callback is None:
+            self._cancel_callback = bluetooth.async_register_callback(
+                self.hass,
+                self._async_on_advertisement,
+                {"service_uuid": SERVICE_UUID_FFE0},
+                bluetooth.BluetoothScanningMode.ACTIVE,
+            )
+
+        @callback
+        def _detach() -> None:
+            # 只移除自己登记的回调（同地址重新挂载后旧的 detach 不影响新设备）
+            if self._routes.get(key) is advert_callback:
+                del self._routes[key]
+            if not self._routes:
+                self.async_shutdown()
+
+        return _detach
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Unregister the HA bluetooth callback."""
+        if self._cancel_callback is not None:
+            self._cancel_callback()
+            self._cancel_callback = None
+
+    @callback
+    def _async_on_advertisement(
+        self,
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        address = service_info.address
+        routes = self._routes
+        advert_callback = routes.get(address)
+        if advert_callback is None:
+            advert_callback = routes.get(address.upper())
+            if advert_callback is None:
+                # 其他未配置的 FFE0 标签
+                self._unrouted += 1
+                return
+        self._routed += 1
+        try:
+            advert_callback(service_info, change)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Error handling advertisement for %s", address)
@@ -0,0 +1,141 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+from array import array
+
+from .utils.constants import (
+    BATTERY_MODEL_DROP_FACTOR,
+    BATTERY_MODEL_HISTORY_SIZE,
+    BATTERY_MODEL_LOW_FACTOR,
+    BATTERY_MODEL_LOW_THRESHOLDS,
+    BATTERY_MODEL_MIN_INTERVAL_SECONDS,
+    BATTERY_MODEL_MIN_SPAN_SECONDS,
+    BATTERY_MODEL_REPLACED_RISE_PERCENT,
+    BATTERY_MODEL_SAFETY_FACTOR,
+    BATTERY_MODEL_SUDDEN_DROP_PERCENT,
+)
+
+
+class BatteryDischargeModel:
+    """
+    单设备电量放电模型：
+    - 固定大小环形缓冲区保存 (墙钟时间, 电量%) 读数，内存与运行时长无关
+    - 最小二乘拟合放电速率（%/小时），预测到达下一个低电量阈值的时间
+    - 电量高且平稳时沿用配置间隔（上限）；接近阈值、电量偏低或骤降时缩短间隔
+    - 电量明显回升视为更换电池，清空历史重新拟合
+    """
+
+    __slots__ = ("_times", "_levels", "_size", "_index", "_count")
+
+    def __init__(self, size: int = BATTERY_MODEL_HISTORY_SIZE) -> None:
+        """Initialize discharge model."""
+        self._size = max(2, int(size))
+        self._times = array("d", bytes(8 * self._size))
+        self._levels = array("B", bytes(self._size))
+        self._index = 0
+        self._count = 0
+
+    @property
+    def sample_count(self) -> int:
+        """Return number of buffered readings."""
+        return self._count
+
+    @property
+    def latest_level(self) -> int | None:
+        """Return the most recent battery level."""
+        if self._count == 0:
+            return None
+        return self._levels[(self._index - 1) % self._size]
+
+    @property
+    def previous_level(self) -> int | None:
+        """Return the battery level before the most recent one."""
+        if self._count < 2:
+            return None
+        return self._levels[(self._index - 2) % self._size]
+
+    @property
+    def drain_per_hour(self) -> float | None:
+        """Return the fitted discharge rate in percent per hour (positive = draining)."""
+        count = self._count
+        if count < 2:
+            return None
+        size = self._size
+        start = self._index if count == size else 0
+        times = [self._times[(start + i) % size] for i in range(count)]
+        levels = [self._levels[(start + i) % size] for i in range(count)]
+        span = times[-1] - times[0]
+        if span < BATTERY_MODEL_MIN_SPAN_SECONDS:
+            return None
+        mean_t = sum(times) / count
+        mean_l = sum(levels) / count
+        var_t = sum((t - mean_t) ** 2 for t in times)
+        if var_t <= 0:
+            return None
+        cov = sum((t - mean_t) * (lv - mean_l) for t, lv in zip(times, levels))
+        return -(cov / var_t) * 3600.0
+
+    def add(self, timestamp: float, level: int) -> None:
+        """Record a reading (wall-clock seconds, percent)."""
+        level = max(0, min(100, int(level)))
+        latest = self.latest_level
+        if latest is not None:
+            if level - latest >= BATTERY_MODEL_REPLACED_RISE_PERCENT:
+                self.reset()
+            elif timestamp <= self._times[(self._index - 1) % self._size]:
+                # 时钟回拨或重复读数：只更新最新电量，不引入非单调时间点
+                self._levels[(self._index - 1) % self._size] = level
+                return
+        index = self._index
+        self._times[index] = timestamp
+        self._levels[index] = level
+        index += 1
+        self._index = 0 if index == self._size else index
+        if self._count < self._size:
+            self._count += 1
+
+    def recommend_interval(self, upper_seconds: float) -> tuple[float, str]:
+        """Return (interval seconds, reason) bounded above by the configured interval."""
+        upper = float(upper_seconds)
+        floor = min(BATTERY_MODEL_MIN_INTERVAL_SECONDS, upper)
+        level = self.latest_level
+        if level is None:
+            return (upper, "normal_poll")
+
+        interval = upper
+        reason = "normal_poll"
+
+        previous = self.previous_level
+        if (
+            previous is not None
+            and previous - level >= BATTERY_MODEL_SUDDEN_DROP_PERCENT
+        ):
+            interval = upper * BATTERY_MODEL_DROP_FACTOR
+            reason = "battery_sudden_drop"
+
+        if level <= BATTERY_MODEL_LOW_THRESHOLDS[-1]:
+            return (floor, "battery_critical")
+
+        next_threshold = next(t for t in BATTERY_MODEL_LOW_THRESHOLDS if t < level)
+        drain = self.drain_per_hour
+        if drain is not None and drain > 0:
+            # 在预计越过下一个阈值之前至少再读一次
+            hours_left = (level - next_threshold) / drain
+            candidate = hours_left * 3600.0 * BATTERY_MODEL_SAFETY_FACTOR
+            if candidate < interval:
+                interval = candidate
+                reason = "battery_approaching_low"
+        if level <= BATTERY_MODEL_LOW_THRESHOLDS[0]:
+            candidate = upper * BATTERY_MODEL_LOW_FACTOR
+            if candidate < interval:
+                interval = candidate
+                reason = "battery_low"
+
+        return (max(floor, min(upper, interval)), reason)
+
+    def reset(self) -> None:
+        """Drop buffered readings."""
+        self._index = 0
+        self._count = 0
@@ -0,0 +1,214 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from .connection_manager import BleConnectionManager
+
+_LOGGER = logging.getLogger(__name__)
+
+# 到期回调：发起读取时返回其 future（计入并发预算），未发起（推迟/跳过）时返回 None
+BatteryPollCallback = Callable[[], "asyncio.Future[Any] | None"]
+
+_BUDGET_WINDOW_SECONDS = 60.0
+
+
+class BatteryPollScheduler:
+    """
+    集成级电量轮询调度器：
+    - 所有标签共用一个按到期时间排序的最小堆与一个定时器，不再每设备各自计时
+    - 分发受全局预算约束：同时在途读取 ≤ max_concurrent，每分钟分发 ≤ max_per_minute
+    - 超出预算的到期项留在堆中，待读取完成或分钟窗口滑动后再分发
+    - 等待连接槽位的设备挂起，由连接管理器释放槽位时唤醒（无轮询）
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        conn_mgr: BleConnectionManager | None = None,
+        max_concurrent: int = 2,
+        max_per_minute: int = 30,
+    ) -> None:
+        """Initialize battery poll scheduler."""
+        self._loop = loop
+        self._max_concurrent = max(1, int(max_concurrent))
+        self._max_per_minute = max(1, int(max_per_minute))
+        # (到期时间, 序号, key)；重新排程时旧条目惰性丢弃
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._entries: dict[Hashable, tuple[float, int, BatteryPollCallback]] = {}
+        self._slot_waiters: dict[Hashable, BatteryPollCallback] = {}
+        self._seq = 0
+        self._handle: asyncio.TimerHandle | None = None
+        self._in_flight = 0
+        self._dispatch_times: deque[float] = deque()
+        self._dispatched_total = 0
+        self._budget_waits = 0
+        self._cancel_release_listener: Callable[[], None] | None = None
+        if conn_mgr is not None:
+            self._cancel_release_listener = conn_mgr.add_release_listener(
+                self._async_on_slot_released
+            )
+
+    @property
+    def max_concurrent(self) -> int:
+        """Return maximum concurrent battery reads."""
+        return self._max_concurrent
+
+    @property
+    def max_per_minute(self) -> int:
+        """Return maximum battery reads dispatched per minute."""
+        return self._max_per_minute
+
+    @property
+    def scheduled(self) -> int:
+        """Return number of devices with a pending poll."""
+        return len(self._entries)
+
+    @property
+    def waiting_for_slot(self) -> int:
+        """Return number of devices parked until a connection slot frees."""
+        return len(self._slot_waiters)
+
+    @property
+    def in_flight(self) -> int:
+        """Return number of battery reads currently running."""
+        return self._in_flight
+
+    @property
+    def dispatched_total(self) -> int:
+        """Return total battery reads dispatched."""
+        return self._dispatched_total
+
+    @property
+    def budget_waits(self) -> int:
+        """Return how often due polls had to wait for the global budget."""
+        return self._budget_waits
+
+    def is_scheduled(self, key: Hashable) -> bool:
+        """Return True if the key has a pending or parked poll."""
+        return key in self._entries or key in self._slot_waiters
+
+    def async_schedule(
+        self, key: Hashable, delay: float, callback: BatteryPollCallback
+    ) -> None:
+        """Schedule (or move) the next poll for a key."""
+        self._slot_waiters.pop(key, None)
+        self._push(key, time.monotonic() + max(0.0, delay), callback)
+        self._arm()
+
+    def async_wait_for_slot(self, key: Hashable, callback: BatteryPollCallback) -> None:
+        """Park a key until the connection manager releases a slot."""
+        self._entries.pop(key, None)
+        self._slot_waiters[key] = callback
+
+    def async_cancel(self, key: Hashable) -> None:
+        """Forget a key."""
+        self._entries.pop(key, None)
+        self._slot_waiters.pop(key, None)
+        if not self._entries:
+            self._stop()
+
+    def async_shutdown(self) -> None:
+        """Stop the timer and drop all keys."""
+        self._stop()
+        self._heap.clear()
+        self._entries.clear()
+        self._slot_waiters.clear()
+        if self._cancel_release_listener is not None:
+            self._cancel_release_listener()
+            self._cancel_release_listener = None
+
+    def _push(self, key: Hashable, due: float, callback: BatteryPollCallback) -> None:
+        self._seq += 1
+        self._entries[key] = (due, self._seq, callback)
+        heapq.heappush(self._heap, (due, self._seq, key))
+
+    def _stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _arm(self, at: float | None = None) -> None:
+        """Arm the single timer for the earliest due entry (or a budget release)."""
+        heap = self._heap
+        entries = self._entries
+        while heap and entries.get(heap[0][2], (0.0, -1))[1] != heap[0][1]:
+            heapq.heappop(heap)
+        if not heap:
+            self._stop()
+            return
+        when = heap[0][0] if at is None or at < heap[0][0] else at
+        self._stop()
+        self._handle = self._loop.call_later(
+            max(0.0, when - time.monotonic()), self._async_run
+        )
+
+    def _budget_release_time(self, now: float) -> float | None:
+        """Return when the next dispatch is allowed, or None if allowed now."""
+        if self._in_flight >= self._max_concurrent:
+            # 由读取完成回调重新调度
+            return float("inf")
+        window = self._dispatch_times
+        while window and now - window[0] >= _BUDGET_WINDOW_SECONDS:
+            window.popleft()
+        if len(window) >= self._max_per_minute:
+            return window[0] + _BUDGET_WINDOW_SECONDS
+        return None
+
+    def _async_run(self) -> None:
+        self._handle = None
+        heap = self._heap
+        entries = self._entries
+        now = time.monotonic()
+        # 本轮内回调重新排入的条目留到下一轮，避免同一 tick 内重复分发
+        last_seq = self._seq
+        while heap and heap[0][0] <= now and heap[0][1] <= last_seq:
+            due, seq, key = heap[0]
+            entry = entries.get(key)
+            if entry is None or entry[1] != seq:
+                heapq.heappop(heap)
+                continue
+            release = self._budget_release_time(now)
+            if release is not None:
+                self._budget_waits += 1
+                if release != float("inf"):
+                    self._arm(release)
+                return
+            heapq.heappop(heap)
+            del entries[key]
+            try:
+                future = entry[2]()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error dispatching battery poll for %s", key)
+                continue
+            if future is None:
+                continue
+            self._in_flight += 1
+            self._dispatched_total += 1
+            self._dispatch_times.append(now)
+            future.add_done_callback(self._on_read_done)
+        self._arm()
+
+    def _on_read_done(self, _future: asyncio.Future[Any]) -> None:
+        self._in_flight -= 1
+        if self._handle is None:
+            self._arm()
+
+    def _async_on_slot_released(self) -> None:
+        if not self._slot_waiters:
+            return
+        waiters = self._slot_waiters
+        self._slot_waiters = {}
+        now = time.monotonic()
+        for key, callback in waiters.items():
+            self._push(key, now, callback)
+        self._arm()
@@ -11,7 +11,7 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .device import AntiLossTagDevice
+from .device import AntiLossTagDevice, DeviceField
 from .entity_mixin import AntiLossTagEntityMixin
 
 
@@ -23,6 +23,7 @@ async def async_setup_entry(
         [
             AntiLossTagInRangeBinarySensor(device),
             AntiLossTagConnectedBinarySensor(device),
+            AntiLossTagAlarmBinarySensor(device),
         ],
         update_before_add=False,
     )
@@ -31,13 +32,17 @@ async def async_setup_entry(
 class _AntiLossTagBinaryBase(AntiLossTagEntityMixin, BinarySensorEntity):
     _attr_has_entity_name = True
     _attr_parallel_updates = 0
+    # 只在这些设备字段变化时写入状态
+    _listen_fields: DeviceField = DeviceField.ALL
 
     def __init__(self, device: AntiLossTagDevice) -> None:
         self._dev = device
         self._unsub = None
 
     async def async_added_to_hass(self) -> None:
-        self._unsub = self._dev.async_add_listener(self.async_write_ha_state)
+        self._unsub = self._dev.async_add_listener(
+            self.async_write_ha_state, self._listen_fields
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub is not None:
@@ -47,6 +52,7 @@ class _AntiLossTagBinaryBase(AntiLossTagEntityMixin, BinarySensorEntity):
 
 class AntiLossTagInRangeBinarySensor(_AntiLossTagBinaryBase):
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _listen_fields = DeviceField.AVAILABLE
 
     def __init__(self, device: AntiLossTagDevice) -> None:
         super().__init__(device)
@@ -60,6 +66,7 @@ class AntiLossTagInRangeBinarySensor(_AntiLossTagBinaryBase):
 
 class AntiLossTagConnectedBinarySensor(_AntiLossTagBinaryBase):
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _listen_fields = DeviceField.CONNECTED
 
     def __init__(self, device: AntiLossTagDevice) -> None:
         super().__init__(device)
@@ -69,3 +76,18 @@ class AntiLossTagConnectedBinarySensor(_AntiLossTagBinaryBase):
     @property
     def is_on(self) -> bool:
         return self._dev.connected
+
+
+class AntiLossTagAlarmBinarySensor(_AntiLossTagBinaryBase):
+    _attr_device_class = BinarySensorDeviceClass.SOUND
+    _listen_fields = DeviceField.ALARM
+
+    def __init__(self, device: AntiLossTagDevice) -> None:
+        super().__init__(device)
+        self._attr_name = "报警状态"
+        self._attr_unique_id = f"{device.address}_alarm_active"
+
+    @property
+    def is_on(self) -> bool | None:
+        # None 表示未知（启动后或断开报警可能已触发）
+        return self._dev.alarm_active
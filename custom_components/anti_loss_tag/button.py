@@ -13,7 +13,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .device import AntiLossTagDevice
+from .device import AntiLossTagDevice, DeviceField
 from .entity_mixin import AntiLossTagEntityMixin
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,7 +42,10 @@ class _AntiLossTagButtonBase(AntiLossTagEntityMixin, ButtonEntity):
         self._unsub = None
 
     async def async_added_to_hass(self) -> None:
-        self._unsub = self._dev.async_add_listener(self.async_write_ha_state)
+        # 按钮状态只取决于可用性
+        self._unsub = self._dev.async_add_listener(
+            self.async_write_ha_state, DeviceField.AVAILABLE | DeviceField.CONNECTED
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub is not None:
@@ -86,6 +89,7 @@ class AntiLossTagStopAlarmButton(_AntiLossTagButtonBase):
 
     async def async_press(self) -> None:
         try:
+            # 已知静默时在本地完成；超时后状态为未知，仍会写入
             await self._dev.async_stop_alarm()
         except BleakError as err:
             error_classification = (
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import logging
+import time
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+# 只有“标签自身不可达”类的连接失败才计入断路器；
+# slot_timeout 属于全局拥塞，与单个标签健康度无关
+TRIP_CLASSIFICATIONS = frozenset(
+    {"scanner_unavailable", "connect_error", "service_discovery_error"}
+)
+
+
+class DeviceCircuitBreaker:
+    """
+    单设备断路器：
+    - closed：正常放行
+    - open：连续 N 次连接失败后打开，冷却期内操作立即失败（不排队、不占槽位）
+    - half_open：冷却期结束后仅放行一个探测操作；收到广播确认标签回归后才关闭
+    """
+
+    def __init__(self, *, failure_threshold: int, cooloff_seconds: float) -> None:
+        """Initialize circuit breaker."""
+        self._threshold = max(1, int(failure_threshold))
+        self._cooloff = max(0.0, float(cooloff_seconds))
+        self._state = CIRCUIT_CLOSED
+        self._consecutive_failures = 0
+        self._open_until_ts = 0.0
+        self._probe_in_flight = False
+        self._open_count = 0
+        self._rejected_count = 0
+
+    @property
+    def state(self) -> str:
+        """Return current state (open transitions to half_open after cool-off)."""
+        if self._state == CIRCUIT_OPEN and time.monotonic() >= self._open_until_ts:
+            self._state = CIRCUIT_HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are rejected without a probe slot."""
+        return self.state == CIRCUIT_OPEN
+
+    @property
+    def consecutive_failures(self) -> int:
+        """Return consecutive counted failures."""
+        return self._consecutive_failures
+
+    @property
+    def open_count(self) -> int:
+        """Return how many times the breaker has opened."""
+        return self._open_count
+
+    @property
+    def rejected_count(self) -> int:
+        """Return number of requests rejected by the breaker."""
+        return self._rejected_count
+
+    @property
+    def cooloff_remaining(self) -> float:
+        """Return remaining cool-off seconds (0 when not open)."""
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        return max(0.0, self._open_until_ts - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may proceed (half_open admits one probe)."""
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return True
+        if state == CIRCUIT_HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self._rejected_count += 1
+        return False
+
+    def release_probe(self) -> None:
+        """Mark the half_open probe as finished."""
+        self._probe_in_flight = False
+
+    def record_failure(self, classification: str | None) -> None:
+        """Record a connection failure keyed on its classification."""
+        if classification not in TRIP_CLASSIFICATIONS:
+            return
+        self._consecutive_failures += 1
+        state = self.state
+        if state == CIRCUIT_HALF_OPEN or (
+            state == CIRCUIT_CLOSED and self._consecutive_failures >= self._threshold
+        ):
+            self._open()
+
+    def record_success(self) -> None:
+        """Record a successful connection (does not close a half_open breaker)."""
+        self._consecutive_failures = 0
+
+    def record_advertisement(self) -> None:
+        """Close a half_open breaker once an advertisement confirms the tag is back."""
+        if self._state == CIRCUIT_CLOSED:
+            return
+        if self.state == CIRCUIT_HALF_OPEN:
+            _LOGGER.debug("Circuit breaker closed after advertisement")
+            self._state = CIRCUIT_CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = CIRCUIT_OPEN
+        self._open_until_ts = time.monotonic() + self._cooloff
+        self._probe_in_flight = False
+        self._open_count += 1
@@ -15,15 +15,30 @@ from .const import (
     CONF_ALARM_ON_DISCONNECT,
     CONF_AUTO_RECONNECT,
     CONF_BATTERY_POLL_INTERVAL_MIN,
+    CONF_BUTTON_LONG_PRESS_MS,
+    CONF_BUTTON_MULTI_PRESS_WINDOW_MS,
     CONF_MAINTAIN_CONNECTION,
     CONF_NAME,
+    CONF_RSSI_DEADBAND_DB,
+    CONF_ADVERT_AGGREGATION_WINDOW_MS,
+    CONF_RSSI_FILTER,
+    CONF_RSSI_MAX_PUBLISH_INTERVAL_S,
+    CONF_RSSI_MIN_PUBLISH_INTERVAL_S,
     DEFAULT_ALARM_ON_DISCONNECT,
     DEFAULT_AUTO_RECONNECT,
     DEFAULT_BATTERY_POLL_INTERVAL_MIN,
+    DEFAULT_BUTTON_LONG_PRESS_MS,
+    DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS,
     DEFAULT_MAINTAIN_CONNECTION,
+    DEFAULT_RSSI_DEADBAND_DB,
+    DEFAULT_ADVERT_AGGREGATION_WINDOW_MS,
+    DEFAULT_RSSI_FILTER,
+    DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S,
+    DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S,
     DOMAIN,
 )
 
+from .rssi_filter import RSSI_FILTER_MODES
 from .utils.validation import is_valid_ble_address, is_valid_device_name
 
 
@@ -195,6 +210,48 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                         DEFAULT_BATTERY_POLL_INTERVAL_MIN,
                     ),
                 ): vol.All(int, vol.Range(min=5, max=7 * 24 * 60)),
+                vol.Required(
+                    CONF_RSSI_DEADBAND_DB,
+                    default=opts.get(CONF_RSSI_DEADBAND_DB, DEFAULT_RSSI_DEADBAND_DB),
+                ): vol.All(int, vol.Range(min=0, max=30)),
+                vol.Required(
+                    CONF_RSSI_MIN_PUBLISH_INTERVAL_S,
+                    default=opts.get(
+                        CONF_RSSI_MIN_PUBLISH_INTERVAL_S,
+                        DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S,
+                    ),
+                ): vol.All(int, vol.Range(min=0, max=3600)),
+                vol.Required(
+                    CONF_RSSI_MAX_PUBLISH_INTERVAL_S,
+                    default=opts.get(
+                        CONF_RSSI_MAX_PUBLISH_INTERVAL_S,
+                        DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S,
+                    ),
+                ): vol.All(int, vol.Range(min=10, max=24 * 60 * 60)),
+                vol.Required(
+                    CONF_RSSI_FILTER,
+                    default=opts.get(CONF_RSSI_FILTER, DEFAULT_RSSI_FILTER),
+                ): vol.In(RSSI_FILTER_MODES),
+                vol.Required(
+                    CONF_ADVERT_AGGREGATION_WINDOW_MS,
+                    default=opts.get(
+                        CONF_ADVERT_AGGREGATION_WINDOW_MS,
+                        DEFAULT_ADVERT_AGGREGATION_WINDOW_MS,
+                    ),
+                ): vol.All(int, vol.Range(min=0, max=10000)),
+                vol.Required(
+                    CONF_BUTTON_MULTI_PRESS_WINDOW_MS,
+                    default=opts.get(
+                        CONF_BUTTON_MULTI_PRESS_WINDOW_MS,
+                        DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS,
+                    ),
+                ): vol.All(int, vol.Range(min=0, max=2000)),
+                vol.Required(
+                    CONF_BUTTON_LONG_PRESS_MS,
+                    default=opts.get(
+                        CONF_BUTTON_LONG_PRESS_MS, DEFAULT_BUTTON_LONG_PRESS_MS
+                    ),
+                ): vol.All(int, vol.Range(min=0, max=10000)),
             }
         )
         return self.async_show_form(step_id="init", data_schema=schema)
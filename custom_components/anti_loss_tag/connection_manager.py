@@ -6,6 +6,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,6 +37,7 @@ class BleConnectionManager:
         self._acquire_timeout = 0
         self._acquire_error = 0
         self._acquire_wait_total = 0.0
+        self._release_listeners: list[Callable[[], None]] = []
 
     @property
     def max_connections(self) -> int:
@@ -70,6 +72,23 @@ class BleConnectionManager:
             return 0.0
         return (self._acquire_wait_total / success) * 1000.0
 
+    def add_release_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """Call listener whenever a slot is released; return a remove callable."""
+        self._release_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._release_listeners:
+                self._release_listeners.remove(listener)
+
+        return _remove
+
+    def _notify_released(self) -> None:
+        for listener in list(self._release_listeners):
+            try:
+                listener()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error in connection slot release listener")
+
     async def acquire(self, *, timeout: float | None = 30.0) -> AcquireResult:
         """Acquire one slot, optionally timing out."""
         start = time.monotonic()
@@ -101,3 +120,14 @@ class BleConnectionManager:
         except ValueError:
             # release 次数超了（理论不该发生），保护一下
             _LOGGER.debug("Semaphore released too many times; ignoring.")
+        self._notify_released()
+
+    def release_nowait(self) -> None:
+        """Release one slot from a synchronous callback (event loop thread)."""
+        if self._in_use > 0:
+            self._in_use -= 1
+        try:
+            self._sem.release()
+        except ValueError:
+            _LOGGER.debug("Semaphore released too many times; ignoring.")
+        self._notify_released()
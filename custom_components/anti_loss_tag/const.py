@@ -13,11 +13,25 @@ CONF_ALARM_ON_DISCONNECT = "alarm_on_disconnect"
 CONF_MAINTAIN_CONNECTION = "maintain_connection"
 CONF_AUTO_RECONNECT = "auto_reconnect"
 CONF_BATTERY_POLL_INTERVAL_MIN = "battery_poll_interval_min"
+CONF_RSSI_DEADBAND_DB = "rssi_deadband_db"
+CONF_RSSI_MIN_PUBLISH_INTERVAL_S = "rssi_min_publish_interval_s"
+CONF_RSSI_MAX_PUBLISH_INTERVAL_S = "rssi_max_publish_interval_s"
+CONF_RSSI_FILTER = "rssi_filter"
+CONF_ADVERT_AGGREGATION_WINDOW_MS = "advert_aggregation_window_ms"
+CONF_BUTTON_MULTI_PRESS_WINDOW_MS = "button_multi_press_window_ms"
+CONF_BUTTON_LONG_PRESS_MS = "button_long_press_ms"
 
 DEFAULT_ALARM_ON_DISCONNECT = False
 DEFAULT_MAINTAIN_CONNECTION = True
 DEFAULT_AUTO_RECONNECT = True
 DEFAULT_BATTERY_POLL_INTERVAL_MIN = 360  # 6 hours
+DEFAULT_RSSI_DEADBAND_DB = 4  # RSSI 抖动通常为 ±3–5 dBm
+DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S = 10
+DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S = 300
+DEFAULT_RSSI_FILTER = "ema"  # ema / kalman
+DEFAULT_ADVERT_AGGREGATION_WINDOW_MS = 0  # 0 = 关闭，每条广播完整处理
+DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS = 400  # 0 = 关闭双击/三击，single 立即发出
+DEFAULT_BUTTON_LONG_PRESS_MS = 1000  # 0 = 关闭长按（需固件上报松开）
 
 # ============================================================================
 # KT6368A 芯片专用协议定义
@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import asyncio
+import enum
+import functools
+import heapq
 import logging
 import random
 import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any, cast
 
 from bleak.backends.device import BLEDevice
@@ -32,27 +35,64 @@ from bleak_retry_connector import (
 from .const import (
     DOMAIN,
     CONF_ADDRESS,
+    CONF_ADVERT_AGGREGATION_WINDOW_MS,
     CONF_ALARM_ON_DISCONNECT,
     CONF_AUTO_RECONNECT,
     CONF_BATTERY_POLL_INTERVAL_MIN,
+    CONF_BUTTON_LONG_PRESS_MS,
+    CONF_BUTTON_MULTI_PRESS_WINDOW_MS,
     CONF_MAINTAIN_CONNECTION,
     CONF_NAME,
+    CONF_RSSI_DEADBAND_DB,
+    CONF_RSSI_FILTER,
+    CONF_RSSI_MAX_PUBLISH_INTERVAL_S,
+    CONF_RSSI_MIN_PUBLISH_INTERVAL_S,
+    DEFAULT_ADVERT_AGGREGATION_WINDOW_MS,
     DEFAULT_ALARM_ON_DISCONNECT,
     DEFAULT_AUTO_RECONNECT,
     DEFAULT_BATTERY_POLL_INTERVAL_MIN,
+    DEFAULT_BUTTON_LONG_PRESS_MS,
+    DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS,
     DEFAULT_MAINTAIN_CONNECTION,
+    DEFAULT_RSSI_DEADBAND_DB,
+    DEFAULT_RSSI_FILTER,
+    DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S,
+    DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S,
     UUID_ALERT_LEVEL_2A06,
     UUID_BATTERY_LEVEL_2A19,
     UUID_NOTIFY_FFE1,
     UUID_WRITE_FFE2,
 )
+from .circuit_breaker import CIRCUIT_CLOSED, DeviceCircuitBreaker
 from .connection_manager import BleConnectionManager
+from .gesture import ButtonGestureRecognizer
+from .retry_policy import RetryPolicy, RetrySession, get_retry_policy
+from .advertisement_router import AdvertisementRouter
+from .battery_model import BatteryDischargeModel
+from .battery_scheduler import BatteryPollScheduler
+from .rssi_filter import RssiFilter
+from .startup_planner import StartupPlanner
+from .presence_monitor import PresenceTimerWheel
+from .update_batcher import EntityUpdateBatcher
 from .utils.constants import (
+    ALARM_RING_TIMEOUT_SECONDS,
+    BATTERY_PARK_RESUME_MAX_SECONDS,
+    BATTERY_PARK_RESUME_MIN_SECONDS,
+    BATTERY_PIGGYBACK_MAX_AGE_SECONDS,
+    BATTERY_READ_CACHE_TTL_SECONDS,
+    BATTERY_POLL_ALARM_QUIET_SECONDS,
     BATTERY_POLL_JITTER_SECONDS,
+    CIRCUIT_BREAKER_COOLOFF_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
     MAX_CONNECT_BACKOFF_SECONDS,
     MAX_CONNECT_FAIL_COUNT,
     CONNECTION_SLOT_ACQUIRE_TIMEOUT,
-    ENTITY_UPDATE_DEBOUNCE_SECONDS,
+    PRESENCE_FALLBACK_TIMEOUT_SECONDS,
+    PRESENCE_MAX_TIMEOUT_SECONDS,
+    PRESENCE_MIN_SAMPLES,
+    PRESENCE_MIN_TIMEOUT_SECONDS,
+    PRESENCE_RECOMPUTE_EVERY,
+    PRESENCE_TIMEOUT_MULTIPLIER,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -61,21 +101,100 @@ _UUID_SERVICE_IMMEDIATE_ALERT_1802 = "00001802-0000-1000-8000-00805f9b34fb"
 _UUID_SERVICE_BATTERY_180F = "0000180f-0000-1000-8000-00805f9b34fb"
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonEvent:
     when: datetime
     raw: bytes
+    # "press"：每次按下立即触发；single/double/triple/long：手势识别结果
+    gesture: str = "press"
+
+
+class DeviceField(enum.IntFlag):
+    """实体可订阅的设备字段；每次发布按字段计算脏掩码，只通知受影响的实体。"""
+
+    RSSI = enum.auto()
+    BATTERY = enum.auto()
+    AVAILABLE = enum.auto()
+    CONNECTED = enum.auto()
+    POLICY = enum.auto()
+    ALARM = enum.auto()
+    ALL = RSSI | BATTERY | AVAILABLE | CONNECTED | POLICY | ALARM
+
+
+# 与 AntiLossTagDevice._field_snapshot() 的元素顺序一一对应
+_SNAPSHOT_FIELDS: tuple[DeviceField, ...] = (
+    DeviceField.RSSI,
+    DeviceField.BATTERY,
+    DeviceField.AVAILABLE,
+    DeviceField.CONNECTED,
+    DeviceField.POLICY,
+    DeviceField.ALARM,
+)
+_UNPUBLISHED = object()
+
+
+class ConnectionState(enum.StrEnum):
+    """连接状态机状态（StrEnum：对外仍表现为原有字符串）。"""
+
+    IDLE = "idle"
+    SCANNING = "scanning"
+    CONNECTING = "connecting"
+    DISCOVERING = "discovering"
+    READY = "ready"
+    DEGRADED = "degraded"
+    BACKOFF = "backoff"
+
+
+class ConnectionErrorClass(enum.StrEnum):
+    """连接失败分类（用于诊断和重试决策）。"""
+
+    SCANNER_UNAVAILABLE = "scanner_unavailable"
+    SLOT_TIMEOUT = "slot_timeout"
+    CONNECT_ERROR = "connect_error"
+    SERVICE_DISCOVERY_ERROR = "service_discovery_error"
+    NOTIFY_ERROR = "notify_error"
 
 
-@dataclass
+class AdaptiveMode(enum.StrEnum):
+    """电量轮询/连接超时的自适应模式。"""
+
+    NORMAL = "normal"
+    TIMEOUT_HIGH = "timeout_high"
+    QUEUE_BUSY = "queue_busy"
+    CONN_MGR_CONGESTED = "conn_mgr_congested"
+
+
+class BatteryUpdateMode(enum.StrEnum):
+    """电量更新方式：轮询 2A19，或连接期间由 2A19 通知推送。"""
+
+    POLL = "poll"
+    NOTIFY = "notify"
+
+
+@dataclass(slots=True)
 class DeviceOperation:
     """串行化设备操作任务。"""
 
     name: str
     action: Callable[[], Awaitable[Any]]
-    retries: int
-    retry_delay: float
+    policy: RetryPolicy
     future: asyncio.Future[Any]
+    preemptible: bool = False
+    preempt_count: int = 0
+    submitted_ts: float = 0.0
+
+
+class _OperationPreempted(Exception):
+    """后台操作被交互操作抢占（内部信号，不向调用方抛出）。"""
+
+
+# Actor 邮箱事件类型
+_EVT_OP = "op"
+_EVT_ADVERT = "advert"
+_EVT_UNAVAILABLE = "unavailable"
+_EVT_DISCONNECT = "disconnect"
+_EVT_TIMER = "timer"
+_EVT_CONNECT = "connect"
 
 
 class AntiLossTagDevice:
@@ -98,6 +217,124 @@ class AntiLossTagDevice:
     - 2A19: Battery Level特征（电量读取：0-100%）
     """
 
+    # 运行时状态全部放在 __slots__ 中（无实例 __dict__），千标签部署时内存可预测
+    __slots__ = (
+        "hass",
+        "entry",
+        "address",
+        "name",
+        "_available",
+        "_connected",
+        "_rssi",
+        "_rssi_published",
+        "_rssi_published_mono",
+        "_rssi_deadband",
+        "_rssi_min_publish_interval",
+        "_rssi_max_publish_interval",
+        "_rssi_filter",
+        "_last_seen_mono",
+        "_advert_window",
+        "_advert_window_handle",
+        "_agg_count",
+        "_agg_sum",
+        "_agg_min",
+        "_agg_max",
+        "_agg_best_source",
+        "_last_advert_aggregate",
+        "_adverts_received",
+        "_adverts_processed",
+        "_battery",
+        "_last_battery_read",
+        "_last_battery_read_mono",
+        "_battery_reads_total",
+        "_battery_piggyback_reads",
+        "_battery_model",
+        "_battery_mode",
+        "_battery_notifications",
+        "_battery_poll_parked",
+        "_battery_polls_parked",
+        "_last_button_event",
+        "_client",
+        "_advert_router",
+        "_cancel_bt_callback",
+        "_cancel_unavailable",
+        "_cached_chars",
+        "_listeners",
+        "_published_snapshot",
+        "_listener_calls",
+        "_listener_calls_skipped",
+        "_button_listeners",
+        "_gesture",
+        "_gesture_counts",
+        "_actor_task",
+        "_mailbox",
+        "_mailbox_waiter",
+        "_pending_ops",
+        "_op_seq",
+        "_connect_wanted",
+        "_advert_event_pending",
+        "_battery_timer",
+        "_battery_poll_after_ops",
+        "_battery_reads_pending",
+        "_battery_read_future",
+        "_battery_read_forced",
+        "_battery_cache_hits",
+        "_battery_cache_misses",
+        "_battery_read_joins",
+        "_stopping",
+        "_last_error",
+        "_conn_mgr",
+        "_battery_scheduler",
+        "_startup_planner",
+        "_startup_handle",
+        "_startup_connect_deferred",
+        "_startup_ready_reported",
+        "_update_batcher",
+        "_presence_wheel",
+        "_presence_timeout",
+        "_presence_wheel_timeout",
+        "_presence_interval_p95",
+        "_presence_adverts_until_recompute",
+        "_presence_timeouts",
+        "_last_loss_detection_latency",
+        "_conn_slot_acquired",
+        "_connect_fail_count",
+        "_cooldown_until_ts",
+        "_active_retry_session",
+        "_connect_retry_session",
+        "_alert_level_handle",
+        "_battery_level_handle",
+        "_unavailability_logged",
+        "_connection_error_classification",
+        "_connection_error_type",
+        "_connection_state",
+        "_circuit_breaker",
+        "_last_operation_error",
+        "_last_alarm_operation_ts",
+        "_alarm_active",
+        "_alarm_timeout_handle",
+        "_alarm_stop_skipped",
+        "_battery_defer_count",
+        "_last_battery_sleep_seconds",
+        "_last_battery_sleep_reason",
+        "_adaptive_mode",
+        "_adaptive_timeout_ratio",
+        "_inflight_op",
+        "_inflight_task",
+        "_inflight_priority",
+        "_inflight_started_ts",
+        "_preempt_shielded",
+        "_preempt_deferred_priority",
+        "_preempt_count",
+        "_preempt_wait_priority",
+        "_preempt_wait_ms_total",
+        "_last_preempt_wait_ms",
+    )
+
+    _op_priority_alarm = 10
+    _op_priority_policy = 20
+    _op_priority_battery = 50
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         self.hass = hass
         self.entry = entry
@@ -107,18 +344,60 @@ class AntiLossTagDevice:
 
         self._available: bool = False
         self._connected: bool = False
+        # 原始 RSSI 流（每条广播更新，供在线判断使用）
         self._rssi: int | None = None
-        self._last_seen: datetime | None = None
+        # 对外发布的 RSSI：超过死区且满足最小间隔，或最大间隔到期时才更新
+        self._rssi_published: int | None = None
+        self._rssi_published_mono: float = 0.0
+        self._rssi_deadband: float = float(DEFAULT_RSSI_DEADBAND_DB)
+        self._rssi_min_publish_interval: float = float(
+            DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S
+        )
+        self._rssi_max_publish_interval: float = float(
+            DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S
+        )
+        # 原始样本环形缓冲 + 平滑滤波（发布判断使用平滑值）
+        self._rssi_filter = RssiFilter(DEFAULT_RSSI_FILTER)
+        self._load_rssi_publish_options()
+        # 广播热路径只记录 monotonic 时间戳，last_seen 在读取时再换算为 datetime
+        self._last_seen_mono: float | None = None
+        # 广播聚合窗口（0 = 关闭）：窗口内只累计计数器，窗口结束时处理一次
+        self._advert_window: float = 0.0
+        self._advert_window_handle: asyncio.TimerHandle | None = None
+        self._agg_count: int = 0
+        self._agg_sum: int = 0
+        self._agg_min: int = 0
+        self._agg_max: int = 0
+        self._agg_best_source: str | None = None
+        self._last_advert_aggregate: dict[str, Any] | None = None
+        self._adverts_received: int = 0
+        self._adverts_processed: int = 0
+        self._load_advert_aggregation_option()
 
         self._battery: int | None = None
         self._last_battery_read: datetime | None = None
+        # 读数新鲜度按 monotonic 判断；借用其他连接顺带读取的次数单独统计
+        self._last_battery_read_mono: float | None = None
+        self._battery_reads_total: int = 0
+        self._battery_piggyback_reads: int = 0
+        # 读数历史拟合放电趋势，决定下一次轮询间隔
+        self._battery_model = BatteryDischargeModel()
+        # 固件支持 2A19 notify 时，维持连接期间改为通知推送，断开后自动回到轮询
+        self._battery_mode: BatteryUpdateMode = BatteryUpdateMode.POLL
+        self._battery_notifications: int = 0
+        # 标签不在范围内时到期的轮询挂起，收到下一条广播后再执行（不做徒劳的连接尝试）
+        self._battery_poll_parked: bool = False
+        self._battery_polls_parked: int = 0
 
         self._last_button_event: ButtonEvent | None = None
 
         self._client: BleakClientWithServiceCache | None = None
-        self._connect_lock = asyncio.Lock()
-        self._gatt_lock = asyncio.Lock()
 
+        # ====== 集成级广播路由（全集成一个 FFE0 回调，按地址分发） ======
+        self._advert_router: AdvertisementRouter | None = cast(
+            AdvertisementRouter | None,
+            self.hass.data.get(DOMAIN, {}).get("_advert_router"),
+        )
         self._cancel_bt_callback: Callable[[], None] | None = None
         self._cancel_unavailable: Callable[[], None] | None = None
 
@@ -126,23 +405,42 @@ class AntiLossTagDevice:
         # 缓存BleakGATTCharacteristic对象，避免重复UUID查找
         self._cached_chars: dict[str, BleakGATTCharacteristic] = {}
 
-        self._listeners: set[Callable[[], None]] = set()
-        self._button_listeners: set[Callable[[ButtonEvent], None]] = set()
-
-        self._connect_task: asyncio.Task | None = None
-        self._battery_task: asyncio.Task | None = None
-        self._op_worker_task: asyncio.Task | None = None
-        self._op_queue: asyncio.PriorityQueue[tuple[int, int, DeviceOperation]] = (
-            asyncio.PriorityQueue()
+        # 监听器 -> 订阅字段（None 表示任何发布都通知）
+        self._listeners: dict[Callable[[], None], DeviceField | None] = {}
+        self._published_snapshot: tuple[Any, ...] = (_UNPUBLISHED,) * len(
+            _SNAPSHOT_FIELDS
         )
+        self._listener_calls: int = 0
+        self._listener_calls_skipped: int = 0
+        self._button_listeners: list[Callable[[ButtonEvent], None]] = []
+        # 按键手势状态机在首次按下时惰性创建
+        self._gesture: ButtonGestureRecognizer | None = None
+        self._gesture_counts: dict[str, int] | None = None
+
+        # ====== 单设备 actor：一个协程消费邮箱事件，串行执行连接/GATT/轮询 ======
+        # 由 actor 独占连接与 GATT 访问，因此不再需要连接锁、GATT 锁和读电量锁
+        self._actor_task: asyncio.Task | None = None
+        # 邮箱为普通列表 + actor 空闲时才创建的唤醒 future（不再为每个标签常驻 asyncio.Queue）
+        self._mailbox: list[tuple[str, Any]] = []
+        self._mailbox_waiter: asyncio.Future[None] | None = None
+        self._pending_ops: list[tuple[int, int, DeviceOperation]] = []
         self._op_seq: int = 0
-        self._battery_read_lock = asyncio.Lock()
+        self._connect_wanted: bool = False
+        self._advert_event_pending: bool = False
+        self._battery_timer: asyncio.TimerHandle | None = None
+        # 前台操作排空后再排程电量轮询（替代固定 15 秒重试）
+        self._battery_poll_after_ops: bool = False
+        self._battery_reads_pending: int = 0
+        # 单飞读取：在途的读电量操作由并发调用方共享；新鲜读数直接命中缓存
+        self._battery_read_future: asyncio.Future[Any] | None = None
+        self._battery_read_forced: bool = False
+        self._battery_cache_hits: int = 0
+        self._battery_cache_misses: int = 0
+        self._battery_read_joins: int = 0
+        self._stopping: bool = False
 
         self._last_error: str | None = None
 
-        # ====== 实体更新防抖动（避免频繁更新） ======
-        self._last_update_time: float = 0.0
-
         # ====== 多设备并发连接控制（全局连接槽位 + 退避） ======
         try:
             self._conn_mgr: BleConnectionManager | None = cast(
@@ -153,10 +451,49 @@ class AntiLossTagDevice:
             _LOGGER.debug("Connection manager not available: %s", err)
             self._conn_mgr = None
 
+        # ====== 集成级电量轮询调度（全局最小堆 + 预算；缺省时退回设备自身定时器） ======
+        self._battery_scheduler: BatteryPollScheduler | None = cast(
+            BatteryPollScheduler | None,
+            self.hass.data.get(DOMAIN, {}).get("_battery_scheduler"),
+        )
+
+        # ====== 集成级启动错峰（首次连接/读取排在领取的启动时隙） ======
+        self._startup_planner: StartupPlanner | None = cast(
+            StartupPlanner | None,
+            self.hass.data.get(DOMAIN, {}).get("_startup_planner"),
+        )
+        self._startup_handle: asyncio.TimerHandle | None = None
+        self._startup_connect_deferred: bool = False
+        self._startup_ready_reported: bool = False
+
+        # ====== 集成级实体更新批处理（跨设备合并同一 tick 内的分发） ======
+        self._update_batcher: EntityUpdateBatcher | None = cast(
+            EntityUpdateBatcher | None,
+            self.hass.data.get(DOMAIN, {}).get("_update_batcher"),
+        )
+
+        # ====== 自适应离线检测：k × p95(实测广播间隔)，由全局时间轮跟踪 ======
+        self._presence_wheel: PresenceTimerWheel | None = cast(
+            PresenceTimerWheel | None,
+            self.hass.data.get(DOMAIN, {}).get("_presence_wheel"),
+        )
+        self._presence_timeout: float | None = None
+        # 时间轮实际使用的超时：自适应值不可用时退回兜底超时
+        self._presence_wheel_timeout: float = PRESENCE_FALLBACK_TIMEOUT_SECONDS
+        self._presence_interval_p95: float | None = None
+        self._presence_adverts_until_recompute: int = PRESENCE_MIN_SAMPLES
+        self._presence_timeouts: int = 0
+        self._last_loss_detection_latency: float | None = None
+
         self._conn_slot_acquired: bool = False
         self._connect_fail_count: int = 0
         self._cooldown_until_ts: float = 0.0
 
+        # 重试会话：操作执行期间连接层退避与操作重试共享同一预算；
+        # 无操作时（保持连接的后台重连）使用独立会话，连接成功后重置
+        self._active_retry_session: RetrySession | None = None
+        self._connect_retry_session: RetrySession | None = None
+
         # 用于解决"同 UUID 多特征"的歧义：优先解析并缓存 handle
         self._alert_level_handle: int | None = None
         self._battery_level_handle: int | None = None
@@ -165,23 +502,43 @@ class AntiLossTagDevice:
         self._unavailability_logged: bool = False
 
         # 连接失败分类（用于诊断和重试决策）
-        self._connection_error_classification: str | None = None
+        self._connection_error_classification: ConnectionErrorClass | None = None
         self._connection_error_type: str | None = None
-        self._last_connect_attempt: datetime | None = None
-        self._connection_state: str = "idle"
+        self._connection_state: ConnectionState = ConnectionState.IDLE
+
+        # 慢性失败标签的断路器：连续连接失败后快速失败，避免占用健康标签的槽位
+        self._circuit_breaker = DeviceCircuitBreaker(
+            failure_threshold=CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+            cooloff_seconds=CIRCUIT_BREAKER_COOLOFF_SECONDS,
+        )
 
         self._last_operation_error: str | None = None
 
-        self._op_priority_alarm = 10
-        self._op_priority_policy = 20
-        self._op_priority_battery = 50
         self._last_alarm_operation_ts: float = 0.0
+
+        # ====== 报警响铃状态：True 响铃中 / False 静默 / None 未知 ======
+        # 启动时未知；开始报警成功置 True，停止成功、断开或超时后清除
+        self._alarm_active: bool | None = None
+        self._alarm_timeout_handle: asyncio.TimerHandle | None = None
+        self._alarm_stop_skipped: int = 0
         self._battery_defer_count: int = 0
         self._last_battery_sleep_seconds: float = 0.0
         self._last_battery_sleep_reason: str = "init"
-        self._adaptive_mode: str = "normal"
+        self._adaptive_mode: AdaptiveMode = AdaptiveMode.NORMAL
         self._adaptive_timeout_ratio: float = 0.0
 
+        # ====== 后台操作抢占（交互操作优先） ======
+        self._inflight_op: DeviceOperation | None = None
+        self._inflight_task: asyncio.Task | None = None
+        self._inflight_priority: int = 0
+        self._inflight_started_ts: float = 0.0
+        self._preempt_shielded: bool = False
+        self._preempt_deferred_priority: int | None = None
+        self._preempt_count: int = 0
+        self._preempt_wait_priority: int | None = None
+        self._preempt_wait_ms_total: float = 0.0
+        self._last_preempt_wait_ms: float = 0.0
+
     # -------------------------
     # Public read-only state
     # -------------------------
@@ -195,11 +552,62 @@ class AntiLossTagDevice:
 
     @property
     def rssi(self) -> int | None:
+        """Return the published (dead-banded) RSSI."""
+        return self._rssi_published
+
+    @property
+    def rssi_raw(self) -> int | None:
+        """Return the latest raw RSSI sample."""
         return self._rssi
 
+    @property
+    def rssi_smoothed(self) -> float | None:
+        """Return the filtered RSSI estimate."""
+        return self._rssi_filter.smoothed
+
+    @property
+    def rssi_variance(self) -> float | None:
+        """Return the variance of buffered RSSI samples."""
+        return self._rssi_filter.variance
+
+    @property
+    def rssi_sample_rate(self) -> float | None:
+        """Return the advertisement sample rate in Hz."""
+        return self._rssi_filter.sample_rate
+
+    @property
+    def adverts_received(self) -> int:
+        """Return number of advertisements received."""
+        return self._adverts_received
+
+    @property
+    def adverts_processed(self) -> int:
+        """Return number of advertisements (or aggregates) fully processed."""
+        return self._adverts_processed
+
+    @property
+    def advert_aggregation_window(self) -> float:
+        """Return the aggregation window in seconds (0 = disabled)."""
+        return self._advert_window
+
+    @property
+    def button_gesture_counts(self) -> dict[str, int]:
+        """Return how often each button gesture fired."""
+        return dict(self._gesture_counts or {})
+
+    @property
+    def last_advert_aggregate(self) -> dict[str, Any] | None:
+        """Return statistics of the most recent aggregation window."""
+        return self._last_advert_aggregate
+
     @property
     def last_seen(self) -> datetime | None:
-        return self._last_seen
+        seen_mono = self._last_seen_mono
+        if seen_mono is None:
+            return None
+        return datetime.now(timezone.utc) - timedelta(
+            seconds=time.monotonic() - seen_mono
+        )
 
     @property
     def battery(self) -> int | None:
@@ -218,11 +626,11 @@ class AntiLossTagDevice:
         return self._last_error
 
     @property
-    def connection_state(self) -> str:
+    def connection_state(self) -> ConnectionState:
         return self._connection_state
 
     @property
-    def connection_error_classification(self) -> str | None:
+    def connection_error_classification(self) -> ConnectionErrorClass | None:
         return self._connection_error_classification
 
     @property
@@ -231,11 +639,55 @@ class AntiLossTagDevice:
 
     @property
     def operation_queue_size(self) -> int:
-        return self._op_queue.qsize()
+        return len(self._pending_ops)
 
     @property
     def operation_worker_running(self) -> bool:
-        return self._op_worker_task is not None and not self._op_worker_task.done()
+        return self._actor_task is not None and not self._actor_task.done()
+
+    @property
+    def mailbox_size(self) -> int:
+        return len(self._mailbox)
+
+    @property
+    def battery_timer_armed(self) -> bool:
+        if self._battery_scheduler is not None:
+            return self._battery_scheduler.is_scheduled(self.address)
+        return self._battery_timer is not None
+
+    @property
+    def alarm_active(self) -> bool | None:
+        return self._alarm_active
+
+    @property
+    def alarm_stop_skipped(self) -> int:
+        return self._alarm_stop_skipped
+
+    @property
+    def presence_timeout(self) -> float | None:
+        """Return the adaptive unavailability timeout (None = fallback timeout)."""
+        return self._presence_timeout
+
+    @property
+    def presence_interval_p95(self) -> float | None:
+        return self._presence_interval_p95
+
+    @property
+    def presence_timeouts(self) -> int:
+        return self._presence_timeouts
+
+    @property
+    def last_loss_detection_latency(self) -> float | None:
+        """Return seconds from last advertisement to declared unavailable."""
+        return self._last_loss_detection_latency
+
+    @property
+    def listener_calls(self) -> int:
+        return self._listener_calls
+
+    @property
+    def listener_calls_skipped(self) -> int:
+        return self._listener_calls_skipped
 
     @property
     def last_operation_error(self) -> str | None:
@@ -253,12 +705,72 @@ class AntiLossTagDevice:
     def last_battery_sleep_reason(self) -> str:
         return self._last_battery_sleep_reason
 
+    @property
+    def battery_reads_total(self) -> int:
+        return self._battery_reads_total
+
+    @property
+    def battery_piggyback_reads(self) -> int:
+        return self._battery_piggyback_reads
+
+    @property
+    def battery_cache_hits(self) -> int:
+        return self._battery_cache_hits
+
+    @property
+    def battery_cache_misses(self) -> int:
+        return self._battery_cache_misses
+
+    @property
+    def battery_read_joins(self) -> int:
+        return self._battery_read_joins
+
+    @property
+    def battery_update_mode(self) -> str:
+        return self._battery_mode
+
+    @property
+    def battery_notifications(self) -> int:
+        return self._battery_notifications
+
+    @property
+    def battery_poll_parked(self) -> bool:
+        return self._battery_poll_parked
+
+    @property
+    def battery_polls_parked(self) -> int:
+        return self._battery_polls_parked
+
+    @property
+    def battery_drain_per_hour(self) -> float | None:
+        return self._battery_model.drain_per_hour
+
+    @property
+    def battery_model_samples(self) -> int:
+        return self._battery_model.sample_count
+
     @property
     def battery_read_busy(self) -> bool:
-        return self._battery_read_lock.locked()
+        return self._battery_reads_pending > 0
 
     @property
-    def adaptive_mode(self) -> str:
+    def circuit_breaker(self) -> DeviceCircuitBreaker:
+        return self._circuit_breaker
+
+    @property
+    def preempt_count(self) -> int:
+        return self._preempt_count
+
+    @property
+    def preempt_wait_ms_total(self) -> float:
+        return self._preempt_wait_ms_total
+
+    @property
+    def last_preempt_wait_ms(self) -> float:
+        return self._last_preempt_wait_ms
+
+    @property
+    def adaptive_mode(self) -> AdaptiveMode:
         return self._adaptive_mode
 
     @property
@@ -295,12 +807,60 @@ class AntiLossTagDevice:
             CONF_BATTERY_POLL_INTERVAL_MIN, DEFAULT_BATTERY_POLL_INTERVAL_MIN
         )
 
+    def _load_rssi_publish_options(self) -> None:
+        # 广播热路径不读 options：选项变化时缓存到属性
+        self._rssi_deadband = float(
+            self._opt_int(CONF_RSSI_DEADBAND_DB, DEFAULT_RSSI_DEADBAND_DB)
+        )
+        self._rssi_min_publish_interval = float(
+            self._opt_int(
+                CONF_RSSI_MIN_PUBLISH_INTERVAL_S, DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S
+            )
+        )
+        self._rssi_max_publish_interval = float(
+            self._opt_int(
+                CONF_RSSI_MAX_PUBLISH_INTERVAL_S, DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S
+            )
+        )
+        mode = str(self.entry.options.get(CONF_RSSI_FILTER, DEFAULT_RSSI_FILTER))
+        if mode != self._rssi_filter.mode:
+            self._rssi_filter = RssiFilter(mode)
+
+    def _load_advert_aggregation_option(self) -> None:
+        self._advert_window = (
+            self._opt_int(
+                CONF_ADVERT_AGGREGATION_WINDOW_MS, DEFAULT_ADVERT_AGGREGATION_WINDOW_MS
+            )
+            / 1000.0
+        )
+        if self._advert_window <= 0 and self._advert_window_handle is not None:
+            # 关闭聚合时立即处理窗口内已累计的广播
+            self._advert_window_handle.cancel()
+            self._async_flush_advert_window()
+
+    def _gesture_windows(self) -> tuple[float, float]:
+        """Return (multi-press window, long-press threshold) in seconds."""
+        return (
+            self._opt_int(
+                CONF_BUTTON_MULTI_PRESS_WINDOW_MS, DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS
+            )
+            / 1000.0,
+            self._opt_int(CONF_BUTTON_LONG_PRESS_MS, DEFAULT_BUTTON_LONG_PRESS_MS)
+            / 1000.0,
+        )
+
     # -------------------------
     # Lifecycle
     # -------------------------
     def async_start(self) -> None:
         """Start Bluetooth subscriptions and background tasks."""
-        if self._cancel_bt_callback is None:
+        if self._advert_router is not None:
+            # 离线由时间轮判定（自适应超时或兜底超时），无需逐设备注册 HA 跟踪器
+            if self._cancel_bt_callback is None:
+                self._cancel_bt_callback = self._advert_router.async_attach(
+                    self.address, self._async_on_bluetooth_event
+                )
+        elif self._cancel_bt_callback is None:
             self._cancel_bt_callback = bluetooth.async_register_callback(
                 self.hass,
                 self._async_on_bluetooth_event,
@@ -308,7 +868,7 @@ class AntiLossTagDevice:
                 bluetooth.BluetoothScanningMode.ACTIVE,
             )
 
-        if self._cancel_unavailable is None:
+        if self._advert_router is None and self._cancel_unavailable is None:
             self._cancel_unavailable = bluetooth.async_track_unavailable(
                 self.hass,
                 self._async_on_unavailable,
@@ -316,8 +876,78 @@ class AntiLossTagDevice:
                 connectable=True,
             )
 
-        self._ensure_battery_task()
-        self._ensure_operation_worker()
+        self._stopping = False
+        self._ensure_actor()
+        startup_delay: float | None = None
+        if self._startup_planner is not None:
+            # 领取启动时隙：时隙到达前后台连接请求只记录不执行
+            startup_delay = self._startup_planner.async_reserve(self.address)
+            self._startup_ready_reported = False
+            self._startup_handle = self.hass.loop.call_later(
+                startup_delay, self._async_on_startup_slot
+            )
+        # 启动后尽快读取一次，避免首次电量长时间 unknown；已恢复读数时按上次读取时间排程
+        self._schedule_battery_poll(*self._initial_battery_poll(startup_delay))
+
+    def _initial_battery_poll(
+        self, startup_delay: float | None = None
+    ) -> tuple[float, str]:
+        """Return (delay, reason) for the first poll after start."""
+        delay = random.uniform(0.5, 3.0) if startup_delay is None else startup_delay
+        if self._last_battery_read_mono is None:
+            return (delay, "startup")
+        interval, _ = self._compute_next_battery_sleep_seconds(force_connect=False)
+        remaining = interval - (time.monotonic() - self._last_battery_read_mono)
+        if remaining <= delay:
+            return (delay, "startup")
+        return (remaining, "restored")
+
+    @callback
+    def async_restore_battery(self, level: int, read_at: datetime | None) -> None:
+        """Seed battery state from the restored sensor state (before any read)."""
+        if self._battery is not None or self._battery_reads_total:
+            return
+        level = max(0, min(100, int(level)))
+        self._battery = level
+        if read_at is None:
+            # 旧版本未保存读取时间：保留电量显示，首次轮询照常进行
+            return
+        if read_at.tzinfo is None:
+            read_at = read_at.replace(tzinfo=timezone.utc)
+        age = (datetime.now(timezone.utc) - read_at).total_seconds()
+        if age < 0:
+            age = 0.0
+        self._last_battery_read = read_at
+        self._last_battery_read_mono = time.monotonic() - age
+        self._battery_model.add(read_at.timestamp(), level)
+        if self._last_battery_sleep_reason == "startup" and self.battery_timer_armed:
+            # 设备已先于实体启动：按恢复的读取时间重新排程（过期时保留原启动时隙）
+            delay, reason = self._initial_battery_poll(self._last_battery_sleep_seconds)
+            if reason == "restored":
+                self._schedule_battery_poll(delay, reason)
+
+    @callback
+    def _async_on_startup_slot(self) -> None:
+        """Startup slot reached: release background connects deferred so far."""
+        self._startup_handle = None
+        if self._startup_connect_deferred:
+            self._startup_connect_deferred = False
+            self._request_connect()
+        self._check_startup_ready()
+
+    def _check_startup_ready(self, settled: bool = False) -> None:
+        """Report ready once startup work is done (or settled as unreachable)."""
+        planner = self._startup_planner
+        if planner is None or self._startup_ready_reported:
+            return
+        if self._startup_handle is not None:
+            return
+        if not settled and (
+            self._battery is None or (self.maintain_connection and not self._connected)
+        ):
+            return
+        self._startup_ready_reported = True
+        planner.async_mark_ready(self.address)
 
     def async_stop(self) -> None:
         """Stop tasks, callbacks and disconnect."""
@@ -329,42 +959,69 @@ class AntiLossTagDevice:
             self._cancel_unavailable()
             self._cancel_unavailable = None
 
-        if self._battery_task is not None:
-            self._battery_task.cancel()
-            self._battery_task = None
-
-        if self._connect_task is not None:
-            self._connect_task.cancel()
-            self._connect_task = None
-
-        if self._op_worker_task is not None:
-            self._op_worker_task.cancel()
-            self._op_worker_task = None
+        self._stopping = True
+        self._cancel_battery_timer()
+        self._cancel_alarm_timeout()
+        if self._startup_handle is not None:
+            self._startup_handle.cancel()
+            self._startup_handle = None
+        self._startup_connect_deferred = False
+        if self._startup_planner is not None:
+            self._startup_planner.async_forget(self.address)
+        if self._gesture is not None:
+            self._gesture.cancel()
+        if self._update_batcher is not None:
+            self._update_batcher.async_discard(self._async_flush_update)
+        if self._presence_wheel is not None:
+            self._presence_wheel.async_cancel(self.address)
+        if self._advert_window_handle is not None:
+            self._advert_window_handle.cancel()
+            self._advert_window_handle = None
+        self._agg_count = 0
+
+        actor = self._actor_task
+        self._actor_task = None
+        if actor is not None:
+            actor.cancel()
 
         self._clear_operation_queue()
 
-        self.hass.async_create_task(self.async_disconnect())
+        # 等 actor 真正退出（进行中的连接/GATT 已清理）后再断开，避免与其竞争
+        self.hass.async_create_task(self._async_shutdown(actor))
+
+    async def _async_shutdown(self, actor: asyncio.Task | None) -> None:
+        if actor is not None:
+            await asyncio.wait((actor,))
+        await self._async_disconnect_impl()
 
     async def async_apply_entry_options(self) -> None:
         """Apply updated options (called from update listener)."""
+        self._load_rssi_publish_options()
+        self._load_advert_aggregation_option()
+        if self._gesture is not None:
+            multi_press_window, long_press = self._gesture_windows()
+            self._gesture.configure(
+                multi_press_window=multi_press_window, long_press=long_press
+            )
+        # 断开报警策略开关跟随选项刷新
+        self._async_dispatch_update()
+
         # If maintain_connection toggled on, attempt to connect when available
         if self.maintain_connection:
-            self._ensure_connect_task()
+            self._request_connect()
         else:
             # If user disables maintain_connection, we can disconnect to free slots
             await self.async_disconnect()
 
         # Always re-sync policy when we are connected (or will be shortly)
-        if self.maintain_connection:
-            self._ensure_connect_task()
-        else:
+        if not self.maintain_connection:
             # If not maintaining, best-effort short connect to sync policy
             await self.async_set_disconnect_alarm_policy(
                 self.alarm_on_disconnect, force_connect=True
             )
 
-        # Battery task interval changed, restart loop task
-        self._ensure_battery_task(restart=True)
+        # Battery interval changed, re-arm the poll timer
+        self._schedule_battery_poll(random.uniform(0.5, 3.0), "options_changed")
 
     async def async_maybe_connect_initial(self) -> None:
         """Initial connect attempt after setup."""
@@ -372,18 +1029,23 @@ class AntiLossTagDevice:
             return
         # If device is already present, connect; else wait for advertisements
         if bluetooth.async_address_present(self.hass, self.address, connectable=True):
-            self._ensure_connect_task()
+            self._request_connect()
 
     # -------------------------
     # Listener registration
     # -------------------------
     @callback
-    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
-        self._listeners.add(listener)
+    def async_add_listener(
+        self,
+        listener: Callable[[], None],
+        fields: DeviceField | None = None,
+    ) -> Callable[[], None]:
+        """Register a listener, optionally only for changes of specific fields."""
+        self._listeners[listener] = fields
 
         @callback
         def _remove() -> None:
-            self._listeners.discard(listener)
+            self._listeners.pop(listener, None)
 
         return _remove
 
@@ -391,29 +1053,55 @@ class AntiLossTagDevice:
     def async_add_button_listener(
         self, listener: Callable[[ButtonEvent], None]
     ) -> Callable[[], None]:
-        self._button_listeners.add(listener)
+        if listener not in self._button_listeners:
+            self._button_listeners.append(listener)
 
         @callback
         def _remove() -> None:
-            self._button_listeners.discard(listener)
+            if listener in self._button_listeners:
+                self._button_listeners.remove(listener)
 
         return _remove
 
     @callback
     def _async_dispatch_update(self) -> None:
-        """Dispatch update to all listeners with debouncing."""
-        # ====== 防抖动（避免频繁更新） ======
-        now = time.time()
-        if now - self._last_update_time < ENTITY_UPDATE_DEBOUNCE_SECONDS:
-            _LOGGER.debug(
-                "Update debounced (last %.2fs ago)", now - self._last_update_time
-            )
+        """Mark the device dirty; the integration-level batcher coalesces flushes."""
+        # 每次变化都标记，节流与合并统一由批处理器负责（窗口内的更新不会丢弃）
+        if self._update_batcher is None:
+            # 未接入批处理器（单独构造设备时）：直接发布
+            self._async_flush_update()
             return
-        self._last_update_time = now
-        # ====== 结束 ======
+        self._update_batcher.async_mark_dirty(self._async_flush_update)
 
-        for listener in list(self._listeners):
-            listener()
+    @callback
+    def _async_flush_update(self) -> None:
+        # ====== 字段级变更检测：只通知订阅了已变化字段的监听器 ======
+        snapshot = self._field_snapshot()
+        dirty = DeviceField(0)
+        for field, new, old in zip(
+            _SNAPSHOT_FIELDS, snapshot, self._published_snapshot
+        ):
+            if new != old:
+                dirty |= field
+        self._published_snapshot = snapshot
+
+        for listener, fields in list(self._listeners.items()):
+            if fields is None or fields & dirty:
+                self._listener_calls += 1
+                listener()
+            else:
+                self._listener_calls_skipped += 1
+
+    def _field_snapshot(self) -> tuple[Any, ...]:
+        return (
+            self._rssi_published,
+            # 读取时间一并比较：读到相同电量也要刷新持久化的 last_read
+            (self._battery, self._last_battery_read),
+            self._available,
+            self._connected,
+            self.alarm_on_disconnect,
+            self._alarm_active,
+        )
 
     @callback
     def _async_dispatch_button(self, event: ButtonEvent) -> None:
@@ -446,15 +1134,158 @@ class AntiLossTagDevice:
         service_info: bluetooth.BluetoothServiceInfoBleak,
         change: bluetooth.BluetoothChange,
     ) -> None:
-        """Handle advertisement updates."""
-        self._update_availability(True)
-        self._rssi = service_info.rssi
-        self._last_seen = datetime.now(timezone.utc)
+        """Handle advertisement updates (hot path: no allocations, no tasks)."""
+        now = time.monotonic()
+        self._last_seen_mono = now
+        self._adverts_received += 1
+        rssi = service_info.rssi
+        if self._advert_window > 0:
+            # 密集部署：同一标签经多个代理每秒上报多次，窗口内只更新计数器
+            count = self._agg_count
+            if count == 0:
+                self._agg_sum = self._agg_min = self._agg_max = rssi
+                self._agg_best_source = getattr(service_info, "source", None)
+                self._advert_window_handle = self.hass.loop.call_later(
+                    self._advert_window, self._async_flush_advert_window
+                )
+            else:
+                self._agg_sum += rssi
+                if rssi > self._agg_max:
+                    self._agg_max = rssi
+                    self._agg_best_source = getattr(service_info, "source", None)
+                elif rssi < self._agg_min:
+                    self._agg_min = rssi
+            self._agg_count = count + 1
+            return
+        self._process_advertisement(now, rssi)
+
+    @callback
+    def _async_flush_advert_window(self) -> None:
+        """Process the advertisements accumulated in one aggregation window."""
+        self._advert_window_handle = None
+        count = self._agg_count
+        if count == 0 or self._last_seen_mono is None:
+            return
+        self._agg_count = 0
+        mean = self._agg_sum / count
+        self._last_advert_aggregate = {
+            "count": count,
+            "rssi_min": self._agg_min,
+            "rssi_max": self._agg_max,
+            "rssi_mean": round(mean, 1),
+            "best_source": self._agg_best_source,
+        }
+        self._process_advertisement(self._last_seen_mono, round(mean))
+
+    def _process_advertisement(self, now: float, rssi: int) -> None:
+        self._adverts_processed += 1
+        self._rssi = rssi
+        self._circuit_breaker.record_advertisement()
+
+        # 只有可用性翻转或平滑后的 RSSI 达到发布条件时才分发
+        publish = self._maybe_publish_rssi(self._rssi_filter.add(now, rssi), now)
+        if not self._available:
+            self._update_availability(True)
+            publish = True
+        if publish:
+            self._async_dispatch_update()
+
+        if self._battery_poll_parked:
+            # 标签重新可见：挂起的轮询稍后执行（随机错开同时出现的标签）
+            self._schedule_battery_poll(
+                random.uniform(
+                    BATTERY_PARK_RESUME_MIN_SECONDS, BATTERY_PARK_RESUME_MAX_SECONDS
+                ),
+                "tag_visible",
+            )
 
+        self._presence_adverts_until_recompute -= 1
+        if self._presence_adverts_until_recompute <= 0:
+            self._recompute_presence_timeout()
+        if self._presence_wheel is not None:
+            self._presence_wheel.async_touch(
+                self.address,
+                now + self._presence_wheel_timeout,
+                self._async_on_presence_timeout,
+            )
+
+        # 仅在 actor 需要响应（需要重连）时投递事件，且不重复堆积
+        if (
+            not self._connected
+            and not self._advert_event_pending
+            and self.maintain_connection
+        ):
+            self._advert_event_pending = True
+            self._post(_EVT_ADVERT)
+
+    def _recompute_presence_timeout(self) -> None:
+        self._presence_adverts_until_recompute = PRESENCE_RECOMPUTE_EVERY
+        rssi_filter = self._rssi_filter
+        if rssi_filter.sample_count < PRESENCE_MIN_SAMPLES:
+            return
+        p95 = rssi_filter.interval_percentile(0.95)
+        if p95 is None:
+            return
+        self._presence_interval_p95 = p95
+        timeout = PRESENCE_TIMEOUT_MULTIPLIER * p95
+        if timeout > PRESENCE_MAX_TIMEOUT_SECONDS:
+            # 广播间隔过长或不稳定：不做自适应判定，使用兜底超时
+            self._presence_timeout = None
+            self._presence_wheel_timeout = PRESENCE_FALLBACK_TIMEOUT_SECONDS
+            return
+        self._presence_timeout = max(PRESENCE_MIN_TIMEOUT_SECONDS, timeout)
+        self._presence_wheel_timeout = self._presence_timeout
+
+    @callback
+    def _async_on_presence_timeout(self) -> None:
+        """Declare the tag gone after k × p95 of its own advertisement interval."""
+        if not self._available:
+            return
+        if self._connected:
+            # 已建立 GATT 连接时标签可能停止广播，连接本身即可证明在场；
+            # 时间轮已移除该设备，重新登记，断开后仍能按超时判定离开
+            self._rearm_presence_wheel()
+            return
+        self._presence_timeouts += 1
+        if self._last_seen_mono is not None:
+            self._last_loss_detection_latency = time.monotonic() - self._last_seen_mono
+        _LOGGER.debug(
+            "设备 %s 超过 %.1fs 未收到广播，判定离开",
+            self.address,
+            self._presence_wheel_timeout,
+        )
+        self._update_availability(False)
         self._async_dispatch_update()
+        self._post(_EVT_UNAVAILABLE)
+
+    def _rearm_presence_wheel(self) -> None:
+        """Start a fresh presence deadline from now (connect/disconnect paths)."""
+        if self._presence_wheel is None or self._stopping or not self._available:
+            return
+        self._presence_wheel.async_touch(
+            self.address,
+            time.monotonic() + self._presence_wheel_timeout,
+            self._async_on_presence_timeout,
+        )
 
-        if self.maintain_connection and not self._connected:
-            self._ensure_connect_task()
+    def _maybe_publish_rssi(self, value: float | None, now: float) -> bool:
+        """Apply dead-band / min / max interval; return True if published."""
+        if value is None:
+            return False
+        published = self._rssi_published
+        elapsed = now - self._rssi_published_mono
+        if (
+            published is None
+            or elapsed >= self._rssi_max_publish_interval
+            or (
+                abs(value - published) >= self._rssi_deadband
+                and elapsed >= self._rssi_min_publish_interval
+            )
+        ):
+            self._rssi_published = round(value)
+            self._rssi_published_mono = now
+            return True
+        return False
 
     @callback
     def _async_on_unavailable(self, info: bluetooth.BluetoothServiceInfoBleak) -> None:
@@ -463,68 +1294,237 @@ class AntiLossTagDevice:
         self._async_dispatch_update()
 
         # If we lose advertisements, the connection likely isn't valid anymore
-        if self._connected and self.auto_reconnect:
-            self._ensure_connect_task()
+        self._post(_EVT_UNAVAILABLE)
 
     # -------------------------
-    # Connection management
+    # Actor
     # -------------------------
-    def _ensure_connect_task(self) -> None:
-        if self._connect_task is not None and not self._connect_task.done():
+    def _ensure_actor(self) -> None:
+        if self._actor_task is not None and not self._actor_task.done():
             return
-        self._connect_task = self.hass.async_create_task(self.async_ensure_connected())
+        self._actor_task = self.hass.async_create_task(self._async_actor())
 
-    def _ensure_battery_task(self, restart: bool = False) -> None:
-        if restart and self._battery_task is not None:
-            self._battery_task.cancel()
-            self._battery_task = None
-        if self._battery_task is None or self._battery_task.done():
-            self._battery_task = self.hass.async_create_task(self._async_battery_loop())
+    @callback
+    def _post(self, kind: str, payload: Any = None) -> None:
+        """向 actor 邮箱投递事件（可在任意回调中同步调用）。"""
+        if self._stopping:
+            return
+        self._ensure_actor()
+        self._mailbox.append((kind, payload))
+        waiter = self._mailbox_waiter
+        if waiter is not None:
+            self._mailbox_waiter = None
+            if not waiter.done():
+                waiter.set_result(None)
 
-    def _ensure_operation_worker(self) -> None:
-        if self._op_worker_task is not None and not self._op_worker_task.done():
+    @callback
+    def _request_connect(self) -> None:
+        """请求 actor 在空闲时建立连接（替代独立的连接任务）。"""
+        if self._connect_wanted or self._stopping:
             return
-        self._op_worker_task = self.hass.async_create_task(
-            self._async_operation_worker()
-        )
+        self._connect_wanted = True
+        self._post(_EVT_CONNECT)
 
-    def _clear_operation_queue(self) -> None:
+    async def _async_actor(self) -> None:
+        """单设备 actor：消费邮箱事件，拥有全部状态迁移并串行执行工作。
+
+        优先级：操作队列（按优先级） > 待处理的连接请求。
+        """
         while True:
-            try:
-                _, _, op = self._op_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+            if not self._pending_ops and not self._connect_wanted and not self._mailbox:
+                waiter = self._mailbox_waiter = self.hass.loop.create_future()
+                await waiter
+            if self._mailbox:
+                events, self._mailbox = self._mailbox, []
+                for kind, payload in events:
+                    self._handle_event(kind, payload)
+
+            if self._pending_ops:
+                priority, seq, op = heapq.heappop(self._pending_ops)
+                await self._async_execute_operation(priority, seq, op)
+                if self._battery_poll_after_ops and not self._pending_ops:
+                    self._battery_poll_after_ops = False
+                    self._schedule_battery_poll(0.0, "after_foreground")
+            elif self._connect_wanted:
+                self._connect_wanted = False
+                if self._startup_handle is not None:
+                    # 启动时隙未到：后台连接推迟到时隙（交互操作不经过这里）
+                    self._startup_connect_deferred = True
+                else:
+                    await self._async_actor_connect()
+
+    @callback
+    def _handle_event(self, kind: str, payload: Any) -> None:
+        if kind == _EVT_OP:
+            heapq.heappush(self._pending_ops, payload)
+        elif kind == _EVT_ADVERT:
+            self._advert_event_pending = False
+            if (
+                self.maintain_connection
+                and not self._connected
+                and not self._circuit_breaker.is_open
+            ):
+                self._connect_wanted = True
+        elif kind == _EVT_UNAVAILABLE:
+            if self._connected and self.auto_reconnect:
+                self._connect_wanted = True
+        elif kind == _EVT_DISCONNECT:
+            self._fall_back_to_battery_polling()
+            if self.auto_reconnect and self.maintain_connection:
+                self._connect_wanted = True
+        elif kind == _EVT_TIMER:
+            if payload == "battery":
+                self._async_on_battery_timer()
+
+    async def _async_actor_connect(self) -> None:
+        connected = False
+        try:
+            connected = await self.async_ensure_connected()
+        except asyncio.CancelledError:
+            raise
+        except Exception as err:  # noqa: BLE001
+            self._last_error = f"连接异常: {err}"
+            self._async_dispatch_update()
+        self._check_startup_ready(settled=not connected)
+
+    def _clear_operation_queue(self) -> None:
+        events, self._mailbox = self._mailbox, []
+        for kind, payload in events:
+            if kind == _EVT_OP:
+                heapq.heappush(self._pending_ops, payload)
+        self._connect_wanted = False
+        self._advert_event_pending = False
+        for _, _, op in self._pending_ops:
             if not op.future.done():
                 op.future.cancel()
-            self._op_queue.task_done()
+        self._pending_ops.clear()
 
-    async def _async_enqueue_operation(
+    def _submit_operation(
         self,
         *,
         name: str,
         action: Callable[[], Awaitable[Any]],
         priority: int,
-        retries: int = 0,
-        retry_delay: float = 0.8,
-    ) -> Any:
-        self._ensure_operation_worker()
-        self._op_seq += 1
+        purpose: str = "general",
+        preemptible: bool = False,
+        check_breaker: bool = True,
+    ) -> asyncio.Future[Any]:
+        """把操作投递到 actor，返回其结果 future。"""
+        breaker = self._circuit_breaker
+        if check_breaker and not breaker.allow_request():
+            self._last_operation_error = f"{name}: 断路器打开"
+            raise BleakError(
+                f"设备 {self.name}({self.address}) 连续连接失败，断路器打开中"
+                f"（剩余 {breaker.cooloff_remaining:.0f}s）: {self._last_error or '未知错误'}"
+            )
+
         future: asyncio.Future[Any] = self.hass.loop.create_future()
+        if check_breaker and breaker.state != CIRCUIT_CLOSED:
+            future.add_done_callback(lambda _f: breaker.release_probe())
+        if self._stopping:
+            future.set_exception(
+                BleakError(f"设备 {self.name}({self.address}) 已停止")
+            )
+            return future
+
+        self._op_seq += 1
         op = DeviceOperation(
             name=name,
             action=action,
-            retries=max(0, retries),
-            retry_delay=max(0.0, retry_delay),
+            policy=get_retry_policy(purpose),
             future=future,
+            preemptible=preemptible,
+            submitted_ts=time.monotonic(),
         )
-        await self._op_queue.put((priority, self._op_seq, op))
-        return await future
+        self._post(_EVT_OP, (priority, self._op_seq, op))
+        self._maybe_preempt_inflight(priority)
+        return future
 
-    def _is_retryable_operation_error(self, err: Exception) -> bool:
-        classification = self._connection_error_classification
-        if classification in {"slot_timeout", "connect_error", "scanner_unavailable"}:
-            return True
-        return isinstance(err, (TimeoutError, OSError))
+    async def _async_enqueue_operation(
+        self,
+        *,
+        name: str,
+        action: Callable[[], Awaitable[Any]],
+        priority: int,
+        purpose: str = "general",
+        preemptible: bool = False,
+        check_breaker: bool = True,
+    ) -> Any:
+        return await self._submit_operation(
+            name=name,
+            action=action,
+            priority=priority,
+            purpose=purpose,
+            preemptible=preemptible,
+            check_breaker=check_breaker,
+        )
+
+    def _maybe_preempt_inflight(self, priority: int) -> None:
+        """更高优先级操作到达时，中断进行中的可抢占后台操作。
+
+        处于连接后初始化等非安全阶段时，推迟到该阶段结束再中断。
+        """
+        op = self._inflight_op
+        task = self._inflight_task
+        if op is None or task is None or task.done() or not op.preemptible:
+            return
+        if priority >= self._inflight_priority:
+            return
+        if self._preempt_shielded:
+            self._preempt_deferred_priority = priority
+            return
+
+        elapsed = max(0.0, time.monotonic() - self._inflight_started_ts)
+        self._preempt_count += 1
+        # 触发抢占的交互操作开始执行时记录其实测排队等待
+        self._preempt_wait_priority = priority
+        _LOGGER.debug(
+            "设备 %s 后台操作 %s 被抢占（已运行 %.1fs）",
+            self.address,
+            op.name,
+            elapsed,
+        )
+        task.cancel()
+
+    async def _async_run_operation(self, op: DeviceOperation, priority: int) -> Any:
+        """执行单个操作；可抢占操作在独立任务中运行以便安全中断。"""
+        if not op.preemptible:
+            return await op.action()
+
+        task = self.hass.async_create_task(op.action())
+        self._inflight_op = op
+        self._inflight_task = task
+        self._inflight_priority = priority
+        self._inflight_started_ts = time.monotonic()
+        self._preempt_deferred_priority = None
+        try:
+            await asyncio.wait((task,))
+        except asyncio.CancelledError:
+            task.cancel()
+            # 等子任务清理完毕再向上传播：stop 之后的断开必须排在其后执行
+            await asyncio.wait((task,))
+            raise
+        finally:
+            self._inflight_op = None
+            self._inflight_task = None
+
+        if task.cancelled():
+            raise _OperationPreempted
+        return task.result()
+
+    def _next_operation_retry_delay(
+        self, op: DeviceOperation, session: RetrySession, err: Exception
+    ) -> float | None:
+        """Return how long to wait before retrying op, or None to give up."""
+        if session.exhausted or not op.policy.is_retryable(
+            self._connection_error_classification, err
+        ):
+            return None
+        # 连接层已从同一会话抽取退避并设置冷却时，只需等待冷却结束
+        cooldown = self._cooldown_until_ts - time.monotonic()
+        if cooldown > 0:
+            return cooldown if cooldown < session.remaining_budget else None
+        return session.next_delay()
 
     def _compute_slot_acquire_timeout(self, *, connect_purpose: str) -> float:
         timeout = float(CONNECTION_SLOT_ACQUIRE_TIMEOUT)
@@ -547,13 +1547,13 @@ class AntiLossTagDevice:
                     timeout_ratio = conn_mgr.acquire_timeout / conn_mgr.acquire_total
                     self._adaptive_timeout_ratio = timeout_ratio
                     if timeout_ratio >= 0.4:
-                        self._adaptive_mode = "timeout_high"
+                        self._adaptive_mode = AdaptiveMode.TIMEOUT_HIGH
                         if connect_purpose == "background_battery":
                             timeout = min(timeout, 3.0)
                         else:
                             timeout = min(30.0, timeout + 4.0)
                     else:
-                        self._adaptive_mode = "normal"
+                        self._adaptive_mode = AdaptiveMode.NORMAL
             except (AttributeError, TypeError):
                 pass
 
@@ -565,12 +1565,12 @@ class AntiLossTagDevice:
             return False
 
         # 优先保障用户触发的报警操作
-        if self._op_queue.qsize() > 0:
+        if self._pending_ops:
             return True
 
         # 报警操作后的短窗口内，暂缓后台轮询
         now_ts = time.monotonic()
-        if (now_ts - self._last_alarm_operation_ts) < 8.0:
+        if (now_ts - self._last_alarm_operation_ts) < BATTERY_POLL_ALARM_QUIET_SECONDS:
             return True
 
         # 全局连接槽位接近占满时，暂缓低优先级电量轮询
@@ -586,19 +1586,23 @@ class AntiLossTagDevice:
     def _compute_next_battery_sleep_seconds(
         self, *, force_connect: bool
     ) -> tuple[float, str]:
-        if self._op_queue.qsize() >= 3:
-            self._adaptive_mode = "queue_busy"
+        if len(self._pending_ops) >= 3:
+            self._adaptive_mode = AdaptiveMode.QUEUE_BUSY
             return (120.0, "queue_busy")
 
         conn_mgr = self._conn_mgr
         if conn_mgr is not None:
             try:
                 if conn_mgr.average_wait_ms >= 1500.0:
-                    self._adaptive_mode = "conn_mgr_congested"
+                    self._adaptive_mode = AdaptiveMode.CONN_MGR_CONGESTED
                     return (240.0, "conn_mgr_congested")
             except (AttributeError, TypeError):
                 pass
 
+        breaker_remaining = self._circuit_breaker.cooloff_remaining
+        if breaker_remaining > 0:
+            return (max(30.0, breaker_remaining), "circuit_open")
+
         if self._battery is None:
             return (90.0, "bootstrap_battery")
 
@@ -609,55 +1613,73 @@ class AntiLossTagDevice:
         }:
             return (180.0, "recovery_after_connect_failure")
 
-        base = float(self.battery_poll_interval_min * 60)
+        # 配置间隔为上限，放电模型在电量偏低/下降较快时缩短
+        base, reason = self._battery_model.recommend_interval(
+            float(self.battery_poll_interval_min * 60)
+        )
         jitter = float(random.randint(0, BATTERY_POLL_JITTER_SECONDS))
-        return (base + jitter, "normal_poll")
+        return (base + jitter, reason)
 
-    async def _async_operation_worker(self) -> None:
-        while True:
-            _, _, op = await self._op_queue.get()
-            try:
-                attempt = 0
-                while True:
-                    try:
-                        if op.name in {"start_alarm", "stop_alarm"}:
-                            self._last_alarm_operation_ts = time.monotonic()
-                        result = await op.action()
-                        if not op.future.done():
-                            op.future.set_result(result)
-                        break
-                    except asyncio.CancelledError:
-                        if not op.future.done():
-                            op.future.cancel()
-                        raise
-                    except (BleakError, TimeoutError, OSError) as err:
-                        attempt += 1
-                        self._last_operation_error = f"{op.name}: {err}"
-                        should_retry = (
-                            attempt <= op.retries
-                            and self._is_retryable_operation_error(err)
+    async def _async_execute_operation(
+        self, priority: int, seq: int, op: DeviceOperation
+    ) -> None:
+        """在 actor 中执行单个操作（含按策略重试与抢占后重新入队）。"""
+        if op.future.done():
+            # 调用方已取消，跳过
+            return
+        wait_priority = self._preempt_wait_priority
+        if wait_priority is not None and priority <= wait_priority:
+            self._preempt_wait_priority = None
+            wait_ms = (time.monotonic() - op.submitted_ts) * 1000.0
+            self._last_preempt_wait_ms = wait_ms
+            self._preempt_wait_ms_total += wait_ms
+        session = op.policy.new_session()
+        self._active_retry_session = session
+        try:
+            while True:
+                try:
+                    if op.name in {"start_alarm", "stop_alarm"}:
+                        self._last_alarm_operation_ts = time.monotonic()
+                    result = await self._async_run_operation(op, priority)
+                    if not op.future.done():
+                        op.future.set_result(result)
+                    break
+                except _OperationPreempted:
+                    # 保留原序号重新入队，交互操作完成后继续执行
+                    op.preempt_count += 1
+                    if not op.future.done():
+                        heapq.heappush(self._pending_ops, (priority, seq, op))
+                    break
+                except asyncio.CancelledError:
+                    if not op.future.done():
+                        op.future.cancel()
+                    raise
+                except (BleakError, TimeoutError, OSError) as err:
+                    self._last_operation_error = f"{op.name}: {err}"
+                    delay = self._next_operation_retry_delay(op, session, err)
+                    if delay is not None:
+                        session.retries += 1
+                        _LOGGER.debug(
+                            "设备 %s 操作 %s 失败，%.2fs 后重试 %d/%d: %s",
+                            self.address,
+                            op.name,
+                            delay,
+                            session.retries,
+                            op.policy.max_retries,
+                            err,
                         )
-                        if should_retry:
-                            _LOGGER.debug(
-                                "设备 %s 操作 %s 失败，重试 %d/%d: %s",
-                                self.address,
-                                op.name,
-                                attempt,
-                                op.retries,
-                                err,
-                            )
-                            await asyncio.sleep(op.retry_delay * (2 ** (attempt - 1)))
-                            continue
-                        if not op.future.done():
-                            op.future.set_exception(err)
-                        break
-                    except Exception as err:  # noqa: BLE001
-                        self._last_operation_error = f"{op.name}: {err}"
-                        if not op.future.done():
-                            op.future.set_exception(err)
-                        break
-            finally:
-                self._op_queue.task_done()
+                        await asyncio.sleep(delay)
+                        continue
+                    if not op.future.done():
+                        op.future.set_exception(err)
+                    break
+                except Exception as err:  # noqa: BLE001
+                    self._last_operation_error = f"{op.name}: {err}"
+                    if not op.future.done():
+                        op.future.set_exception(err)
+                    break
+        finally:
+            self._active_retry_session = None
 
     def _ble_device_callback(self) -> BLEDevice | None:
         return bluetooth.async_ble_device_from_address(
@@ -670,39 +1692,32 @@ class AntiLossTagDevice:
             await self._conn_mgr.release()
             self._conn_slot_acquired = False
 
-    def _release_connection_slot_soon(self) -> None:
-        """Release connection slot from non-async callback context.
+    def _apply_connect_backoff(
+        self, *, max_backoff: float, connect_purpose: str
+    ) -> float:
+        """Increase failure count and apply decorrelated-jitter cooldown.
 
-        This is called from synchronous callbacks (like _on_disconnect),
-        so we need to schedule the async release without blocking.
+        退避从当前操作的重试会话抽取（与操作层共享预算）；
+        无操作时使用后台重连会话，避免大面积断连后全体标签同步重试。
         """
-        if self._conn_mgr is not None and self._conn_slot_acquired:
-            self._conn_slot_acquired = False
-            # Add error handling to prevent slot leakage on task creation failure
-            try:
-                task = self.hass.async_create_task(self._release_connection_slot())
-
-                # Add completion callback to catch exceptions in task
-                def _task_done(t: asyncio.Task) -> None:
-                    try:
-                        t.exception()
-                    except Exception as err:
-                        _LOGGER.error("Error in slot release task: %s", err)
-
-                task.add_done_callback(_task_done)
-            except Exception as err:
-                _LOGGER.error("Failed to schedule slot release: %s", err)
-
-    def _apply_connect_backoff(self, *, max_backoff: int) -> int:
-        """Increase failure count and apply exponential cooldown."""
         self._connect_fail_count = min(
             self._connect_fail_count + 1, MAX_CONNECT_FAIL_COUNT
         )
-        backoff = min(max_backoff, (2**self._connect_fail_count))
-        self._cooldown_until_ts = time.time() + backoff
+        session = self._active_retry_session
+        if session is None:
+            if self._connect_retry_session is None:
+                self._connect_retry_session = get_retry_policy(
+                    connect_purpose
+                ).new_session()
+            session = self._connect_retry_session
+        delay = session.next_delay()
+        if delay is None:
+            delay = session.policy.max_delay
+        backoff = min(float(max_backoff), delay)
+        self._cooldown_until_ts = time.monotonic() + backoff
         return backoff
 
-    def _set_connection_state(self, state: str) -> None:
+    def _set_connection_state(self, state: ConnectionState) -> None:
         if self._connection_state != state:
             self._connection_state = state
 
@@ -714,7 +1729,7 @@ class AntiLossTagDevice:
         """
         try:
             self._connected = False
-            self._set_connection_state("degraded")
+            self._set_connection_state(ConnectionState.DEGRADED)
 
             # ====== 对齐 HA IQS log-when-unavailable：记录不可用日志（仅一次） ======
             if not self._unavailability_logged:
@@ -732,15 +1747,20 @@ class AntiLossTagDevice:
         finally:
             # ====== 断开：归还全局连接槽位 ======
             # 确保资源释放一定会执行
-            self._release_connection_slot_soon()
+            if self._conn_mgr is not None and self._conn_slot_acquired:
+                self._conn_slot_acquired = False
+                self._conn_mgr.release_nowait()
             # ====== 结束 ======
             self._client = None
             self._alert_level_handle = None
             self._battery_level_handle = None
+            self._set_alarm_state_after_disconnect()
+            # 断开后连接不再证明在场：从此刻起按超时等待下一条广播
+            self._rearm_presence_wheel()
             self._async_dispatch_update()
 
-        if self.auto_reconnect and self.maintain_connection:
-            self._ensure_connect_task()
+        # 重连决策交给 actor
+        self._post(_EVT_DISCONNECT)
 
     async def async_ensure_connected(self, *, connect_purpose: str = "general") -> bool:
         """Ensure BLE connection is established and ready for GATT operations.
@@ -748,156 +1768,217 @@ class AntiLossTagDevice:
         Returns:
             True if connection is ready for GATT operations, False otherwise.
         """
-        async with self._connect_lock:
-            # ====== 连接退避：避免多设备同时冲连接 ======
-            now_ts = time.time()
-            if now_ts < self._cooldown_until_ts:
-                self._set_connection_state("backoff")
-                return False
-            if self._connected and self._client is not None:
-                self._set_connection_state("ready")
-                return True
+        # ====== 连接退避：避免多设备同时冲连接 ======
+        now_ts = time.monotonic()
+        if now_ts < self._cooldown_until_ts:
+            self._set_connection_state(ConnectionState.BACKOFF)
+            return False
+        if self._connected and self._client is not None:
+            self._set_connection_state(ConnectionState.READY)
+            return True
 
-            self._set_connection_state("connecting")
+        self._set_connection_state(ConnectionState.CONNECTING)
 
-            ble_device = bluetooth.async_ble_device_from_address(
-                self.hass, self.address, connectable=True
+        ble_device = bluetooth.async_ble_device_from_address(
+            self.hass, self.address, connectable=True
+        )
+        if ble_device is None:
+            self._last_error = "No connectable BLEDevice available (out of range or no connectable scanner)."
+            self._connection_error_classification = (
+                ConnectionErrorClass.SCANNER_UNAVAILABLE
             )
-            if ble_device is None:
-                self._last_error = "No connectable BLEDevice available (out of range or no connectable scanner)."
-                self._connection_error_classification = "scanner_unavailable"
-                self._connection_error_type = "device_not_connectable"
-                self._connected = False
-                self._client = None
-                self._set_connection_state("scanning")
-
-                # ====== 主动断开：归还全局连接槽位 ======
-                await self._release_connection_slot()
-                # ====== 结束 ======
-                self._async_dispatch_update()
-                return False
+            self._connection_error_type = "device_not_connectable"
+            self._circuit_breaker.record_failure("scanner_unavailable")
+            self._connected = False
+            self._client = None
+            self._set_connection_state(ConnectionState.SCANNING)
 
-            # ====== 获取全局连接槽位（跨设备并发控制） ======
-            if self._conn_mgr is not None and not self._conn_slot_acquired:
-                slot_timeout = self._compute_slot_acquire_timeout(
-                    connect_purpose=connect_purpose
-                )
-                acq = await self._conn_mgr.acquire(timeout=slot_timeout)
-                if not acq.acquired:
-                    backoff = self._apply_connect_backoff(
-                        max_backoff=MAX_CONNECT_BACKOFF_SECONDS // 2
-                    )
-                    self._last_error = f"等待连接槽位中({acq.reason}, timeout={slot_timeout:.1f}s); {backoff}s 后重试"
-                    self._connection_error_classification = "slot_timeout"
-                    self._connection_error_type = f"acquire_failed:{acq.reason}"
-                    self._connected = False
-                    self._client = None
-                    self._set_connection_state("backoff")
-                    self._async_dispatch_update()
-                    return False
-                self._conn_slot_acquired = True
+            # ====== 主动断开：归还全局连接槽位 ======
+            await self._release_connection_slot()
             # ====== 结束 ======
+            self._async_dispatch_update()
+            return False
 
-            try:
-                client: BleakClientWithServiceCache = await establish_connection(
-                    BleakClientWithServiceCache,
-                    ble_device,
-                    self.name,
-                    disconnected_callback=self._on_disconnect,
-                    ble_device_callback=self._ble_device_callback,
-                )
-            except (
-                BleakOutOfConnectionSlotsError,
-                BleakNotFoundError,
-                BleakAbortedError,
-                BleakConnectionError,
-            ) as err:
-                # ====== 连接失败：归还全局连接槽位 + 退避 ======
-                await self._release_connection_slot()
+        # ====== 获取全局连接槽位（跨设备并发控制） ======
+        if self._conn_mgr is not None and not self._conn_slot_acquired:
+            slot_timeout = self._compute_slot_acquire_timeout(
+                connect_purpose=connect_purpose
+            )
+            acq = await self._conn_mgr.acquire(timeout=slot_timeout)
+            if not acq.acquired:
                 backoff = self._apply_connect_backoff(
-                    max_backoff=MAX_CONNECT_BACKOFF_SECONDS
+                    max_backoff=MAX_CONNECT_BACKOFF_SECONDS / 2,
+                    connect_purpose=connect_purpose,
                 )
-                self._last_error = f"连接失败: {err}; {backoff}s 后重试"
-                self._connection_error_classification = "connect_error"
-                self._connection_error_type = type(err).__name__
-                self._connected = False
-                self._client = None
-                self._set_connection_state("backoff")
-                self._async_dispatch_update()
-                return False
-
-            self._set_connection_state("discovering")
-            try:
-                # 访问 services 属性触发服务发现（bleak 的 services 是 property）
-                _ = client.services
-            except BleakError as err:
-                await self._release_connection_slot()
-                backoff = self._apply_connect_backoff(
-                    max_backoff=MAX_CONNECT_BACKOFF_SECONDS
+                self._last_error = f"等待连接槽位中({acq.reason}, timeout={slot_timeout:.1f}s); {backoff:.1f}s 后重试"
+                self._connection_error_classification = (
+                    ConnectionErrorClass.SLOT_TIMEOUT
                 )
-                self._last_error = f"服务发现失败: {err}; {backoff}s 后重试"
-                self._connection_error_classification = "service_discovery_error"
-                self._connection_error_type = "BleakError"
+                self._connection_error_type = f"acquire_failed:{acq.reason}"
                 self._connected = False
                 self._client = None
-                self._set_connection_state("degraded")
+                self._set_connection_state(ConnectionState.BACKOFF)
                 self._async_dispatch_update()
-                try:
-                    await client.disconnect()
-                except BleakError:
-                    pass
                 return False
+            self._conn_slot_acquired = True
+        # ====== 结束 ======
+
+        try:
+            client: BleakClientWithServiceCache = await establish_connection(
+                BleakClientWithServiceCache,
+                ble_device,
+                self.name,
+                disconnected_callback=self._on_disconnect,
+                max_attempts=get_retry_policy(connect_purpose).connect_attempts,
+                ble_device_callback=self._ble_device_callback,
+            )
+        except asyncio.CancelledError:
+            # 连接被抢占或任务停止：归还槽位后继续传播取消
+            await self._release_connection_slot()
+            self._set_connection_state(ConnectionState.IDLE)
+            raise
+        except (
+            BleakOutOfConnectionSlotsError,
+            BleakNotFoundError,
+            BleakAbortedError,
+            BleakConnectionError,
+        ) as err:
+            # ====== 连接失败：归还全局连接槽位 + 退避 ======
+            await self._release_connection_slot()
+            backoff = self._apply_connect_backoff(
+                max_backoff=MAX_CONNECT_BACKOFF_SECONDS,
+                connect_purpose=connect_purpose,
+            )
+            self._last_error = f"连接失败: {err}; {backoff:.1f}s 后重试"
+            self._connection_error_classification = ConnectionErrorClass.CONNECT_ERROR
+            self._connection_error_type = type(err).__name__
+            self._circuit_breaker.record_failure("connect_error")
+            self._connected = False
+            self._client = None
+            self._set_connection_state(ConnectionState.BACKOFF)
+            self._async_dispatch_update()
+            return False
 
-            self._client = client
-            self._connected = True
-            self._last_error = None
-            self._connection_error_classification = None
-            self._connection_error_type = None
-            self._connect_fail_count = 0
-            self._cooldown_until_ts = 0.0
-
-            # ====== 对齐 HA IQS log-when-unavailable：记录恢复日志（仅一次） ======
-            if self._unavailability_logged:
-                _LOGGER.info("Device %s recovered", self.name)
-                self._unavailability_logged = False
-
-            init_ok = await self._async_post_connect_setup()
-            self._set_connection_state("ready" if init_ok else "degraded")
+        self._set_connection_state(ConnectionState.DISCOVERING)
+        try:
+            # 访问 services 属性触发服务发现（bleak 的 services 是 property）
+            _ = client.services
+        except BleakError as err:
+            await self._release_connection_slot()
+            backoff = self._apply_connect_backoff(
+                max_backoff=MAX_CONNECT_BACKOFF_SECONDS,
+                connect_purpose=connect_purpose,
+            )
+            self._last_error = f"服务发现失败: {err}; {backoff:.1f}s 后重试"
+            self._connection_error_classification = (
+                ConnectionErrorClass.SERVICE_DISCOVERY_ERROR
+            )
+            self._connection_error_type = "BleakError"
+            self._circuit_breaker.record_failure("service_discovery_error")
+            self._connected = False
+            self._client = None
+            self._set_connection_state(ConnectionState.DEGRADED)
             self._async_dispatch_update()
-            return True
+            try:
+                await client.disconnect()
+            except BleakError:
+                pass
+            return False
+
+        self._client = client
+        self._connected = True
+        self._last_error = None
+        self._connection_error_classification = None
+        self._connection_error_type = None
+        self._connect_fail_count = 0
+        self._cooldown_until_ts = 0.0
+        self._connect_retry_session = None
+        self._circuit_breaker.record_success()
+
+        # ====== 对齐 HA IQS log-when-unavailable：记录恢复日志（仅一次） ======
+        if self._unavailability_logged:
+            _LOGGER.info("Device %s recovered", self.name)
+            self._unavailability_logged = False
+
+        init_ok = await self._async_post_connect_setup()
+        self._set_connection_state(
+            ConnectionState.READY if init_ok else ConnectionState.DEGRADED
+        )
+        self._async_dispatch_update()
+        return True
 
     async def async_disconnect(self) -> None:
-        async with self._connect_lock:
-            if self._client is None:
-                self._connected = False
-                self._async_dispatch_update()
-                return
+        """Disconnect via the actor so it never races an in-flight operation."""
+        if self._stopping:
+            return
+        await self._async_enqueue_operation(
+            name="disconnect",
+            action=self._async_disconnect_impl,
+            priority=self._op_priority_policy,
+            check_breaker=False,
+        )
+
+    async def _async_disconnect_impl(self) -> None:
+        if self._client is None:
+            self._connected = False
+            self._async_dispatch_update()
+            return
+        try:
             try:
-                try:
-                    await self._client.stop_notify(UUID_NOTIFY_FFE1)
-                except BleakError:
-                    # stop_notify may fail if already disconnected
-                    pass
-                await self._client.disconnect()
-            finally:
-                self._client = None
-                self._connected = False
-                self._alert_level_handle = None
-                self._battery_level_handle = None
-                self._set_connection_state("idle")
-                self._async_dispatch_update()
+                await self._client.stop_notify(UUID_NOTIFY_FFE1)
+            except BleakError:
+                # stop_notify may fail if already disconnected
+                pass
+            await self._client.disconnect()
+        finally:
+            self._client = None
+            self._connected = False
+            self._alert_level_handle = None
+            self._battery_level_handle = None
+            self._set_alarm_state_after_disconnect()
+            self._set_connection_state(ConnectionState.IDLE)
+            self._fall_back_to_battery_polling()
+            self._rearm_presence_wheel()
+            self._async_dispatch_update()
 
     async def _async_post_connect_setup(self) -> bool:
         """Run post-connection initialization pipeline."""
+        # 初始化流水线不是安全中断点：期间到达的抢占请求推迟到结束后执行
+        self._preempt_shielded = True
+        try:
+            return await self._async_post_connect_setup_impl()
+        finally:
+            self._preempt_shielded = False
+            deferred_priority = self._preempt_deferred_priority
+            if deferred_priority is not None:
+                self._preempt_deferred_priority = None
+                self._maybe_preempt_inflight(deferred_priority)
+
+    async def _async_post_connect_setup_impl(self) -> bool:
         self._resolve_gatt_handles()
 
         notifications_ok = await self._async_enable_notifications()
         if not notifications_ok:
-            self._connection_error_classification = "notify_error"
+            self._connection_error_classification = ConnectionErrorClass.NOTIFY_ERROR
             self._connection_error_type = "start_notify_failed"
 
-        # 对齐 Android 流程：连接稳定后立即读取一次电量
-        await self._async_read_battery_impl(force_connect=False)
+        # 2A19 支持 notify 时订阅电量推送，连接期间停止后台轮询；失败则保持轮询
+        if await self._async_enable_battery_notifications():
+            self._battery_mode = BatteryUpdateMode.NOTIFY
+            self._cancel_battery_timer()
+            self._last_battery_sleep_reason = "battery_notify"
+
+        # 对齐 Android 流程：连接稳定后顺带读取电量（读数仍新鲜时跳过）
+        if not self._battery_is_fresh(BATTERY_PIGGYBACK_MAX_AGE_SECONDS):
+            reads_before = self._battery_reads_total
+            await self._async_read_battery_impl(force_connect=False)
+            if (
+                self._battery_reads_total != reads_before
+                and not self._battery_reads_pending
+            ):
+                # 为报警/策略同步/重连建立的连接已读到电量：推迟该标签的后台轮询
+                self._battery_piggyback_reads += 1
+                self._schedule_next_battery_poll(not self.maintain_connection)
 
         # 最佳努力同步断开报警策略，失败不影响连接可用性
         try:
@@ -918,25 +1999,86 @@ class AntiLossTagDevice:
         if client is None:
             return False
 
-        async def _handler(_sender: int, data: bytearray) -> None:
-            raw = bytes(data)
-            if not raw:
-                return
-            # Follow your Android behavior: first byte == 1 -> treat as button press
-            if raw[0] == 1:
-                event = ButtonEvent(when=datetime.now(timezone.utc), raw=raw)
-                self._last_button_event = event
-                self._async_dispatch_button(event)
-                self._async_dispatch_update()
-
         try:
-            await client.start_notify(UUID_NOTIFY_FFE1, _handler)
+            # 同步回调：bleak 在事件循环中直接调用，不再为每条通知创建协程
+            await client.start_notify(UUID_NOTIFY_FFE1, self._on_button_notification)
             return True
         except BleakError as err:
             self._last_error = f"开启通知(FFE1)失败: {err}"
             self._async_dispatch_update()
             return False
 
+    async def _async_enable_battery_notifications(self) -> bool:
+        """Subscribe to 2A19 notifications if the characteristic supports it."""
+        client = self._client
+        handle = self._battery_level_handle
+        char = self._cached_chars.get(self._normalize_uuid(UUID_BATTERY_LEVEL_2A19))
+        if client is None or handle is None or char is None:
+            return False
+        props = {str(p).lower() for p in (getattr(char, "properties", None) or [])}
+        if "notify" not in props:
+            return False
+        try:
+            await client.start_notify(handle, self._on_battery_notification)
+        except (BleakError, TimeoutError, OSError) as err:
+            _LOGGER.debug(
+                "设备 %s 订阅电量通知(2A19)失败，保持轮询: %s", self.address, err
+            )
+            return False
+        return True
+
+    @callback
+    def _on_button_notification(self, _sender: Any, data: bytearray) -> None:
+        """FFE1 notify: parse in place and fire the button event in this callback."""
+        view = memoryview(data)
+        if not view:
+            return
+        first = view[0]
+        # Follow your Android behavior: first byte == 1 -> treat as button press
+        if first == 1:
+            raw = view.tobytes()
+            event = ButtonEvent(when=datetime.now(timezone.utc), raw=raw)
+            self._last_button_event = event
+            # 按键不对应任何实体字段，直接分发按键事件，不再触发（可能被防抖的）实体更新
+            self._async_dispatch_button(event)
+            gesture = self._gesture
+            if gesture is None:
+                multi_press_window, long_press = self._gesture_windows()
+                gesture = self._gesture = ButtonGestureRecognizer(
+                    self.hass.loop,
+                    self._async_on_gesture,
+                    multi_press_window=multi_press_window,
+                    long_press=long_press,
+                )
+            gesture.press(raw)
+        elif first == 0 and self._gesture is not None:
+            # 固件上报松开时才启用长按识别
+            self._gesture.release()
+
+    @callback
+    def _async_on_gesture(self, gesture: str, raw: bytes) -> None:
+        counts = self._gesture_counts
+        if counts is None:
+            counts = self._gesture_counts = {}
+        counts[gesture] = counts.get(gesture, 0) + 1
+        self._async_dispatch_button(
+            ButtonEvent(when=datetime.now(timezone.utc), raw=raw, gesture=gesture)
+        )
+
+    def _on_battery_notification(self, _sender: Any, data: bytearray) -> None:
+        if not data:
+            return
+        self._battery_notifications += 1
+        self._record_battery_level(data[0])
+
+    def _fall_back_to_battery_polling(self) -> None:
+        """Connection gone: notifications stop, so resume polling."""
+        if self._battery_mode is not BatteryUpdateMode.NOTIFY:
+            return
+        self._battery_mode = BatteryUpdateMode.POLL
+        if not self._stopping:
+            self._schedule_next_battery_poll(not self.maintain_connection)
+
     # -------------------------
     # Characteristic handle resolution
     # -------------------------
@@ -1037,6 +2179,34 @@ class AntiLossTagDevice:
             require_write=False,
         )
 
+    # -------------------------
+    # Alarm state
+    # -------------------------
+    def _set_alarm_active(self, active: bool | None) -> None:
+        self._cancel_alarm_timeout()
+        if active and not self._stopping:
+            self._alarm_timeout_handle = self.hass.loop.call_later(
+                ALARM_RING_TIMEOUT_SECONDS, self._async_on_alarm_timeout
+            )
+        if self._alarm_active is not active:
+            self._alarm_active = active
+            self._async_dispatch_update()
+
+    def _cancel_alarm_timeout(self) -> None:
+        if self._alarm_timeout_handle is not None:
+            self._alarm_timeout_handle.cancel()
+            self._alarm_timeout_handle = None
+
+    @callback
+    def _async_on_alarm_timeout(self) -> None:
+        self._alarm_timeout_handle = None
+        # 超时只是推测标签已自行停止响铃，未经确认：记为未知而非已静默
+        self._set_alarm_active(None)
+
+    def _set_alarm_state_after_disconnect(self) -> None:
+        # 启用断开报警时标签会自行响铃，状态未知；否则断开即静默
+        self._set_alarm_active(None if self.alarm_on_disconnect else False)
+
     # -------------------------
     # GATT operations
     # -------------------------
@@ -1053,16 +2223,22 @@ class AntiLossTagDevice:
                 prefer_response=False,
                 connect_purpose="interactive_alarm",
             )
+            self._set_alarm_active(True)
 
         await self._async_enqueue_operation(
             name="start_alarm",
             action=_action,
             priority=self._op_priority_alarm,
-            retries=1,
-            retry_delay=0.6,
+            purpose="interactive_alarm",
         )
 
-    async def async_stop_alarm(self) -> None:
+    async def async_stop_alarm(self, force: bool = False) -> None:
+        """Stop the alarm; a known-silent tag completes locally unless forced."""
+        if not force and self._alarm_active is False:
+            self._alarm_stop_skipped += 1
+            _LOGGER.debug("设备 %s 未在报警，跳过停止报警写入", self.address)
+            return
+
         async def _action() -> None:
             char = (
                 self._alert_level_handle
@@ -1075,13 +2251,13 @@ class AntiLossTagDevice:
                 prefer_response=False,
                 connect_purpose="interactive_alarm",
             )
+            self._set_alarm_active(False)
 
         await self._async_enqueue_operation(
             name="stop_alarm",
             action=_action,
             priority=self._op_priority_alarm,
-            retries=1,
-            retry_delay=0.6,
+            purpose="interactive_alarm",
         )
 
     async def async_set_disconnect_alarm_policy(
@@ -1101,7 +2277,7 @@ class AntiLossTagDevice:
                             connect_purpose="policy_sync",
                         )
                     finally:
-                        await self.async_disconnect()
+                        await self._async_disconnect_impl()
                     return
             await self._async_write_bytes(
                 UUID_WRITE_FFE2,
@@ -1114,8 +2290,7 @@ class AntiLossTagDevice:
             name="sync_disconnect_policy",
             action=_action,
             priority=self._op_priority_policy,
-            retries=1,
-            retry_delay=0.8,
+            purpose="policy_sync",
         )
 
     async def _async_gatt_operation_with_uuid_fallback(
@@ -1188,21 +2363,59 @@ class AntiLossTagDevice:
                     return await _do_operation(handle)
             raise
 
-    async def async_read_battery(self, force_connect: bool) -> None:
-        # 避免后台轮询重复堆积读电量任务
-        if self._battery_read_lock.locked() and not force_connect:
-            return
+    async def async_read_battery(
+        self,
+        force_connect: bool,
+        max_age: float = BATTERY_READ_CACHE_TTL_SECONDS,
+    ) -> int | None:
+        """Return the battery level, reading 2A19 only when the cache is stale.
 
-        async with self._battery_read_lock:
-            await self._async_enqueue_operation(
-                name="read_battery",
-                action=lambda: self._async_read_battery_impl(
-                    force_connect=force_connect
-                ),
-                priority=self._op_priority_battery,
-                retries=1,
-                retry_delay=1.2,
-            )
+        读数在 max_age 秒内直接返回缓存值；已有读取在途时共享其结果（单飞），
+        不再另排一次 GATT 读取。max_age=0 表示绕过缓存。
+        """
+        fresh = max_age > 0 and self._battery_is_fresh(max_age)
+        if fresh and self._battery is not None:
+            self._battery_cache_hits += 1
+            return self._battery
+
+        # 断路器打开时不发起读取，由轮询在冷却期后重试
+        if self._circuit_breaker.is_open:
+            return self._battery
+
+        future = self._battery_read_future
+        if future is not None and (self._battery_read_forced or not force_connect):
+            self._battery_read_joins += 1
+        else:
+            self._battery_cache_misses += 1
+            future = self._submit_battery_read(force_connect)
+        # shield：单个调用方取消不影响共享同一读取的其他调用方
+        await asyncio.shield(future)
+        return self._battery
+
+    def _submit_battery_read(self, force_connect: bool) -> asyncio.Future[Any]:
+        future = self._submit_operation(
+            name="read_battery",
+            action=lambda: self._async_read_battery_impl(
+                force_connect=force_connect
+            ),
+            priority=self._op_priority_battery,
+            purpose="background_battery",
+            preemptible=True,
+        )
+        self._battery_reads_pending += 1
+        self._battery_read_future = future
+        self._battery_read_forced = force_connect
+        future.add_done_callback(self._on_battery_read_done)
+        return future
+
+    def _on_battery_read_done(self, future: asyncio.Future[Any]) -> None:
+        self._battery_reads_pending = max(0, self._battery_reads_pending - 1)
+        if self._battery_read_future is future:
+            self._battery_read_future = None
+
+    def _battery_is_fresh(self, max_age: float) -> bool:
+        read_mono = self._last_battery_read_mono
+        return read_mono is not None and time.monotonic() - read_mono < max_age
 
     async def _async_read_battery_impl(self, force_connect: bool) -> None:
         if self._client is None:
@@ -1214,6 +2427,7 @@ class AntiLossTagDevice:
                         self.address,
                     )
                 return
+            reads_before = self._battery_reads_total
             connected = await self.async_ensure_connected(
                 connect_purpose="background_battery"
             )
@@ -1224,37 +2438,46 @@ class AntiLossTagDevice:
                     self._last_error or "未知错误",
                 )
                 return
-
-        async with self._gatt_lock:
-            client = self._client
-            if client is None:
+            if self._battery_reads_total != reads_before:
+                # 建连初始化流程已读取电量，无需再读一次
                 return
-            try:
-                char = (
-                    self._battery_level_handle
-                    if self._battery_level_handle is not None
-                    else UUID_BATTERY_LEVEL_2A19
-                )
-                data = await self._async_gatt_operation_with_uuid_fallback(
-                    client=client,
-                    char_specifier=char,
-                    operation="read",
-                    preferred_service_uuid=_UUID_SERVICE_BATTERY_180F,
-                    require_write=False,
-                )
-                if data and len(data) >= 1:
-                    level = int(data[0])
-                    level = max(0, min(100, level))
-                    self._battery = level
-                    self._last_battery_read = datetime.now(timezone.utc)
-                    _LOGGER.debug("设备 %s 电量读取成功: %d%%", self.address, level)
-                    self._async_dispatch_update()
-            except BleakError as err:
-                self._last_error = f"读取电量失败: {err}"
-                self._async_dispatch_update()
-            except (TimeoutError, OSError, asyncio.CancelledError) as err:
-                self._last_error = f"读取电量失败（超时或系统错误）: {err}"
-                self._async_dispatch_update()
+
+        client = self._client
+        if client is None:
+            return
+        try:
+            char = (
+                self._battery_level_handle
+                if self._battery_level_handle is not None
+                else UUID_BATTERY_LEVEL_2A19
+            )
+            data = await self._async_gatt_operation_with_uuid_fallback(
+                client=client,
+                char_specifier=char,
+                operation="read",
+                preferred_service_uuid=_UUID_SERVICE_BATTERY_180F,
+                require_write=False,
+            )
+            if data and len(data) >= 1:
+                self._battery_reads_total += 1
+                self._record_battery_level(data[0])
+                _LOGGER.debug("设备 %s 电量读取成功: %d%%", self.address, self._battery)
+        except BleakError as err:
+            self._last_error = f"读取电量失败: {err}"
+            self._async_dispatch_update()
+        except (TimeoutError, OSError) as err:
+            self._last_error = f"读取电量失败（超时或系统错误）: {err}"
+            self._async_dispatch_update()
+
+    def _record_battery_level(self, raw_level: int) -> None:
+        """Store a battery level from a read or a 2A19 notification."""
+        level = max(0, min(100, int(raw_level)))
+        self._battery = level
+        self._last_battery_read = datetime.now(timezone.utc)
+        self._last_battery_read_mono = time.monotonic()
+        self._battery_model.add(time.time(), level)
+        self._check_startup_ready()
+        self._async_dispatch_update()
 
     async def _async_write_bytes(
         self,
@@ -1273,71 +2496,154 @@ class AntiLossTagDevice:
                     f"无法为设备 {self.name}({self.address}) 建立连接用于写入 {uuid}: {error_detail}"
                 )
 
-        async with self._gatt_lock:
-            client = self._client
-            if client is None:
-                error_detail = self._last_error or "未知错误"
-                raise BleakError(
-                    f"无法为设备 {self.name}({self.address}) 获取 BLE 客户端用于写入 {uuid}: {error_detail}"
-                )
-
-            # 确定2A06（报警）的优先服务UUID
-            def _get_preferred_service(u: str) -> str | None:
-                if u.lower() == UUID_ALERT_LEVEL_2A06.lower():
-                    return _UUID_SERVICE_IMMEDIATE_ALERT_1802
-                return None
+        client = self._client
+        if client is None:
+            error_detail = self._last_error or "未知错误"
+            raise BleakError(
+                f"无法为设备 {self.name}({self.address}) 获取 BLE 客户端用于写入 {uuid}: {error_detail}"
+            )
 
-            # Try preferred response mode first, then fallback
-            response_modes = [prefer_response, not prefer_response]
+        # 确定2A06（报警）的优先服务UUID
+        def _get_preferred_service(u: str) -> str | None:
+            if u.lower() == UUID_ALERT_LEVEL_2A06.lower():
+                return _UUID_SERVICE_IMMEDIATE_ALERT_1802
+            return None
 
-            for i, response_mode in enumerate(response_modes):
-                try:
-                    await self._async_gatt_operation_with_uuid_fallback(
-                        client=client,
-                        char_specifier=uuid,
-                        operation="write",
-                        preferred_service_uuid=_get_preferred_service(uuid)
-                        if isinstance(uuid, str)
-                        else None,
-                        require_write=True,
-                        write_data=data,
-                        response=response_mode,
-                    )
-                    return
-                except (BleakError, TimeoutError, OSError) as err:
-                    if i < len(response_modes) - 1:
-                        continue
-                    self._last_error = f"写入 {uuid} 失败: {err}"
-                    self._async_dispatch_update()
-                    raise
+        # Try preferred response mode first, then fallback
+        response_modes = [prefer_response, not prefer_response]
 
-    async def _async_battery_loop(self) -> None:
-        # 启动后立即尝试一次读取，避免首次电量长时间 unknown
-        await asyncio.sleep(random.uniform(0.5, 3.0))
-        while True:
+        for i, response_mode in enumerate(response_modes):
             try:
-                # 首次读取或电量为 None 时，强制建立连接
-                force = (self._battery is None) or (not self.maintain_connection)
-
-                if self._should_defer_battery_poll():
-                    self._battery_defer_count += 1
-                    self._last_battery_sleep_seconds = 15.0
-                    self._last_battery_sleep_reason = "defer_for_foreground"
-                    await asyncio.sleep(15.0)
-                    continue
-
-                await self.async_read_battery(force_connect=force)
-                next_sleep, reason = self._compute_next_battery_sleep_seconds(
-                    force_connect=force
+                await self._async_gatt_operation_with_uuid_fallback(
+                    client=client,
+                    char_specifier=uuid,
+                    operation="write",
+                    preferred_service_uuid=_get_preferred_service(uuid)
+                    if isinstance(uuid, str)
+                    else None,
+                    require_write=True,
+                    write_data=data,
+                    response=response_mode,
                 )
-                self._last_battery_sleep_seconds = next_sleep
-                self._last_battery_sleep_reason = reason
-                await asyncio.sleep(next_sleep)
-                # ====== 结束 ======
-            except asyncio.CancelledError:
-                # 任务被取消，清理资源后重新抛出
-                _LOGGER.debug("Battery loop cancelled for %s", self.address)
-                raise
+                return
             except (BleakError, TimeoutError, OSError) as err:
-                self._last_error = f"电量轮询异常: {err}"
+                if i < len(response_modes) - 1:
+                    continue
+                self._last_error = f"写入 {uuid} 失败: {err}"
                 self._async_dispatch_update()
+                raise
+
+    # -------------------------
+    # Battery polling (timer-driven)
+    # -------------------------
+    def _schedule_battery_poll(self, delay: float, reason: str) -> None:
+        """(Re)arm the battery poll timer; the tick is posted to the actor."""
+        self._cancel_battery_timer()
+        self._last_battery_sleep_seconds = float(delay)
+        self._last_battery_sleep_reason = reason
+        if self._stopping:
+            return
+        if self._battery_mode is BatteryUpdateMode.NOTIFY:
+            # 连接期间由 2A19 通知推送电量，断开后再恢复轮询
+            self._last_battery_sleep_reason = "battery_notify"
+            return
+        if self._battery_scheduler is not None:
+            self._battery_scheduler.async_schedule(
+                self.address, delay, self._async_on_battery_timer
+            )
+            return
+        self._battery_timer = self.hass.loop.call_later(
+            delay, self._post, _EVT_TIMER, "battery"
+        )
+
+    def _cancel_battery_timer(self) -> None:
+        self._battery_poll_after_ops = False
+        self._battery_poll_parked = False
+        if self._battery_scheduler is not None:
+            self._battery_scheduler.async_cancel(self.address)
+        if self._battery_timer is not None:
+            self._battery_timer.cancel()
+            self._battery_timer = None
+
+    def _schedule_next_battery_poll(self, force_connect: bool) -> None:
+        next_sleep, reason = self._compute_next_battery_sleep_seconds(
+            force_connect=force_connect
+        )
+        self._schedule_battery_poll(next_sleep, reason)
+
+    @callback
+    def _async_on_battery_timer(self) -> asyncio.Future[Any] | None:
+        """Poll due: submit a battery read and return its future (None if not)."""
+        self._battery_timer = None
+        # 首次读取或电量为 None 时，强制建立连接
+        force = (self._battery is None) or (not self.maintain_connection)
+
+        if not self._connected and not self._available:
+            # 近期没有广播：连接必然失败，挂起到下一条广播
+            self._battery_poll_parked = True
+            self._battery_polls_parked += 1
+            self._last_battery_sleep_reason = "parked_until_advert"
+            self._check_startup_ready(settled=True)
+            return None
+
+        if self._should_defer_battery_poll():
+            self._battery_defer_count += 1
+            self._defer_battery_poll()
+            return None
+
+        # 断路器打开或已有读取在途时不再追加，直接排下一轮
+        if self._circuit_breaker.is_open or self._battery_reads_pending:
+            self._schedule_next_battery_poll(force)
+            return None
+
+        try:
+            future = self._submit_battery_read(force)
+        except BleakError as err:
+            self._on_battery_poll_error(err)
+            return None
+        future.add_done_callback(
+            functools.partial(self._on_battery_poll_done, force)
+        )
+        return future
+
+    def _defer_battery_poll(self) -> None:
+        """Re-arm a deferred poll on whatever unblocks it instead of re-sleeping."""
+        if self._pending_ops:
+            # 前台操作排空后由 actor 重新排程
+            self._battery_poll_after_ops = True
+            self._last_battery_sleep_reason = "defer_for_foreground"
+            return
+        quiet_left = BATTERY_POLL_ALARM_QUIET_SECONDS - (
+            time.monotonic() - self._last_alarm_operation_ts
+        )
+        if quiet_left > 0:
+            self._schedule_battery_poll(quiet_left, "defer_for_alarm")
+            return
+        if self._battery_scheduler is not None:
+            # 全局连接槽位已满：挂起直到连接管理器释放槽位
+            self._last_battery_sleep_reason = "defer_for_slot"
+            self._battery_scheduler.async_wait_for_slot(
+                self.address, self._async_on_battery_timer
+            )
+            return
+        self._schedule_battery_poll(15.0, "defer_for_foreground")
+
+    def _on_battery_poll_done(
+        self, force_connect: bool, future: asyncio.Future[Any]
+    ) -> None:
+        if future.cancelled():
+            return
+        err = future.exception()
+        self._check_startup_ready(settled=err is not None or self._battery is None)
+        if isinstance(err, (BleakError, TimeoutError, OSError)):
+            self._on_battery_poll_error(err)
+            return
+        if err is not None:
+            _LOGGER.debug("Battery poll failed for %s: %s", self.address, err)
+        self._schedule_next_battery_poll(force_connect)
+
+    def _on_battery_poll_error(self, err: BaseException) -> None:
+        self._last_error = f"电量轮询异常: {err}"
+        self._async_dispatch_update()
+        # 避免异常路径下立即重入
+        self._schedule_battery_poll(60.0, "poll_error")
@@ -1,5 +1,6 @@
 """Diagnostics support for anti_loss_tag integration."""
 
+import time
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
@@ -8,17 +9,35 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers import device_registry as dr
 
 from . import BleConnectionManager
+from .advertisement_router import AdvertisementRouter
+from .battery_scheduler import BatteryPollScheduler
+from .startup_planner import StartupPlanner
+from .update_batcher import EntityUpdateBatcher
 from .const import (
     CONF_ADDRESS,
+    CONF_ADVERT_AGGREGATION_WINDOW_MS,
+    CONF_BUTTON_LONG_PRESS_MS,
+    CONF_BUTTON_MULTI_PRESS_WINDOW_MS,
     CONF_ALARM_ON_DISCONNECT,
     CONF_AUTO_RECONNECT,
     CONF_BATTERY_POLL_INTERVAL_MIN,
     CONF_MAINTAIN_CONNECTION,
     CONF_NAME,
+    CONF_RSSI_DEADBAND_DB,
+    CONF_RSSI_FILTER,
+    CONF_RSSI_MAX_PUBLISH_INTERVAL_S,
+    CONF_RSSI_MIN_PUBLISH_INTERVAL_S,
+    DEFAULT_ADVERT_AGGREGATION_WINDOW_MS,
+    DEFAULT_BUTTON_LONG_PRESS_MS,
+    DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS,
     DEFAULT_ALARM_ON_DISCONNECT,
     DEFAULT_AUTO_RECONNECT,
     DEFAULT_BATTERY_POLL_INTERVAL_MIN,
     DEFAULT_MAINTAIN_CONNECTION,
+    DEFAULT_RSSI_DEADBAND_DB,
+    DEFAULT_RSSI_FILTER,
+    DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S,
+    DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S,
     DOMAIN,
 )
 
@@ -82,6 +101,69 @@ async def async_get_config_entry_diagnostics(
                 "average_wait_ms": round(conn_mgr.average_wait_ms, 2),
             }
 
+    # Get advertisement router stats (if available)
+    advert_router_info = {}
+    router: AdvertisementRouter | None = hass.data.get(DOMAIN, {}).get(
+        "_advert_router"
+    )
+    if router:
+        advert_router_info = {
+            "registered": router.registered,
+            "attached": router.attached,
+            "routed": router.routed,
+            "unrouted": router.unrouted,
+        }
+
+    # Get battery scheduler stats (if available)
+    battery_scheduler_info = {}
+    scheduler: BatteryPollScheduler | None = hass.data.get(DOMAIN, {}).get(
+        "_battery_scheduler"
+    )
+    if scheduler:
+        battery_scheduler_info = {
+            "max_concurrent": scheduler.max_concurrent,
+            "max_per_minute": scheduler.max_per_minute,
+            "scheduled": scheduler.scheduled,
+            "waiting_for_slot": scheduler.waiting_for_slot,
+            "in_flight": scheduler.in_flight,
+            "dispatched_total": scheduler.dispatched_total,
+            "budget_waits": scheduler.budget_waits,
+        }
+
+    # Get startup planner stats (if available)
+    startup_planner_info = {}
+    planner: StartupPlanner | None = hass.data.get(DOMAIN, {}).get("_startup_planner")
+    if planner:
+        ttfr = planner.time_to_fleet_ready
+        startup_planner_info = {
+            "fleet_size": planner.fleet_size,
+            "slot_capacity": planner.slot_capacity,
+            "spacing_seconds": round(planner.spacing_seconds, 3),
+            "window_seconds": round(planner.window_seconds, 1),
+            "reserved_total": planner.reserved_total,
+            "ready_total": planner.ready_total,
+            "outstanding": planner.outstanding,
+            "time_to_fleet_ready_s": None if ttfr is None else round(ttfr, 1),
+        }
+
+    # Get update batcher stats (if available)
+    update_batcher_info = {}
+    batcher: EntityUpdateBatcher | None = hass.data.get(DOMAIN, {}).get(
+        "_update_batcher"
+    )
+    if batcher:
+        update_batcher_info = {
+            "interval": batcher.interval,
+            "pending": batcher.pending,
+            "marks_total": batcher.marks_total,
+            "writes_saved": batcher.writes_saved,
+            "flush_count": batcher.flush_count,
+            "devices_flushed": batcher.devices_flushed,
+            "average_flush_latency_ms": round(batcher.average_flush_latency_ms, 2),
+            "max_flush_latency_ms": round(batcher.max_flush_latency_ms, 2),
+            "last_flush_latency_ms": round(batcher.last_flush_latency_ms, 2),
+        }
+
     # Redact sensitive address (show only first 6 chars)
     address_redacted = device.address[:6] + "****" if device.address else None
 
@@ -103,11 +185,43 @@ async def async_get_config_entry_diagnostics(
             CONF_BATTERY_POLL_INTERVAL_MIN: entry.options.get(
                 CONF_BATTERY_POLL_INTERVAL_MIN, DEFAULT_BATTERY_POLL_INTERVAL_MIN
             ),
+            CONF_RSSI_DEADBAND_DB: entry.options.get(
+                CONF_RSSI_DEADBAND_DB, DEFAULT_RSSI_DEADBAND_DB
+            ),
+            CONF_RSSI_MIN_PUBLISH_INTERVAL_S: entry.options.get(
+                CONF_RSSI_MIN_PUBLISH_INTERVAL_S, DEFAULT_RSSI_MIN_PUBLISH_INTERVAL_S
+            ),
+            CONF_RSSI_MAX_PUBLISH_INTERVAL_S: entry.options.get(
+                CONF_RSSI_MAX_PUBLISH_INTERVAL_S, DEFAULT_RSSI_MAX_PUBLISH_INTERVAL_S
+            ),
+            CONF_RSSI_FILTER: entry.options.get(CONF_RSSI_FILTER, DEFAULT_RSSI_FILTER),
+            CONF_ADVERT_AGGREGATION_WINDOW_MS: entry.options.get(
+                CONF_ADVERT_AGGREGATION_WINDOW_MS, DEFAULT_ADVERT_AGGREGATION_WINDOW_MS
+            ),
+            CONF_BUTTON_MULTI_PRESS_WINDOW_MS: entry.options.get(
+                CONF_BUTTON_MULTI_PRESS_WINDOW_MS, DEFAULT_BUTTON_MULTI_PRESS_WINDOW_MS
+            ),
+            CONF_BUTTON_LONG_PRESS_MS: entry.options.get(
+                CONF_BUTTON_LONG_PRESS_MS, DEFAULT_BUTTON_LONG_PRESS_MS
+            ),
         },
         "device_state": {
             "available": device.available,
             "connected": device.connected,
             "rssi": device.rssi,
+            "rssi_raw": device.rssi_raw,
+            "rssi_smoothed": device.rssi_smoothed,
+            "rssi_variance": device.rssi_variance,
+            "rssi_sample_rate": device.rssi_sample_rate,
+            "adverts_received": device.adverts_received,
+            "adverts_processed": device.adverts_processed,
+            "advert_aggregation_window": device.advert_aggregation_window,
+            "button_gestures": device.button_gesture_counts,
+            "last_advert_aggregate": device.last_advert_aggregate,
+            "presence_interval_p95": device.presence_interval_p95,
+            "presence_timeout": device.presence_timeout,
+            "presence_timeouts": device.presence_timeouts,
+            "last_loss_detection_latency": device.last_loss_detection_latency,
             "battery": device.battery,
             "last_seen": device.last_seen.isoformat() if device.last_seen else None,
             "last_battery_read": (
@@ -128,25 +242,58 @@ async def async_get_config_entry_diagnostics(
             "operation_worker_running": device.operation_worker_running,
             "battery_read_busy": device.battery_read_busy,
             "battery_defer_count": device.battery_defer_count,
+            "battery_reads_total": device.battery_reads_total,
+            "battery_piggyback_reads": device.battery_piggyback_reads,
+            "battery_cache_hits": device.battery_cache_hits,
+            "battery_cache_misses": device.battery_cache_misses,
+            "battery_read_joins": device.battery_read_joins,
+            "battery_update_mode": device.battery_update_mode,
+            "battery_notifications": device.battery_notifications,
+            "battery_poll_parked": device.battery_poll_parked,
+            "battery_polls_parked": device.battery_polls_parked,
+            "battery_model_samples": device.battery_model_samples,
+            "battery_drain_per_hour": (
+                None
+                if device.battery_drain_per_hour is None
+                else round(device.battery_drain_per_hour, 4)
+            ),
             "last_battery_sleep_seconds": round(device.last_battery_sleep_seconds, 2),
             "last_battery_sleep_reason": device.last_battery_sleep_reason,
             "adaptive_mode": device.adaptive_mode,
             "adaptive_timeout_ratio": round(device.adaptive_timeout_ratio, 4),
+            "preempt_count": device.preempt_count,
+            "preempt_wait_ms_total": round(device.preempt_wait_ms_total, 1),
+            "last_preempt_wait_ms": round(device.last_preempt_wait_ms, 1),
+            "alarm_active": device.alarm_active,
+            "alarm_stop_skipped": device.alarm_stop_skipped,
+            "listener_calls": device.listener_calls,
+            "listener_calls_skipped": device.listener_calls_skipped,
+            "circuit_breaker": {
+                "state": device.circuit_breaker.state,
+                "consecutive_failures": device.circuit_breaker.consecutive_failures,
+                "cooloff_remaining": round(device.circuit_breaker.cooloff_remaining, 1),
+                "open_count": device.circuit_breaker.open_count,
+                "rejected_count": device.circuit_breaker.rejected_count,
+            },
         },
         "connection_state": {
             "client_exists": device._client is not None,
             "conn_slot_acquired": device._conn_slot_acquired,
             "connect_fail_count": device._connect_fail_count,
-            "cooldown_active": device._cooldown_until_ts > 0,
+            "cooldown_active": device._cooldown_until_ts > time.monotonic(),
             "cached_characteristics": len(device._cached_chars)
             if device._cached_chars
             else 0,
-            "battery_task_running": device._battery_task is not None
-            and not device._battery_task.done(),
-            "connect_task_running": device._connect_task is not None
-            and not device._connect_task.done(),
+            "actor_running": device.operation_worker_running,
+            "mailbox_size": device.mailbox_size,
+            "battery_timer_armed": device.battery_timer_armed,
+            "connect_pending": device._connect_wanted,
         },
         "connection_manager": conn_mgr_info,
+        "battery_scheduler": battery_scheduler_info,
+        "startup_planner": startup_planner_info,
+        "update_batcher": update_batcher_info,
+        "advert_router": advert_router_info,
         "device_info": device_info,
         "entities": entities,
     }
@@ -9,6 +9,7 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .device import AntiLossTagDevice, ButtonEvent
+from .gesture import GESTURE_TYPES
 from .entity_mixin import AntiLossTagEntityMixin
 
 
@@ -22,7 +23,8 @@ async def async_setup_entry(
 class AntiLossTagButtonEventEntity(AntiLossTagEntityMixin, EventEntity):
     _attr_has_entity_name = True
     _attr_device_class = EventDeviceClass.BUTTON
-    _attr_event_types = ["press"]
+    # press 每次按下立即触发；其余为手势识别结果
+    _attr_event_types = ["press", *GESTURE_TYPES]
     _attr_parallel_updates = 1
 
     def __init__(self, device: AntiLossTagDevice) -> None:
@@ -42,6 +44,6 @@ class AntiLossTagButtonEventEntity(AntiLossTagEntityMixin, EventEntity):
     @callback
     def _async_on_button(self, event: ButtonEvent) -> None:
         self._trigger_event(
-            "press", {"entity_id": self.entity_id, "raw_hex": event.raw.hex()}
+            event.gesture, {"entity_id": self.entity_id, "raw_hex": event.raw.hex()}
         )
         self.async_write_ha_state()
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+GESTURE_SINGLE = "single"
+GESTURE_DOUBLE = "double"
+GESTURE_TRIPLE = "triple"
+GESTURE_LONG = "long"
+GESTURE_TYPES = (GESTURE_SINGLE, GESTURE_DOUBLE, GESTURE_TRIPLE, GESTURE_LONG)
+
+_MULTI_PRESS_GESTURES = {1: GESTURE_SINGLE, 2: GESTURE_DOUBLE, 3: GESTURE_TRIPLE}
+
+# 手势回调：(手势类型, 最后一次按下的原始数据)
+GestureCallback = Callable[[str, bytes], None]
+
+
+class ButtonGestureRecognizer:
+    """
+    单设备按键手势状态机（由 FFE1 通知驱动，计时使用 loop.call_later）：
+    - 连击窗口内的按下次数决定 single / double / triple，第 3 次按下立即结束
+    - 连击窗口为 0 时关闭多击识别：按下完成即发出 single（快速路径，不增加延迟）
+    - 长按需要固件上报松开：观察到松开后，按住超过长按阈值发出 long；
+      未观察到松开的固件把每次按下视为瞬时点击，不会误判为长按
+    """
+
+    __slots__ = (
+        "_loop",
+        "_emit",
+        "_multi_press_window",
+        "_long_press",
+        "_count",
+        "_held",
+        "_release_seen",
+        "_last_raw",
+        "_window_handle",
+        "_long_handle",
+    )
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        emit: GestureCallback,
+        *,
+        multi_press_window: float,
+        long_press: float,
+    ) -> None:
+        """Initialize gesture recognizer."""
+        self._loop = loop
+        self._emit = emit
+        self._multi_press_window = 0.0
+        self._long_press = 0.0
+        self._count = 0
+        self._held = False
+        self._release_seen = False
+        self._last_raw = b""
+        self._window_handle: asyncio.TimerHandle | None = None
+        self._long_handle: asyncio.TimerHandle | None = None
+        self.configure(multi_press_window=multi_press_window, long_press=long_press)
+
+    @property
+    def multi_press_window(self) -> float:
+        """Return the multi-press window in seconds (0 = disabled)."""
+        return self._multi_press_window
+
+    @property
+    def long_press(self) -> float:
+        """Return the long-press threshold in seconds (0 = disabled)."""
+        return self._long_press
+
+    @property
+    def release_seen(self) -> bool:
+        """Return True once the firmware has reported a button release."""
+        return self._release_seen
+
+    def configure(self, *, multi_press_window: float, long_press: float) -> None:
+        """Update windows; a pending sequence is resolved with the old settings."""
+        if self._window_handle is not None:
+            self._window_handle.cancel()
+            self._async_on_window_closed()
+        self._multi_press_window = max(0.0, float(multi_press_window))
+        self._long_press = max(0.0, float(long_press))
+
+    def press(self, raw: bytes) -> None:
+        """Handle a button-down notification."""
+        self._held = True
+        self._last_raw = raw
+        self._count += 1
+        if self._window_handle is not None:
+            self._window_handle.cancel()
+            self._window_handle = None
+        if self._release_seen and self._long_press > 0:
+            # 等待松开或长按超时
+            self._cancel_long()
+            self._long_handle = self._loop.call_later(
+                self._long_press, self._async_on_long_press
+            )
+            return
+        self._press_completed()
+
+    def release(self) -> None:
+        """Handle a button-up notification."""
+        self._release_seen = True
+        if not self._held:
+            return
+        self._held = False
+        if self._long_handle is not None:
+            # 长按阈值前松开：记为一次短按
+            self._cancel_long()
+            self._press_completed()
+
+    def cancel(self) -> None:
+        """Drop the pending sequence without emitting."""
+        self._cancel_long()
+        if self._window_handle is not None:
+            self._window_handle.cancel()
+            self._window_handle = None
+        self._count = 0
+        self._held = False
+
+    def _cancel_long(self) -> None:
+        if self._long_handle is not None:
+            self._long_handle.cancel()
+            self._long_handle = None
+
+    def _press_completed(self) -> None:
+        if self._multi_press_window <= 0:
+            # 快速路径：未启用多击识别，按下完成立即发出 single
+            self._count = 0
+            self._fire(GESTURE_SINGLE)
+            return
+        if self._count >= len(_MULTI_PRESS_GESTURES):
+            self._count = 0
+            self._fire(GESTURE_TRIPLE)
+            return
+        self._window_handle = self._loop.call_later(
+            self._multi_press_window, self._async_on_window_closed
+        )
+
+    def _async_on_window_closed(self) -> None:
+        self._window_handle = None
+        count, self._count = self._count, 0
+        gesture = _MULTI_PRESS_GESTURES.get(count)
+        if gesture is not None:
+            self._fire(gesture)
+
+    def _async_on_long_press(self) -> None:
+        self._long_handle = None
+        # 长按结束当前序列（之前的短按并入本次长按）
+        self._count = 0
+        self._fire(GESTURE_LONG)
+
+    def _fire(self, gesture: str) -> None:
+        try:
+            self._emit(gesture, self._last_raw)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Error dispatching button gesture %s", gesture)
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections.abc import Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PresenceTimerWheel:
+    """
+    全车队共享的离线检测时间轮：
+    - 所有标签共用一个周期 tick（无标签登记时停止），不为每个设备创建定时器
+    - 每条广播只更新截止时间（O(1) 字典写入），不移动槽位
+    - tick 到达某槽位时惰性检查：截止时间已推后的重新入槽，已过期的触发回调
+    - 检测精度为一个 tick
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        tick_seconds: float = 1.0,
+        slots: int = 64,
+    ) -> None:
+        """Initialize presence timer wheel."""
+        self._loop = loop
+        self._tick = max(0.001, float(tick_seconds))
+        self._slots: list[set[Hashable]] = [set() for _ in range(max(2, int(slots)))]
+        self._cursor = 0
+        self._cursor_time = time.monotonic()
+        self._deadlines: dict[Hashable, float] = {}
+        self._callbacks: dict[Hashable, Callable[[], None]] = {}
+        self._slot_of: dict[Hashable, int] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._expired_total = 0
+
+    @property
+    def tracked(self) -> int:
+        """Return number of keys with an armed deadline."""
+        return len(self._slot_of)
+
+    @property
+    def expired_total(self) -> int:
+        """Return total number of expirations fired."""
+        return self._expired_total
+
+    @property
+    def running(self) -> bool:
+        """Return True while the wheel is ticking."""
+        return self._handle is not None
+
+    def async_touch(
+        self, key: Hashable, deadline: float, callback: Callable[[], None]
+    ) -> None:
+        """Arm or push back the deadline (monotonic seconds) for a key."""
+        self._deadlines[key] = deadline
+        if key in self._slot_of:
+            return
+        self._callbacks[key] = callback
+        idle = self._handle is None
+        if idle:
+            # 空闲后重新开始计时：以当前时刻为游标基准
+            self._cursor_time = time.monotonic()
+        self._insert(key, deadline)
+        if idle:
+            self._schedule_tick()
+
+    def async_cancel(self, key: Hashable) -> None:
+        """Forget a key."""
+        self._deadlines.pop(key, None)
+        self._callbacks.pop(key, None)
+        slot = self._slot_of.pop(key, None)
+        if slot is not None:
+            self._slots[slot].discard(key)
+        if not self._slot_of:
+            self._stop()
+
+    def async_shutdown(self) -> None:
+        """Stop ticking and drop all keys."""
+        self._stop()
+        for bucket in self._slots:
+            bucket.clear()
+        self._deadlines.clear()
+        self._callbacks.clear()
+        self._slot_of.clear()
+
+    def _insert(self, key: Hashable, deadline: float) -> None:
+        ticks = math.ceil((deadline - self._cursor_time) / self._tick)
+        # 超出一圈的截止时间先放在最远槽位，到达时再惰性重排
+        ticks = min(max(1, ticks), len(self._slots) - 1)
+        slot = (self._cursor + ticks) % len(self._slots)
+        self._slots[slot].add(key)
+        self._slot_of[key] = slot
+
+    def _schedule_tick(self) -> None:
+        delay = max(0.0, self._cursor_time + self._tick - time.monotonic())
+        self._handle = self._loop.call_later(delay, self._async_on_tick)
+
+    def _stop(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _async_on_tick(self) -> None:
+        self._handle = None
+        self._cursor = (self._cursor + 1) % len(self._slots)
+        self._cursor_time += self._tick
+        now = time.monotonic()
+
+        bucket = self._slots[self._cursor]
+        self._slots[self._cursor] = set()
+        expired: list[Callable[[], None]] = []
+        for key in bucket:
+            del self._slot_of[key]
+            if self._deadlines[key] > now:
+                self._insert(key, self._deadlines[key])
+                continue
+            del self._deadlines[key]
+            expired.append(self._callbacks.pop(key))
+
+        if self._slot_of:
+            self._schedule_tick()
+
+        for callback in expired:
+            self._expired_total += 1
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error in presence timeout callback")
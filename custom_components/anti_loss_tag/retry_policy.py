@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+
+from .utils.constants import MAX_CONNECT_BACKOFF_SECONDS, MIN_CONNECT_BACKOFF_SECONDS
+
+# 连接层失败分类中可重试的类型（与 _connection_error_classification 对应）
+RETRYABLE_CLASSIFICATIONS = frozenset(
+    {"slot_timeout", "connect_error", "scanner_unavailable"}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """单一用途的重试策略（连接层与操作层共享同一预算）。"""
+
+    name: str
+    max_retries: int
+    base_delay: float
+    max_delay: float
+    budget_seconds: float
+    # 交给 bleak_retry_connector.establish_connection 的内部尝试次数
+    connect_attempts: int
+    retryable_classifications: frozenset[str] = RETRYABLE_CLASSIFICATIONS
+
+    def new_session(self) -> RetrySession:
+        """Start a new retry session bound to this policy."""
+        return RetrySession(self)
+
+    def is_retryable(self, classification: str | None, err: Exception) -> bool:
+        """Return True if the failure may be retried under this policy."""
+        if classification in self.retryable_classifications:
+            return True
+        return isinstance(err, (TimeoutError, OSError))
+
+
+class RetrySession:
+    """
+    一次操作（或一段后台重连）的重试会话：
+    - 退避使用 decorrelated jitter：delay = min(cap, uniform(base, prev * 3))
+    - 使用 monotonic 时钟计算总预算截止时间
+    - 连接退避与操作重试从同一会话取值，避免整体重试次数叠加
+    """
+
+    __slots__ = ("policy", "retries", "_deadline", "_prev_delay")
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        """Initialize retry session."""
+        self.policy = policy
+        self.retries = 0
+        self._deadline = time.monotonic() + policy.budget_seconds
+        self._prev_delay = policy.base_delay
+
+    @property
+    def remaining_budget(self) -> float:
+        """Return remaining budget seconds."""
+        return max(0.0, self._deadline - time.monotonic())
+
+    @property
+    def exhausted(self) -> bool:
+        """Return True when no further retry is allowed."""
+        return (
+            self.retries >= self.policy.max_retries or self.remaining_budget <= 0.0
+        )
+
+    def next_delay(self) -> float | None:
+        """Draw the next backoff delay, or None when the budget is exhausted."""
+        remaining = self.remaining_budget
+        if remaining <= 0.0:
+            return None
+        policy = self.policy
+        upper = max(policy.base_delay, self._prev_delay * 3.0)
+        delay = min(policy.max_delay, random.uniform(policy.base_delay, upper))
+        if delay >= remaining:
+            return None
+        self._prev_delay = delay
+        return delay
+
+
+RETRY_POLICIES: dict[str, RetryPolicy] = {
+    # 用户触发报警：快速、少量重试，尽快给出结果
+    "interactive_alarm": RetryPolicy(
+        name="interactive_alarm",
+        max_retries=2,
+        base_delay=0.3,
+        max_delay=2.0,
+        budget_seconds=12.0,
+        connect_attempts=2,
+    ),
+    # 断开报警策略同步：允许稍长的等待
+    "policy_sync": RetryPolicy(
+        name="policy_sync",
+        max_retries=2,
+        base_delay=0.8,
+        max_delay=5.0,
+        budget_seconds=30.0,
+        connect_attempts=3,
+    ),
+    # 后台读电量：失败后尽快让出，由下一轮轮询兜底
+    "background_battery": RetryPolicy(
+        name="background_battery",
+        max_retries=1,
+        base_delay=float(MIN_CONNECT_BACKOFF_SECONDS),
+        max_delay=float(MAX_CONNECT_BACKOFF_SECONDS),
+        budget_seconds=90.0,
+        connect_attempts=1,
+    ),
+    # 保持连接的后台重连
+    "general": RetryPolicy(
+        name="general",
+        max_retries=0,
+        base_delay=float(MIN_CONNECT_BACKOFF_SECONDS),
+        max_delay=float(MAX_CONNECT_BACKOFF_SECONDS),
+        budget_seconds=300.0,
+        connect_attempts=2,
+    ),
+}
+
+
+def get_retry_policy(purpose: str) -> RetryPolicy:
+    """Return the retry policy for a connect/operation purpose."""
+    return RETRY_POLICIES.get(purpose, RETRY_POLICIES["general"])
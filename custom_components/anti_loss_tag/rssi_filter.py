@@ -0,0 +1,139 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import math
+from array import array
+
+from .utils.constants import (
+    RSSI_EMA_ALPHA,
+    RSSI_KALMAN_MEASUREMENT_NOISE,
+    RSSI_KALMAN_PROCESS_NOISE,
+    RSSI_RING_SIZE,
+)
+
+RSSI_FILTER_EMA = "ema"
+RSSI_FILTER_KALMAN = "kalman"
+RSSI_FILTER_MODES = (RSSI_FILTER_EMA, RSSI_FILTER_KALMAN)
+
+
+class RssiFilter:
+    """
+    单设备 RSSI 平滑滤波器：
+    - 固定大小环形缓冲区保存 (monotonic 时间, RSSI) 样本，使用 array 而非 Python 对象
+      （默认 32 个样本约 300 字节，内存与运行时长无关）
+    - 支持 EMA 或一维 Kalman 滤波输出平滑值
+    - 基于缓冲区计算方差与采样率，供在线/距离判断使用
+    """
+
+    __slots__ = (
+        "_mode",
+        "_times",
+        "_values",
+        "_size",
+        "_index",
+        "_count",
+        "_estimate",
+        "_error",
+    )
+
+    def __init__(self, mode: str = RSSI_FILTER_EMA, size: int = RSSI_RING_SIZE) -> None:
+        """Initialize RSSI filter."""
+        self._mode = mode if mode in RSSI_FILTER_MODES else RSSI_FILTER_EMA
+        self._size = max(2, int(size))
+        self._times = array("d", bytes(8 * self._size))
+        # RSSI 取值范围 -128..127 dBm，单字节即可
+        self._values = array("b", bytes(self._size))
+        self._index = 0
+        self._count = 0
+        self._estimate: float | None = None
+        self._error = RSSI_KALMAN_MEASUREMENT_NOISE
+
+    @property
+    def mode(self) -> str:
+        """Return filter mode (ema / kalman)."""
+        return self._mode
+
+    @property
+    def sample_count(self) -> int:
+        """Return number of buffered samples."""
+        return self._count
+
+    @property
+    def smoothed(self) -> float | None:
+        """Return the filtered RSSI estimate."""
+        return self._estimate
+
+    @property
+    def variance(self) -> float | None:
+        """Return the sample variance of buffered RSSI values."""
+        count = self._count
+        if count < 2:
+            return None
+        values = self._values[:count] if count < self._size else self._values
+        mean = sum(values) / count
+        return sum((v - mean) ** 2 for v in values) / (count - 1)
+
+    @property
+    def sample_rate(self) -> float | None:
+        """Return the advertisement rate (Hz) over the buffered window."""
+        count = self._count
+        if count < 2:
+            return None
+        newest = self._times[(self._index - 1) % self._size]
+        oldest = self._times[self._index % self._size if count == self._size else 0]
+        span = newest - oldest
+        if span <= 0:
+            return None
+        return (count - 1) / span
+
+    def interval_percentile(self, fraction: float) -> float | None:
+        """Return the given percentile of inter-sample intervals in seconds."""
+        count = self._count
+        if count < 3:
+            return None
+        size = self._size
+        start = self._index if count == size else 0
+        times = self._times
+        intervals = sorted(
+            times[(start + i + 1) % size] - times[(start + i) % size]
+            for i in range(count - 1)
+        )
+        position = math.ceil(fraction * len(intervals)) - 1
+        return intervals[min(len(intervals) - 1, max(0, position))]
+
+    def add(self, timestamp: float, rssi: int) -> float:
+        """Record a sample and return the updated estimate."""
+        index = self._index
+        self._times[index] = timestamp
+        # 热路径：用比较代替 max/min 调用
+        if rssi < -128:
+            rssi = -128
+        elif rssi > 127:
+            rssi = 127
+        self._values[index] = rssi
+        index += 1
+        self._index = 0 if index == self._size else index
+        if self._count < self._size:
+            self._count += 1
+
+        estimate = self._estimate
+        if estimate is None:
+            estimate = float(rssi)
+        elif self._mode == RSSI_FILTER_KALMAN:
+            error = self._error + RSSI_KALMAN_PROCESS_NOISE
+            gain = error / (error + RSSI_KALMAN_MEASUREMENT_NOISE)
+            estimate += gain * (rssi - estimate)
+            self._error = (1.0 - gain) * error
+        else:
+            estimate += RSSI_EMA_ALPHA * (rssi - estimate)
+        self._estimate = estimate
+        return estimate
+
+    def reset(self) -> None:
+        """Drop buffered samples and the current estimate."""
+        self._index = 0
+        self._count = 0
+        self._estimate = None
+        self._error = RSSI_KALMAN_MEASUREMENT_NOISE
@@ -10,14 +10,16 @@ from homeassistant.const import (
     EntityCategory,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.components.sensor import (
+    RestoreSensor,
     SensorEntity,
     SensorDeviceClass,
     SensorStateClass,
 )
 
-from .device import AntiLossTagDevice
+from .device import AntiLossTagDevice, DeviceField
 from .entity_mixin import AntiLossTagEntityMixin
 
 
@@ -29,6 +31,7 @@ async def async_setup_entry(
         [
             AntiLossTagRssiSensor(device, entry),
             AntiLossTagBatterySensor(device, entry),
+            AntiLossTagRssiSmoothedSensor(device, entry),
         ],
         update_before_add=False,
     )
@@ -38,6 +41,8 @@ class _AntiLossTagSensorBase(AntiLossTagEntityMixin, SensorEntity):
     """Base class for AntiLossTag sensors."""
 
     _attr_parallel_updates = 0
+    # 只在这些设备字段变化时写入状态
+    _listen_fields: DeviceField = DeviceField.ALL
 
     def __init__(self, device: AntiLossTagDevice, entry: ConfigEntry) -> None:
         self._dev = device
@@ -45,7 +50,9 @@ class _AntiLossTagSensorBase(AntiLossTagEntityMixin, SensorEntity):
         self._unsub = None
 
     async def async_added_to_hass(self) -> None:
-        self._unsub = self._dev.async_add_listener(self.async_write_ha_state)
+        self._unsub = self._dev.async_add_listener(
+            self.async_write_ha_state, self._listen_fields
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub is not None:
@@ -58,6 +65,7 @@ class AntiLossTagRssiSensor(_AntiLossTagSensorBase):
     _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_fields = DeviceField.RSSI
 
     def __init__(self, device: AntiLossTagDevice, entry: ConfigEntry) -> None:
         super().__init__(device, entry)
@@ -69,21 +77,78 @@ class AntiLossTagRssiSensor(_AntiLossTagSensorBase):
         return self._dev.rssi
 
 
-class AntiLossTagBatterySensor(_AntiLossTagSensorBase):
+class AntiLossTagRssiSmoothedSensor(_AntiLossTagSensorBase):
+    _attr_device_class = SensorDeviceClass.SIGNAL_STRENGTH
+    _attr_native_unit_of_measurement = SIGNAL_STRENGTH_DECIBELS_MILLIWATT
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 1
+    # 与原始信号强度传感器同步发布（平滑值每条广播都会变化）
+    _listen_fields = DeviceField.RSSI
+
+    def __init__(self, device: AntiLossTagDevice, entry: ConfigEntry) -> None:
+        super().__init__(device, entry)
+        self._attr_name = "信号强度（平滑）"
+        self._attr_unique_id = f"{device.address}_rssi_smoothed"
+
+    @property
+    def native_value(self) -> float | None:
+        value = self._dev.rssi_smoothed
+        return round(value, 1) if value is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, float | None]:
+        variance = self._dev.rssi_variance
+        sample_rate = self._dev.rssi_sample_rate
+        return {
+            "variance": round(variance, 2) if variance is not None else None,
+            "sample_rate_hz": round(sample_rate, 3) if sample_rate is not None else None,
+        }
+
+
+class AntiLossTagBatterySensor(_AntiLossTagSensorBase, RestoreSensor):
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _listen_fields = DeviceField.BATTERY | DeviceField.AVAILABLE | DeviceField.CONNECTED
 
     def __init__(self, device: AntiLossTagDevice, entry: ConfigEntry) -> None:
         super().__init__(device, entry)
         self._attr_name = "电量"
         self._attr_unique_id = f"{device.address}_battery"
 
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        # 重启后用上次保存的电量与读取时间预置设备状态，避免所有标签同时强制连接
+        sensor_data = await self.async_get_last_sensor_data()
+        if sensor_data is None or sensor_data.native_value is None:
+            return
+        try:
+            level = int(float(sensor_data.native_value))
+        except (TypeError, ValueError):
+            return
+        read_at = None
+        last_state = await self.async_get_last_state()
+        if last_state is not None:
+            raw = last_state.attributes.get("last_read")
+            if isinstance(raw, str):
+                read_at = dt_util.parse_datetime(raw)
+        self._dev.async_restore_battery(level, read_at)
+
     @property
     def native_value(self) -> int | None:
         return self._dev.battery
 
+    @property
+    def extra_state_attributes(self) -> dict[str, str | None]:
+        last_read = self._dev.last_battery_read
+        return {
+            "last_read": last_read.isoformat() if last_read is not None else None,
+            "update_mode": self._dev.battery_update_mode,
+        }
+
     @property
     def available(self) -> bool:
         # 设备可用即可，电量值可能为 None（显示 unknown）
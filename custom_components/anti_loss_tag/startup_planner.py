@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable, Hashable
+
+
+class StartupPlanner:
+    """
+    集成级启动错峰规划器：
+    - 每个设备启动时领取一个启动时隙，首次连接与首次电量读取都排在该时隙
+    - 相邻时隙间隔 = 单次连接耗时 / 连接槽位数，窗口随车队规模与槽位容量线性伸缩
+    - 交互操作（报警等）直接进入设备操作队列，不受时隙限制
+    - 记录从第一台设备领取时隙到全部设备就绪的耗时（time-to-fleet-ready）
+    - 车队规模可传入回调，在读取时计算（条目增删后窗口随之变化）
+    """
+
+    def __init__(
+        self,
+        *,
+        fleet_size: int | Callable[[], int],
+        slot_capacity: int,
+        seconds_per_connect: float,
+        min_delay: float = 0.5,
+    ) -> None:
+        """Initialize startup planner."""
+        self._fleet_size = fleet_size
+        self._slot_capacity = max(1, int(slot_capacity))
+        self._spacing = max(0.0, float(seconds_per_connect)) / self._slot_capacity
+        self._min_delay = max(0.0, float(min_delay))
+        self._next_at = 0.0
+        self._wave_started: float | None = None
+        self._outstanding: set[Hashable] = set()
+        self._reserved_total = 0
+        self._ready_total = 0
+        self._time_to_fleet_ready: float | None = None
+
+    @property
+    def fleet_size(self) -> int:
+        """Return the expected number of devices."""
+        size = self._fleet_size() if callable(self._fleet_size) else self._fleet_size
+        return max(1, int(size))
+
+    @property
+    def slot_capacity(self) -> int:
+        """Return the number of concurrent connection slots planned for."""
+        return self._slot_capacity
+
+    @property
+    def spacing_seconds(self) -> float:
+        """Return the gap between consecutive startup slots."""
+        return self._spacing
+
+    @property
+    def window_seconds(self) -> float:
+        """Return the planned startup window for the expected fleet."""
+        return self._min_delay + self._spacing * self.fleet_size
+
+    @property
+    def reserved_total(self) -> int:
+        """Return total startup slots handed out."""
+        return self._reserved_total
+
+    @property
+    def outstanding(self) -> int:
+        """Return number of devices not yet ready."""
+        return len(self._outstanding)
+
+    @property
+    def ready_total(self) -> int:
+        """Return number of devices that reported ready."""
+        return self._ready_total
+
+    @property
+    def time_to_fleet_ready(self) -> float | None:
+        """Return seconds from the first slot to the last device ready (None while pending)."""
+        return self._time_to_fleet_ready
+
+    def async_reserve(self, key: Hashable) -> float:
+        """Reserve the next startup slot for a key; return its delay in seconds."""
+        now = time.monotonic()
+        if not self._outstanding:
+            # 新一轮启动（首次启动或之后单独新增/重载的设备）
+            self._wave_started = now
+            self._time_to_fleet_ready = None
+        earliest = now + self._min_delay
+        at = self._next_at if self._next_at > earliest else earliest
+        self._next_at = at + self._spacing
+        self._outstanding.add(key)
+        self._reserved_total += 1
+        # 时隙内加少量抖动，避免与广播触发的其他工作严格对齐
+        return at - now + random.uniform(0.0, self._spacing * 0.25)
+
+    def async_mark_ready(self, key: Hashable) -> None:
+        """Record that a key finished its startup work."""
+        if key not in self._outstanding:
+            return
+        self._outstanding.discard(key)
+        self._ready_total += 1
+        if not self._outstanding and self._wave_started is not None:
+            self._time_to_fleet_ready = time.monotonic() - self._wave_started
+
+    def async_forget(self, key: Hashable) -> None:
+        """Drop a key (device stopped before it became ready)."""
+        self._outstanding.discard(key)
+        if not self._outstanding and self._wave_started is not None:
+            self._time_to_fleet_ready = time.monotonic() - self._wave_started
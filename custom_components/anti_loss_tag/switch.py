@@ -9,7 +9,7 @@ from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .device import AntiLossTagDevice
+from .device import AntiLossTagDevice, DeviceField
 from .entity_mixin import AntiLossTagEntityMixin
 
 
@@ -35,7 +35,9 @@ class AntiLossTagDisconnectAlarmPolicySwitch(AntiLossTagEntityMixin, SwitchEntit
         self._attr_unique_id = f"{device.address}_alarm_on_disconnect"
 
     async def async_added_to_hass(self) -> None:
-        self._unsub = self._dev.async_add_listener(self.async_write_ha_state)
+        self._unsub = self._dev.async_add_listener(
+            self.async_write_ha_state, DeviceField.POLICY
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         if self._unsub is not None:
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: MIT
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EntityUpdateBatcher:
+    """
+    集成级实体更新批处理器：
+    - 设备每次状态变化都标记自身为脏（登记 flush 回调），不立即分发
+    - 空闲后的首次标记在下一个事件循环 tick 刷新（首沿），之后两次刷新至少间隔
+      interval 秒，窗口内的标记合并到尾沿刷新（同一设备每个窗口最多写一次）
+    - 代理一次性投递大量广播时，把 N 个设备的多次变化合并为一次批量刷新
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, interval: float = 0.0) -> None:
+        """Initialize update batcher."""
+        self._loop = loop
+        self._interval = max(0.0, float(interval))
+        # flush 回调 -> 首次标记时间（dict 保持登记顺序且自动去重）
+        self._dirty: dict[Callable[[], None], float] = {}
+        self._handle: asyncio.Handle | None = None
+        self._last_flush_ts = float("-inf")
+        self._marks_total = 0
+        self._coalesced_marks = 0
+        self._flush_count = 0
+        self._devices_flushed = 0
+        self._flush_latency_total = 0.0
+        self._max_flush_latency = 0.0
+        self._last_flush_latency = 0.0
+
+    @property
+    def interval(self) -> float:
+        """Return minimum seconds between batch flushes (0 = every loop tick)."""
+        return self._interval
+
+    @property
+    def pending(self) -> int:
+        """Return number of devices waiting for the next flush."""
+        return len(self._dirty)
+
+    @property
+    def marks_total(self) -> int:
+        """Return total dirty marks."""
+        return self._marks_total
+
+    @property
+    def writes_saved(self) -> int:
+        """Return device flushes avoided by merging marks into a pending flush."""
+        return self._coalesced_marks
+
+    @property
+    def flush_count(self) -> int:
+        """Return number of batch flushes."""
+        return self._flush_count
+
+    @property
+    def devices_flushed(self) -> int:
+        """Return total device flushes executed by batches."""
+        return self._devices_flushed
+
+    @property
+    def average_flush_latency_ms(self) -> float:
+        """Return average time from first mark to flush in milliseconds."""
+        if self._devices_flushed <= 0:
+            return 0.0
+        return (self._flush_latency_total / self._devices_flushed) * 1000.0
+
+    @property
+    def max_flush_latency_ms(self) -> float:
+        """Return maximum time from first mark to flush in milliseconds."""
+        return self._max_flush_latency * 1000.0
+
+    @property
+    def last_flush_latency_ms(self) -> float:
+        """Return latency of the most recent batch in milliseconds."""
+        return self._last_flush_latency * 1000.0
+
+    def async_mark_dirty(self, flush: Callable[[], None]) -> None:
+        """Mark a device dirty; its flush callback runs in the next batch."""
+        self._marks_total += 1
+        if flush in self._dirty:
+            self._coalesced_marks += 1
+            return
+        now = time.monotonic()
+        self._dirty[flush] = now
+        if self._handle is None:
+            delay = self._last_flush_ts + self._interval - now
+            if delay > 0:
+                self._handle = self._loop.call_later(delay, self._async_flush)
+            else:
+                self._handle = self._loop.call_soon(self._async_flush)
+
+    def async_discard(self, flush: Callable[[], None]) -> None:
+        """Drop a pending flush (device stopping)."""
+        self._dirty.pop(flush, None)
+
+    def _async_flush(self) -> None:
+        self._handle = None
+        dirty = self._dirty
+        if not dirty:
+            return
+        self._dirty = {}
+        self._flush_count += 1
+        now = time.monotonic()
+        self._last_flush_ts = now
+        oldest = now
+        for flush, marked_at in dirty.items():
+            oldest = min(oldest, marked_at)
+            latency = now - marked_at
+            self._flush_latency_total += latency
+            self._max_flush_latency = max(self._max_flush_latency, latency)
+            self._devices_flushed += 1
+            try:
+                flush()
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Error flushing entity updates")
+        self._last_flush_latency = now - oldest
+
+    def async_shutdown(self) -> None:
+        """Cancel the scheduled flush and drop pending marks."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        self._dirty.clear()
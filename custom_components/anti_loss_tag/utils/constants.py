@@ -10,14 +10,62 @@ BATTERY_POLL_JITTER_SECONDS = 30  # 抖动秒数
 MIN_BATTERY_POLL_INTERVAL_MIN = 5  # 最小轮询间隔（分钟）
 MAX_BATTERY_POLL_INTERVAL_MIN = 7 * 24 * 60  # 最大轮询间隔（7天，分钟）
 
+# 集成级电量轮询调度（全局预算）
+BATTERY_SCHEDULER_MAX_CONCURRENT = 2  # 同时在途的电量读取数（低于连接槽位数，给交互操作留余量）
+BATTERY_SCHEDULER_MAX_PER_MINUTE = 30  # 每分钟最多分发的电量读取数
+BATTERY_POLL_ALARM_QUIET_SECONDS = 8.0  # 报警操作后暂缓后台轮询的窗口（秒）
+BATTERY_PIGGYBACK_MAX_AGE_SECONDS = 3600.0  # 其他原因建立连接时，读数超过该时长才顺带读取电量
+BATTERY_READ_CACHE_TTL_SECONDS = 300.0  # 按需读取电量时，读数在该时长内直接返回缓存值（秒）
+BATTERY_PARK_RESUME_MIN_SECONDS = 1.0  # 标签重新出现后恢复挂起轮询的最短延迟（秒）
+BATTERY_PARK_RESUME_MAX_SECONDS = 5.0  # 最长延迟（秒），多个标签同时出现时错开
+
+# 启动错峰（首次连接与首次电量读取）
+STARTUP_SECONDS_PER_CONNECT = 6.0  # 单次连接 + 服务发现 + 读取的预估耗时（秒）
+STARTUP_MIN_DELAY_SECONDS = 0.5  # 第一个启动时隙的最小延迟（秒）
+
+# 电量放电模型（自适应轮询间隔，配置间隔为上限）
+BATTERY_MODEL_HISTORY_SIZE = 8  # 每设备保留的电量读数个数
+BATTERY_MODEL_MIN_SPAN_SECONDS = 3600.0  # 拟合放电速率所需的最短时间跨度（秒）
+BATTERY_MODEL_LOW_THRESHOLDS = (20, 10, 5)  # 低电量阈值（%，降序；最后一个为临界值）
+BATTERY_MODEL_SAFETY_FACTOR = 0.5  # 预计到达下一阈值时间的该比例内再读一次
+BATTERY_MODEL_LOW_FACTOR = 0.25  # 电量低于首个阈值时的间隔比例
+BATTERY_MODEL_SUDDEN_DROP_PERCENT = 10  # 相邻两次读数下降达到该值视为骤降
+BATTERY_MODEL_DROP_FACTOR = 0.25  # 骤降后的间隔比例
+BATTERY_MODEL_REPLACED_RISE_PERCENT = 20  # 电量回升达到该值视为更换电池
+BATTERY_MODEL_MIN_INTERVAL_SECONDS = 1800.0  # 模型给出的最短间隔（秒）
+
 # 连接退避相关
 MIN_CONNECT_BACKOFF_SECONDS = 2  # 最小退避时间（秒）
 MAX_CONNECT_BACKOFF_SECONDS = 60  # 最大退避时间（秒）
 MAX_CONNECT_FAIL_COUNT = 6  # 最大失败计数（2^6 = 64秒）
 
+# 单设备断路器
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5  # 连续连接失败次数达到后打开
+CIRCUIT_BREAKER_COOLOFF_SECONDS = 120.0  # 打开后的冷却时间（秒）
+
+# 报警状态跟踪
+ALARM_RING_TIMEOUT_SECONDS = 60.0  # 开始报警后视为仍在响铃的最长时间（秒）
+
+# RSSI 平滑滤波
+RSSI_RING_SIZE = 32  # 每设备环形缓冲区样本数
+RSSI_EMA_ALPHA = 0.3  # EMA 平滑系数（越小越平滑）
+RSSI_KALMAN_PROCESS_NOISE = 0.5  # Kalman 过程噪声（dBm²）
+RSSI_KALMAN_MEASUREMENT_NOISE = 8.0  # Kalman 测量噪声（dBm²，约 ±3 dBm 抖动）
+
+# 自适应离线检测（基于实测广播间隔）
+PRESENCE_TIMEOUT_MULTIPLIER = 3.0  # 离线阈值 = k × p95 广播间隔
+PRESENCE_MIN_TIMEOUT_SECONDS = 5.0  # 离线阈值下限（秒）
+PRESENCE_MAX_TIMEOUT_SECONDS = 120.0  # 离线阈值上限（秒），超出使用兜底超时
+PRESENCE_FALLBACK_TIMEOUT_SECONDS = 900.0  # 兜底超时，与 HA 通用广播过期时间一致
+PRESENCE_MIN_SAMPLES = 8  # 至少采集这么多广播后才启用自适应检测
+PRESENCE_RECOMPUTE_EVERY = 32  # 每 N 条广播（缓冲区轮换一圈）重新计算一次 p95
+PRESENCE_WHEEL_TICK_SECONDS = 1.0  # 时间轮 tick（检测精度）
+PRESENCE_WHEEL_SLOTS = 64  # 时间轮槽位数
+
 # BLE 连接相关
 DEFAULT_BLEAK_TIMEOUT = 20.0  # 默认 bleak 超时（秒）
 CONNECTION_SLOT_ACQUIRE_TIMEOUT = 20.0  # 连接槽位获取超时（秒）
 
 # 更新防抖动
 ENTITY_UPDATE_DEBOUNCE_SECONDS = 1.0  # 实体更新防抖动时间（秒）
+ENTITY_UPDATE_BATCH_INTERVAL_SECONDS = ENTITY_UPDATE_DEBOUNCE_SECONDS  # 两次批量刷新的最小间隔（秒）
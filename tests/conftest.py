@@ -9,9 +9,15 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+import asyncio
+from unittest.mock import MagicMock
+
 import pytest
 from homeassistant.core import HomeAssistant
 
+from custom_components.anti_loss_tag.const import DOMAIN
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+
 
 @pytest.fixture
 async def hass():
@@ -34,3 +40,21 @@ def mock_ble_device():
         "service_data": {},
         "service_uuids": [],
     }
+
+
+@pytest.fixture
+def make_device():
+    """构造使用真实事件循环、但不启动 Home Assistant 的设备实例."""
+
+    def _make(options: dict | None = None, address: str = "AA:BB:CC:DD:EE:FF"):
+        loop = asyncio.get_running_loop()
+        hass = MagicMock()
+        hass.loop = loop
+        hass.data = {DOMAIN: {}}
+        hass.async_create_task = lambda coro, *args, **kwargs: loop.create_task(coro)
+        entry = MagicMock()
+        entry.data = {"address": address, "name": "Test Tag"}
+        entry.options = options or {}
+        return AntiLossTagDevice(hass, entry)
+
+    return _make
@@ -0,0 +1,75 @@
+"""测试广播聚合窗口（多代理密集部署）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+
+class TestAdvertAggregation:
+    """测试聚合窗口内只累计计数器."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, make_device):
+        """默认关闭：每条广播都完整处理."""
+        device = make_device()
+        assert device.advert_aggregation_window == 0
+        for rssi in (-60, -61, -62):
+            device._async_on_bluetooth_event(SimpleNamespace(rssi=rssi), None)
+        assert device.adverts_received == 3
+        assert device.adverts_processed == 3
+        assert device.rssi_raw == -62
+
+    @pytest.mark.asyncio
+    async def test_window_processes_one_aggregate(self, make_device):
+        """窗口内的广播只更新计数器，窗口结束时处理一次聚合结果."""
+        device = make_device(options={"advert_aggregation_window_ms": 50})
+        dispatched = []
+        device.async_add_listener(lambda: dispatched.append(1))
+
+        for rssi, source in ((-70, "proxy-a"), (-58, "proxy-b"), (-64, "proxy-c")):
+            device._async_on_bluetooth_event(
+                SimpleNamespace(rssi=rssi, source=source), None
+            )
+        assert device.adverts_received == 3
+        assert device.adverts_processed == 0
+        assert not device.available
+        assert device.rssi_raw is None
+
+        await asyncio.sleep(0.1)
+        assert device.adverts_processed == 1
+        assert device.available
+        assert device.rssi_raw == -64
+        assert device.last_advert_aggregate == {
+            "count": 3,
+            "rssi_min": -70,
+            "rssi_max": -58,
+            "rssi_mean": -64.0,
+            "best_source": "proxy-b",
+        }
+        device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_disabling_flushes_pending_window(self, make_device):
+        """关闭聚合时立即处理已累计的广播."""
+        device = make_device(options={"advert_aggregation_window_ms": 5000})
+        device._async_on_bluetooth_event(SimpleNamespace(rssi=-66), None)
+        assert device.adverts_processed == 0
+
+        device.entry.options = {"advert_aggregation_window_ms": 0}
+        device._load_advert_aggregation_option()
+        assert device.adverts_processed == 1
+        assert device.rssi_raw == -66
+        assert device._advert_window_handle is None
+        device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_window(self, make_device):
+        """停止设备时取消未结束的窗口."""
+        device = make_device(options={"advert_aggregation_window_ms": 20})
+        device._async_on_bluetooth_event(SimpleNamespace(rssi=-66), None)
+        device.async_stop()
+        await asyncio.sleep(0.05)
+        assert device.adverts_processed == 0
@@ -0,0 +1,62 @@
+"""测试广播回调热路径（无 datetime 分配，last_seen 惰性换算）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import timeit
+import tracemalloc
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anti_loss_tag import device as device_module
+
+
+class TestAdvertisementHotPath:
+    """测试广播回调开销."""
+
+    @pytest.mark.asyncio
+    async def test_callback_does_not_build_datetime(self, make_device):
+        """回调只记录 monotonic 时间戳与 RSSI，读取 last_seen 时才构造 datetime."""
+        device = make_device()
+        info = SimpleNamespace(rssi=-61)
+
+        with patch.object(device_module, "datetime") as mock_datetime:
+            device._async_on_bluetooth_event(info, None)
+            mock_datetime.now.assert_not_called()
+
+        assert device.rssi == -61
+        assert device.available
+        last_seen = device.last_seen
+        assert last_seen is not None
+        assert last_seen.tzinfo is timezone.utc
+        assert abs((datetime.now(timezone.utc) - last_seen).total_seconds()) < 1.0
+
+    @pytest.mark.asyncio
+    async def test_callback_microbenchmark(self, make_device):
+        """微基准：稳态下每条广播不产生持久分配."""
+        device = make_device()
+        device.async_add_listener(lambda: None)
+        info = SimpleNamespace(rssi=-60)
+        callback = device._async_on_bluetooth_event
+
+        for _ in range(100):
+            callback(info, None)
+
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            for _ in range(5000):
+                callback(info, None)
+            after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert after - before < 1024
+
+        number = 20000
+        seconds = min(
+            timeit.repeat(lambda: callback(info, None), number=number, repeat=3)
+        )
+        # 宽松上限：只防止热路径退化到每条广播数十微秒以上
+        assert seconds / number < 50e-6
@@ -0,0 +1,115 @@
+"""测试集成级广播路由（单一 FFE0 回调，按地址分发）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.anti_loss_tag import advertisement_router as router_module
+from custom_components.anti_loss_tag import device as device_module
+from custom_components.anti_loss_tag.advertisement_router import AdvertisementRouter
+from custom_components.anti_loss_tag.const import SERVICE_UUID_FFE0
+from custom_components.anti_loss_tag.presence_monitor import PresenceTimerWheel
+from custom_components.anti_loss_tag.utils.constants import (
+    PRESENCE_FALLBACK_TIMEOUT_SECONDS,
+)
+
+
+class TestAdvertisementRouter:
+    """测试路由器本身."""
+
+    @pytest.mark.asyncio
+    async def test_single_registration_and_routing(self):
+        """多设备只注册一个回调；按地址（忽略大小写）分发."""
+        cancel = MagicMock()
+        with patch.object(
+            router_module.bluetooth, "async_register_callback", return_value=cancel
+        ) as register:
+            router = AdvertisementRouter(MagicMock())
+            seen: dict[str, list] = {"a": [], "b": []}
+            detach_a = router.async_attach(
+                "aa:bb:cc:dd:ee:01", lambda info, change: seen["a"].append(info)
+            )
+            detach_b = router.async_attach(
+                "AA:BB:CC:DD:EE:02", lambda info, change: seen["b"].append(info)
+            )
+
+        assert register.call_count == 1
+        assert register.call_args.args[2] == {"service_uuid": SERVICE_UUID_FFE0}
+        assert router.attached == 2
+
+        on_advert = register.call_args.args[1]
+        info_a = SimpleNamespace(address="AA:BB:CC:DD:EE:01")
+        on_advert(info_a, None)
+        on_advert(SimpleNamespace(address="AA:BB:CC:DD:EE:99"), None)
+        assert seen == {"a": [info_a], "b": []}
+        assert router.routed == 1
+        assert router.unrouted == 1
+
+        detach_a()
+        assert router.registered
+        cancel.assert_not_called()
+        detach_b()
+        assert not router.registered
+        cancel.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stale_detach_keeps_new_route(self):
+        """同地址重新挂载后，旧的 detach 不会移除新设备."""
+        with patch.object(
+            router_module.bluetooth, "async_register_callback", return_value=MagicMock()
+        ):
+            router = AdvertisementRouter(MagicMock())
+            old_detach = router.async_attach("AA:BB:CC:DD:EE:01", lambda *_: None)
+            router.async_attach("AA:BB:CC:DD:EE:01", lambda *_: None)
+        old_detach()
+        assert router.attached == 1
+
+
+class TestDeviceWithRouter:
+    """测试设备挂载到路由器."""
+
+    @pytest.mark.asyncio
+    async def test_device_attaches_instead_of_registering(self, make_device):
+        """有路由器时设备不单独注册 HA 回调与不可用跟踪器."""
+        device = make_device(options={"maintain_connection": False})
+        router = MagicMock()
+        detach = MagicMock()
+        router.async_attach.return_value = detach
+        device._advert_router = router
+
+        with patch.object(
+            device_module.bluetooth, "async_register_callback"
+        ) as register, patch.object(
+            device_module.bluetooth, "async_track_unavailable"
+        ) as track:
+            device.async_start()
+            register.assert_not_called()
+            track.assert_not_called()
+        router.async_attach.assert_called_once_with(
+            device.address, device._async_on_bluetooth_event
+        )
+
+        device.async_stop()
+        detach.assert_called_once()
+        await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_fallback_timeout_arms_presence_wheel(self, make_device):
+        """未学习到广播间隔时，时间轮使用兜底超时判定离开."""
+        device = make_device(options={"maintain_connection": False})
+        wheel = MagicMock(spec=PresenceTimerWheel)
+        device._presence_wheel = wheel
+
+        with patch.object(device_module.time, "monotonic", return_value=1000.0):
+            device._async_on_bluetooth_event(SimpleNamespace(rssi=-60), None)
+
+        assert device.presence_timeout is None
+        wheel.async_touch.assert_called_once_with(
+            device.address,
+            1000.0 + PRESENCE_FALLBACK_TIMEOUT_SECONDS,
+            device._async_on_presence_timeout,
+        )
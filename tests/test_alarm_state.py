@@ -0,0 +1,95 @@
+"""测试报警响铃状态跟踪."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.anti_loss_tag.button import AntiLossTagStopAlarmButton
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+
+
+def _patch_write():
+    # 设备使用 __slots__，只能在类上替换方法
+    return patch.object(AntiLossTagDevice, "_async_write_bytes", AsyncMock())
+
+
+class TestAlarmState:
+    """测试报警状态与冗余停止写入跳过."""
+
+    @pytest.mark.asyncio
+    async def test_state_unknown_until_first_operation(self, make_device):
+        """启动时状态未知，停止报警仍会写入."""
+        device = make_device()
+        with _patch_write() as write:
+            assert device.alarm_active is None
+
+            await device.async_stop_alarm()
+            assert write.await_count == 1
+            assert device.alarm_active is False
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_stop_skipped_when_silent(self, make_device):
+        """已知静默时停止报警在本地完成，force 时仍写入."""
+        device = make_device()
+        with _patch_write() as write:
+            await device.async_start_alarm()
+            assert device.alarm_active is True
+            await device.async_stop_alarm()
+            assert device.alarm_active is False
+            assert write.await_count == 2
+
+            await device.async_stop_alarm()
+            assert write.await_count == 2
+            assert device.alarm_stop_skipped == 1
+
+            await device.async_stop_alarm(force=True)
+            assert write.await_count == 3
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_stop_button_skips_write_when_silent(self, make_device):
+        """已知静默时按下“停止报警”不写 GATT；超时后状态未知仍会写入."""
+        device = make_device()
+        button = AntiLossTagStopAlarmButton(device)
+        with _patch_write() as write:
+            await device.async_start_alarm()
+            await button.async_press()
+            assert write.await_count == 2
+            assert device.alarm_active is False
+
+            await button.async_press()
+            assert write.await_count == 2
+            assert device.alarm_stop_skipped == 1
+
+            await device.async_start_alarm()
+            device._async_on_alarm_timeout()
+            await button.async_press()
+            assert write.await_count == 4
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_and_timeout_clear_state(self, make_device):
+        """断开后清除响铃状态；超时或启用断开报警时断开后为未知."""
+        device = make_device(options={"alarm_on_disconnect": False})
+        with _patch_write():
+            await device.async_start_alarm()
+        assert device._alarm_timeout_handle is not None
+
+        device._on_disconnect(None)
+        assert device.alarm_active is False
+        assert device._alarm_timeout_handle is None
+
+        device._set_alarm_active(True)
+        device._async_on_alarm_timeout()
+        assert device.alarm_active is None
+
+        device._actor_task.cancel()
+
+        ringing_device = make_device(options={"alarm_on_disconnect": True})
+        ringing_device._set_alarm_active(True)
+        ringing_device._on_disconnect(None)
+        assert ringing_device.alarm_active is None
+        ringing_device._cancel_alarm_timeout()
@@ -0,0 +1,101 @@
+"""测试电量放电模型与自适应轮询间隔."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import pytest
+
+from custom_components.anti_loss_tag.battery_model import BatteryDischargeModel
+from custom_components.anti_loss_tag.utils.constants import (
+    BATTERY_MODEL_MIN_INTERVAL_SECONDS,
+)
+
+HOUR = 3600.0
+UPPER = 6 * HOUR
+
+
+class TestBatteryDischargeModel:
+    """测试放电速率拟合与间隔推荐."""
+
+    def test_stable_high_level_uses_configured_interval(self):
+        """电量高且平稳时沿用配置间隔."""
+        model = BatteryDischargeModel()
+        assert model.recommend_interval(UPPER) == (UPPER, "normal_poll")
+
+        for i in range(8):
+            model.add(i * UPPER, 95)
+        assert model.drain_per_hour == pytest.approx(0.0)
+        assert model.recommend_interval(UPPER) == (UPPER, "normal_poll")
+
+    def test_fast_drain_polls_before_next_threshold(self):
+        """放电较快时，在预计越过下一个阈值前再读一次."""
+        model = BatteryDischargeModel()
+        for i, level in enumerate((40, 38, 36, 34)):
+            model.add(i * HOUR, level)
+
+        assert model.drain_per_hour == pytest.approx(2.0)
+        interval, reason = model.recommend_interval(UPPER)
+        # 34% -> 20% 预计 7 小时，取一半
+        assert reason == "battery_approaching_low"
+        assert interval == pytest.approx(3.5 * HOUR)
+
+    def test_low_level_and_critical_level(self):
+        """低于首个阈值时缩短间隔，临界电量时使用最短间隔."""
+        model = BatteryDischargeModel()
+        model.add(0.0, 18)
+        assert model.recommend_interval(UPPER) == (UPPER * 0.25, "battery_low")
+
+        model.add(HOUR, 4)
+        assert model.recommend_interval(UPPER) == (
+            BATTERY_MODEL_MIN_INTERVAL_SECONDS,
+            "battery_critical",
+        )
+
+    def test_sudden_drop_shortens_interval(self):
+        """相邻读数骤降时缩短间隔."""
+        model = BatteryDischargeModel()
+        model.add(0.0, 90)
+        model.add(60.0, 75)
+        interval, reason = model.recommend_interval(UPPER)
+        assert reason == "battery_sudden_drop"
+        assert interval == pytest.approx(UPPER * 0.25)
+
+    def test_interval_is_bounded(self):
+        """推荐间隔不超过配置上限，且不低于模型下限（上限更小时以上限为准）."""
+        model = BatteryDischargeModel()
+        for i, level in enumerate((30, 25, 22)):
+            model.add(i * HOUR, level)
+        interval, _ = model.recommend_interval(UPPER)
+        assert BATTERY_MODEL_MIN_INTERVAL_SECONDS <= interval <= UPPER
+
+        assert model.recommend_interval(600.0)[0] <= 600.0
+
+    def test_battery_replacement_resets_history(self):
+        """电量明显回升视为更换电池，历史清空."""
+        model = BatteryDischargeModel(size=4)
+        for i, level in enumerate((30, 28, 26, 24, 22)):
+            model.add(i * HOUR, level)
+        assert model.sample_count == 4
+
+        model.add(5 * HOUR, 100)
+        assert model.sample_count == 1
+        assert model.latest_level == 100
+        assert model.drain_per_hour is None
+
+
+class TestDeviceBatteryInterval:
+    """测试设备按放电模型计算下一次轮询."""
+
+    @pytest.mark.asyncio
+    async def test_normal_poll_follows_model(self, make_device):
+        """电量已知时由模型给出间隔与原因，配置间隔为上限."""
+        device = make_device()
+        upper = device.battery_poll_interval_min * 60
+        device._battery = 15
+        device._battery_model.add(0.0, 15)
+
+        seconds, reason = device._compute_next_battery_sleep_seconds(
+            force_connect=False
+        )
+        assert reason == "battery_low"
+        assert seconds < upper
+        assert device.battery_model_samples == 1
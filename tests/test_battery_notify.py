@@ -0,0 +1,96 @@
+"""测试 2A19 电量通知与轮询回退."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from bleak.exc import BleakError
+
+from custom_components.anti_loss_tag.const import UUID_BATTERY_LEVEL_2A19
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+
+_BATTERY_HANDLE = 12
+
+
+def _client(properties: list[str], level: int = 80) -> MagicMock:
+    char = MagicMock()
+    char.uuid = UUID_BATTERY_LEVEL_2A19
+    char.handle = _BATTERY_HANDLE
+    char.properties = properties
+    service = MagicMock()
+    service.uuid = "0000180f-0000-1000-8000-00805f9b34fb"
+    service.characteristics = [char]
+    client = MagicMock()
+    client.services = [service]
+    client.read_gatt_char = AsyncMock(return_value=bytearray([level]))
+    client.start_notify = AsyncMock()
+    client.stop_notify = AsyncMock()
+    client.disconnect = AsyncMock()
+    return client
+
+
+async def _post_connect(device) -> None:
+    with patch.object(
+        AntiLossTagDevice, "_async_enable_notifications", AsyncMock(return_value=True)
+    ), patch.object(AntiLossTagDevice, "_async_write_bytes", AsyncMock()):
+        await device._async_post_connect_setup_impl()
+
+
+class TestBatteryNotify:
+    """测试电量更新方式的选择与回退."""
+
+    @pytest.mark.asyncio
+    async def test_notify_replaces_polling_while_connected(self, make_device):
+        """支持 notify 时订阅推送并停止轮询，断开后恢复轮询."""
+        device = make_device()
+        device._schedule_battery_poll(5.0, "startup")
+        device._client = _client(["read", "notify"])
+        device._connected = True
+
+        await _post_connect(device)
+
+        device._client.start_notify.assert_awaited_once_with(
+            _BATTERY_HANDLE, device._on_battery_notification
+        )
+        assert device.battery_update_mode == "notify"
+        assert not device.battery_timer_armed
+        assert device.last_battery_sleep_reason == "battery_notify"
+        assert device.battery == 80
+
+        device._on_battery_notification(None, bytearray([42]))
+        assert device.battery == 42
+        assert device.battery_notifications == 1
+
+        await device._async_disconnect_impl()
+        assert device.battery_update_mode == "poll"
+        assert device.battery_timer_armed
+        device._cancel_battery_timer()
+
+    @pytest.mark.asyncio
+    async def test_polling_kept_without_notify_property(self, make_device):
+        """特征不支持 notify 时不订阅，继续轮询."""
+        device = make_device()
+        device._client = _client(["read"])
+        device._connected = True
+
+        await _post_connect(device)
+
+        device._client.start_notify.assert_not_awaited()
+        assert device.battery_update_mode == "poll"
+        assert device.battery_timer_armed
+        device._cancel_battery_timer()
+
+    @pytest.mark.asyncio
+    async def test_subscription_failure_falls_back_to_polling(self, make_device):
+        """订阅失败时保持轮询."""
+        device = make_device()
+        device._client = _client(["read", "notify"])
+        device._client.start_notify = AsyncMock(side_effect=BleakError("boom"))
+        device._connected = True
+
+        await _post_connect(device)
+
+        assert device.battery_update_mode == "poll"
+        assert device.battery_timer_armed
+        device._cancel_battery_timer()
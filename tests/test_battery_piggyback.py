@@ -0,0 +1,93 @@
+"""测试借用其他连接顺带读取电量."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.anti_loss_tag.battery_scheduler import BatteryPollScheduler
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+
+
+def _client(level: int) -> MagicMock:
+    client = MagicMock()
+    client.read_gatt_char = AsyncMock(return_value=bytearray([level]))
+    return client
+
+
+def _patch_setup():
+    return (
+        patch.object(
+            AntiLossTagDevice,
+            "_async_enable_notifications",
+            AsyncMock(return_value=True),
+        ),
+        patch.object(AntiLossTagDevice, "_async_write_bytes", AsyncMock()),
+    )
+
+
+class TestBatteryPiggyback:
+    """测试连接建立后的电量顺带读取."""
+
+    @pytest.mark.asyncio
+    async def test_stale_reading_is_refreshed_and_poll_pushed_back(self, make_device):
+        """读数过期时顺带读取，并把后台轮询推迟一个完整周期."""
+        device = make_device(options={"maintain_connection": False})
+        scheduler = BatteryPollScheduler(asyncio.get_running_loop())
+        device._battery_scheduler = scheduler
+        device._schedule_battery_poll(5.0, "startup")
+        device._client = _client(77)
+
+        notify, write = _patch_setup()
+        with notify, write:
+            await device._async_post_connect_setup_impl()
+
+        assert device.battery == 77
+        assert device.battery_piggyback_reads == 1
+        assert device.last_battery_sleep_reason == "normal_poll"
+        poll_seconds = 60 * device.battery_poll_interval_min
+        assert device.last_battery_sleep_seconds >= poll_seconds
+        assert scheduler.is_scheduled(device.address)
+        scheduler.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_fresh_reading_is_not_read_again(self, make_device):
+        """读数仍新鲜时不额外读取 2A19."""
+        device = make_device()
+        device._client = _client(50)
+        device._battery = 80
+        device._last_battery_read_mono = time.monotonic()
+
+        notify, write = _patch_setup()
+        with notify, write:
+            await device._async_post_connect_setup_impl()
+
+        device._client.read_gatt_char.assert_not_awaited()
+        assert device.battery == 80
+        assert device.battery_piggyback_reads == 0
+
+    @pytest.mark.asyncio
+    async def test_poll_connect_does_not_read_twice(self, make_device):
+        """后台轮询自己建立的连接已在初始化中读到电量时不再重复读取."""
+        device = make_device(options={"maintain_connection": False})
+        client = _client(64)
+
+        async def _connect(self, *, connect_purpose: str = "general") -> bool:
+            self._client = client
+            await self._async_post_connect_setup_impl()
+            return True
+
+        notify, write = _patch_setup()
+        with notify, write, patch.object(
+            AntiLossTagDevice, "async_ensure_connected", _connect
+        ):
+            device._battery_reads_pending = 1
+            await device._async_read_battery_impl(force_connect=True)
+
+        assert client.read_gatt_char.await_count == 1
+        assert device.battery == 64
+        # 由轮询建立的连接不计为顺带读取
+        assert device.battery_piggyback_reads == 0
@@ -0,0 +1,59 @@
+"""测试标签不在范围内时挂起电量轮询."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+from custom_components.anti_loss_tag.utils.constants import (
+    BATTERY_PARK_RESUME_MAX_SECONDS,
+)
+
+
+class TestPresenceAwareBatteryPolling:
+    """测试挂起与恢复."""
+
+    @pytest.mark.asyncio
+    async def test_absent_tag_parks_poll_without_connecting(self, make_device):
+        """近期无广播时到期的轮询挂起，不提交读取也不重新计时."""
+        device = make_device(options={"maintain_connection": False})
+        device._battery = 60
+        with patch.object(AntiLossTagDevice, "_submit_battery_read") as submit:
+            assert device._async_on_battery_timer() is None
+
+        submit.assert_not_called()
+        assert device.battery_poll_parked
+        assert device.battery_polls_parked == 1
+        assert not device.battery_timer_armed
+        assert device.last_battery_sleep_reason == "parked_until_advert"
+
+    @pytest.mark.asyncio
+    async def test_next_advert_resumes_parked_poll(self, make_device):
+        """下一条广播到达后很快执行挂起的轮询，之后的广播不再重复排程."""
+        device = make_device(options={"maintain_connection": False})
+        device._async_on_battery_timer()
+        assert device.battery_poll_parked
+
+        device._process_advertisement(time.monotonic(), -60)
+        assert not device.battery_poll_parked
+        assert device.battery_timer_armed
+        assert device.last_battery_sleep_reason == "tag_visible"
+        assert device.last_battery_sleep_seconds <= BATTERY_PARK_RESUME_MAX_SECONDS
+
+        device._cancel_battery_timer()
+        device._process_advertisement(time.monotonic(), -61)
+        assert not device.battery_timer_armed
+
+    @pytest.mark.asyncio
+    async def test_visible_tag_polls_normally(self, make_device):
+        """可见标签照常提交读取."""
+        device = make_device(options={"maintain_connection": False})
+        device._available = True
+        with patch.object(AntiLossTagDevice, "_submit_battery_read") as submit:
+            device._async_on_battery_timer()
+
+        submit.assert_called_once()
+        assert not device.battery_poll_parked
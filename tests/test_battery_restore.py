@@ -0,0 +1,130 @@
+"""测试重启后恢复电量与读取时间."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.sensor import SensorExtraStoredData
+
+from custom_components.anti_loss_tag import device as device_module
+from custom_components.anti_loss_tag.device import DeviceField
+from custom_components.anti_loss_tag.sensor import AntiLossTagBatterySensor
+
+
+def _start(device) -> None:
+    with patch.object(
+        device_module.bluetooth, "async_register_callback", return_value=lambda: None
+    ), patch.object(
+        device_module.bluetooth, "async_track_unavailable", return_value=lambda: None
+    ):
+        device.async_start()
+
+
+class TestBatteryRestore:
+    """测试恢复的电量如何影响首次轮询."""
+
+    @pytest.mark.asyncio
+    async def test_recent_reading_defers_first_poll(self, make_device):
+        """上次读取在 1 小时前：首次轮询排在剩余周期之后，而不是启动后立即连接."""
+        device = make_device(options={"maintain_connection": False})
+        read_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        device.async_restore_battery(80, read_at)
+
+        assert device.battery == 80
+        assert device.last_battery_read == read_at
+        assert device._battery_is_fresh(2 * 3600.0)
+
+        _start(device)
+        try:
+            interval = device.battery_poll_interval_min * 60
+            assert device.last_battery_sleep_reason == "restored"
+            assert device.last_battery_sleep_seconds == pytest.approx(
+                interval - 3600.0, abs=60.0
+            )
+        finally:
+            device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_reading_polls_at_startup(self, make_device):
+        """上次读取已超过一个周期：照常在启动后很快轮询，但不再视为首次读取."""
+        device = make_device()
+        device.async_restore_battery(
+            55, datetime.now(timezone.utc) - timedelta(days=2)
+        )
+
+        _start(device)
+        try:
+            assert device.last_battery_sleep_reason == "startup"
+            assert device.last_battery_sleep_seconds <= 3.0
+        finally:
+            device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_restore_after_start_reschedules(self, make_device):
+        """设备先启动、实体后恢复时，启动轮询按恢复的读取时间重新排程."""
+        device = make_device()
+        _start(device)
+        try:
+            assert device.last_battery_sleep_reason == "startup"
+            device.async_restore_battery(
+                90, datetime.now(timezone.utc) - timedelta(minutes=10)
+            )
+            assert device.last_battery_sleep_reason == "restored"
+            assert device.battery_timer_armed
+        finally:
+            device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_live_reading_is_not_overwritten(self, make_device):
+        """已有实时读数时忽略恢复值."""
+        device = make_device()
+        device._battery = 40
+        device.async_restore_battery(90, datetime.now(timezone.utc))
+        assert device.battery == 40
+        assert device.last_battery_read is None
+
+    @pytest.mark.asyncio
+    async def test_sensor_seeds_device_from_last_state(self, make_device):
+        """电量传感器从保存的状态与 last_read 属性恢复设备."""
+        device = make_device()
+        sensor = AntiLossTagBatterySensor(device, MagicMock())
+        read_at = datetime.now(timezone.utc) - timedelta(minutes=30)
+        last_state = MagicMock()
+        last_state.attributes = {"last_read": read_at.isoformat()}
+
+        with patch.object(
+            sensor,
+            "async_get_last_sensor_data",
+            AsyncMock(return_value=SensorExtraStoredData(72, "%")),
+        ), patch.object(
+            sensor, "async_get_last_state", AsyncMock(return_value=last_state)
+        ):
+            await sensor.async_added_to_hass()
+
+        assert device.battery == 72
+        assert device.last_battery_read == read_at
+        assert sensor.extra_state_attributes == {
+            "last_read": read_at.isoformat(),
+            "update_mode": "poll",
+        }
+        await sensor.async_will_remove_from_hass()
+
+    @pytest.mark.asyncio
+    async def test_same_level_read_refreshes_last_read(self, make_device):
+        """两次读取电量相同：仍通知电量传感器，保存的 last_read 随之更新."""
+        device = make_device()
+        sensor = AntiLossTagBatterySensor(device, MagicMock())
+        calls: list[None] = []
+        device.async_add_listener(lambda: calls.append(None), DeviceField.BATTERY)
+
+        device._record_battery_level(64)
+        first = device.last_battery_read
+        device._record_battery_level(64)
+
+        assert len(calls) == 2
+        assert device.last_battery_read > first
+        assert sensor.extra_state_attributes["last_read"] == (
+            device.last_battery_read.isoformat()
+        )
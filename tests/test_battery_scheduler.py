@@ -0,0 +1,180 @@
+"""测试集成级电量轮询调度器（最小堆 + 全局预算）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anti_loss_tag import battery_scheduler as scheduler_module
+from custom_components.anti_loss_tag.battery_scheduler import BatteryPollScheduler
+from custom_components.anti_loss_tag.connection_manager import BleConnectionManager
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _reader(loop, dispatched: list, key: str, futures: dict):
+    def _dispatch():
+        dispatched.append(key)
+        futures[key] = loop.create_future()
+        return futures[key]
+
+    return _dispatch
+
+
+class TestBatteryPollScheduler:
+    """测试调度器本身."""
+
+    @pytest.mark.asyncio
+    async def test_dispatches_in_due_order_with_one_timer(self):
+        """按到期时间顺序分发，全程只有一个定时器."""
+        loop = asyncio.get_running_loop()
+        scheduler = BatteryPollScheduler(loop, max_concurrent=10)
+        dispatched: list[str] = []
+        futures: dict = {}
+        for key, delay in (("c", 0.03), ("a", 0.01), ("b", 0.02)):
+            scheduler.async_schedule(
+                key, delay, _reader(loop, dispatched, key, futures)
+            )
+        assert scheduler.scheduled == 3
+
+        await asyncio.sleep(0.06)
+        assert dispatched == ["a", "b", "c"]
+        assert scheduler.in_flight == 3
+        for future in futures.values():
+            future.set_result(None)
+        await asyncio.sleep(0)
+        assert scheduler.in_flight == 0
+        assert scheduler.dispatched_total == 3
+
+    @pytest.mark.asyncio
+    async def test_reschedule_replaces_previous_entry(self):
+        """同一 key 重新排程时只保留最新的到期时间."""
+        loop = asyncio.get_running_loop()
+        scheduler = BatteryPollScheduler(loop)
+        dispatched: list[str] = []
+        futures: dict = {}
+        scheduler.async_schedule("a", 0.01, _reader(loop, dispatched, "a", futures))
+        scheduler.async_schedule("a", 0.2, _reader(loop, dispatched, "a", futures))
+        await asyncio.sleep(0.05)
+        assert dispatched == []
+        scheduler.async_cancel("a")
+        assert not scheduler.is_scheduled("a")
+
+    @pytest.mark.asyncio
+    async def test_concurrency_budget(self):
+        """在途读取达到上限时，其余到期项等待读取完成后再分发."""
+        loop = asyncio.get_running_loop()
+        scheduler = BatteryPollScheduler(loop, max_concurrent=2)
+        dispatched: list[str] = []
+        futures: dict = {}
+        for key in ("a", "b", "c"):
+            scheduler.async_schedule(key, 0.0, _reader(loop, dispatched, key, futures))
+        await asyncio.sleep(0.01)
+        assert dispatched == ["a", "b"]
+        assert scheduler.budget_waits >= 1
+
+        futures["a"].set_result(None)
+        await asyncio.sleep(0.01)
+        assert dispatched == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_per_minute_budget(self):
+        """每分钟分发数达到上限时，等到窗口滑动后再分发."""
+        loop = asyncio.get_running_loop()
+        clock = _Clock()
+        with patch.object(scheduler_module.time, "monotonic", clock):
+            scheduler = BatteryPollScheduler(loop, max_concurrent=10, max_per_minute=2)
+            dispatched: list[str] = []
+            futures: dict = {}
+            for key in ("a", "b", "c"):
+                scheduler.async_schedule(
+                    key, 0.0, _reader(loop, dispatched, key, futures)
+                )
+            scheduler._async_run()
+            assert dispatched == ["a", "b"]
+
+            clock.now += 30
+            scheduler._async_run()
+            assert dispatched == ["a", "b"]
+
+            clock.now += 31
+            scheduler._async_run()
+            assert dispatched == ["a", "b", "c"]
+            scheduler.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_slot_waiters_wake_on_release(self):
+        """等待连接槽位的设备在槽位释放时被唤醒，而不是定时轮询."""
+        loop = asyncio.get_running_loop()
+        conn_mgr = BleConnectionManager(max_connections=1)
+        scheduler = BatteryPollScheduler(loop, conn_mgr=conn_mgr)
+        dispatched: list[str] = []
+        futures: dict = {}
+        scheduler.async_wait_for_slot("a", _reader(loop, dispatched, "a", futures))
+        assert scheduler.waiting_for_slot == 1
+        await asyncio.sleep(0.01)
+        assert dispatched == []
+
+        await conn_mgr.acquire()
+        await conn_mgr.release()
+        await asyncio.sleep(0.01)
+        assert dispatched == ["a"]
+        assert scheduler.waiting_for_slot == 0
+        scheduler.async_shutdown()
+
+
+class TestDeviceBatteryScheduling:
+    """测试设备侧使用调度器."""
+
+    @pytest.mark.asyncio
+    async def test_device_defers_until_foreground_ops_drain(self, make_device):
+        """有前台操作排队时挂起，操作排空后立即重新排程."""
+        device = make_device(options={"maintain_connection": False})
+        device._available = True
+        scheduler = BatteryPollScheduler(asyncio.get_running_loop())
+        device._battery_scheduler = scheduler
+        release = asyncio.Event()
+
+        async def _op() -> None:
+            await release.wait()
+
+        task = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="sync_disconnect_policy",
+                action=_op,
+                priority=device._op_priority_policy,
+            )
+        )
+        second = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="sync_disconnect_policy",
+                action=_op,
+                priority=device._op_priority_policy,
+            )
+        )
+        await asyncio.sleep(0.01)
+
+        assert device._async_on_battery_timer() is None
+        assert device.battery_defer_count == 1
+        assert not device.battery_timer_armed
+        assert device.last_battery_sleep_reason == "defer_for_foreground"
+
+        with patch.object(
+            scheduler, "async_schedule", wraps=scheduler.async_schedule
+        ) as schedule:
+            release.set()
+            await asyncio.gather(task, second)
+            await asyncio.sleep(0.01)
+        assert schedule.call_args_list[0].args[:2] == (device.address, 0.0)
+
+        device.async_stop()
+        assert not scheduler.is_scheduled(device.address)
+        await asyncio.sleep(0.01)
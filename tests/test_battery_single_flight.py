@@ -0,0 +1,92 @@
+"""测试单飞电量读取与 TTL 缓存."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _client(level: int) -> MagicMock:
+    client = MagicMock()
+    client.read_gatt_char = AsyncMock(return_value=bytearray([level]))
+    return client
+
+
+class TestBatterySingleFlight:
+    """测试并发读取共享与缓存命中."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_read(self, make_device):
+        """并发调用方共享同一次 GATT 读取并都拿到结果."""
+        device = make_device()
+        client = _client(66)
+        release = asyncio.Event()
+
+        async def _slow_read(*_args, **_kwargs):
+            await release.wait()
+            return bytearray([66])
+
+        client.read_gatt_char = AsyncMock(side_effect=_slow_read)
+        device._client = client
+        device._connected = True
+
+        callers = [
+            asyncio.ensure_future(device.async_read_battery(force_connect=True))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert results == [66, 66, 66]
+        assert client.read_gatt_char.await_count == 1
+        assert device.battery_cache_misses == 1
+        assert device.battery_read_joins == 2
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_fresh_reading_is_served_from_cache(self, make_device):
+        """窗口内的读数直接返回，不做 GATT I/O；max_age=0 绕过缓存."""
+        device = make_device()
+        client = _client(50)
+        device._client = client
+        device._connected = True
+        device._battery = 70
+        device._last_battery_read_mono = time.monotonic() - 10.0
+
+        assert await device.async_read_battery(force_connect=False) == 70
+        assert device.battery_cache_hits == 1
+        client.read_gatt_char.assert_not_awaited()
+
+        assert await device.async_read_battery(force_connect=False, max_age=0) == 50
+        assert device.battery_cache_misses == 1
+        assert client.read_gatt_char.await_count == 1
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_read(self, make_device):
+        """一个调用方取消不影响共享读取的其他调用方."""
+        device = make_device()
+        release = asyncio.Event()
+
+        async def _slow_read(*_args, **_kwargs):
+            await release.wait()
+            return bytearray([33])
+
+        client = _client(33)
+        client.read_gatt_char = AsyncMock(side_effect=_slow_read)
+        device._client = client
+        device._connected = True
+
+        first = asyncio.ensure_future(device.async_read_battery(force_connect=True))
+        second = asyncio.ensure_future(device.async_read_battery(force_connect=True))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        release.set()
+
+        assert await second == 33
+        assert first.cancelled()
+        device._actor_task.cancel()
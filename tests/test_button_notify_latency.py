@@ -0,0 +1,87 @@
+"""测试 FFE1 按键通知的同步处理与延迟基准."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+import time
+import timeit
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.anti_loss_tag.const import UUID_NOTIFY_FFE1
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+
+
+class TestButtonNotification:
+    """测试按键通知在回调内直接分发."""
+
+    @pytest.mark.asyncio
+    async def test_handler_is_registered_synchronously(self, make_device):
+        """订阅 FFE1 时注册的是同步回调，不是协程函数."""
+        device = make_device()
+        client = MagicMock()
+        client.start_notify = AsyncMock()
+        device._client = client
+
+        assert await device._async_enable_notifications()
+        uuid, handler = client.start_notify.await_args.args
+        assert uuid == UUID_NOTIFY_FFE1
+        assert handler == device._on_button_notification
+        assert not asyncio.iscoroutinefunction(handler)
+
+    @pytest.mark.asyncio
+    async def test_event_fires_inside_callback(self, make_device):
+        """按键事件在通知回调返回前已分发，且不触发实体更新."""
+        device = make_device()
+        events = []
+        device.async_add_button_listener(events.append)
+
+        with patch.object(AntiLossTagDevice, "_async_dispatch_update") as dispatch:
+            device._on_button_notification(0, bytearray(b"\x01\x02"))
+            device._on_button_notification(0, bytearray(b"\x00"))
+            device._on_button_notification(0, bytearray())
+
+        assert len(events) == 1
+        assert events[0].raw == b"\x01\x02"
+        assert device.last_button_event is events[0]
+        dispatch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_notify_to_event_latency_benchmark(self, make_device):
+        """基准：通知到事件触发的延迟（同步回调 vs. 每条通知调度一个协程）."""
+        device = make_device()
+        fired_at: list[float] = []
+        device.async_add_button_listener(
+            lambda _event: fired_at.append(time.perf_counter())
+        )
+        payload = bytearray(b"\x01")
+        handler = device._on_button_notification
+
+        number = 2000
+        sync_total = 0.0
+        for _ in range(number):
+            start = time.perf_counter()
+            handler(0, payload)
+            sync_total += fired_at[-1] - start
+
+        async def _old_style(_sender, data) -> None:
+            handler(_sender, data)
+
+        loop = asyncio.get_running_loop()
+        async_total = 0.0
+        for _ in range(number):
+            start = time.perf_counter()
+            done = loop.create_task(_old_style(0, payload))
+            await done
+            async_total += fired_at[-1] - start
+
+        sync_us = sync_total / number * 1e6
+        async_us = async_total / number * 1e6
+        assert sync_us < async_us
+
+        seconds = min(
+            timeit.repeat(lambda: handler(0, payload), number=number, repeat=3)
+        )
+        # 宽松上限：同步处理单条按键通知应远低于 50 微秒
+        assert seconds / number < 50e-6
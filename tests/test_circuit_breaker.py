@@ -0,0 +1,102 @@
+"""测试单设备断路器."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+from unittest.mock import patch
+
+import pytest
+from bleak.exc import BleakError
+
+from custom_components.anti_loss_tag import circuit_breaker as cb
+from custom_components.anti_loss_tag.circuit_breaker import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    DeviceCircuitBreaker,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clk = _Clock()
+    with patch.object(cb.time, "monotonic", clk):
+        yield clk
+
+
+class TestDeviceCircuitBreaker:
+    """测试断路器状态迁移."""
+
+    def test_opens_after_threshold_failures(self, clock):
+        """连续失败达到阈值后打开并拒绝请求."""
+        breaker = DeviceCircuitBreaker(failure_threshold=3, cooloff_seconds=60)
+        for _ in range(2):
+            breaker.record_failure("connect_error")
+        assert breaker.state == CIRCUIT_CLOSED
+        breaker.record_failure("scanner_unavailable")
+        assert breaker.state == CIRCUIT_OPEN
+        assert breaker.allow_request() is False
+        assert breaker.rejected_count == 1
+
+    def test_slot_timeout_does_not_trip(self, clock):
+        """全局槽位超时不计入单设备失败."""
+        breaker = DeviceCircuitBreaker(failure_threshold=1, cooloff_seconds=60)
+        breaker.record_failure("slot_timeout")
+        assert breaker.state == CIRCUIT_CLOSED
+
+    def test_half_open_admits_single_probe(self, clock):
+        """冷却期后只放行一个探测请求."""
+        breaker = DeviceCircuitBreaker(failure_threshold=1, cooloff_seconds=60)
+        breaker.record_failure("connect_error")
+        clock.now += 61
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+        breaker.release_probe()
+        assert breaker.allow_request() is True
+
+    def test_probe_failure_reopens(self, clock):
+        """探测失败重新打开断路器."""
+        breaker = DeviceCircuitBreaker(failure_threshold=1, cooloff_seconds=60)
+        breaker.record_failure("connect_error")
+        clock.now += 61
+        assert breaker.allow_request() is True
+        breaker.record_failure("connect_error")
+        assert breaker.state == CIRCUIT_OPEN
+        assert breaker.open_count == 2
+
+    def test_only_advertisement_closes(self, clock):
+        """连接成功不关闭半开断路器，广播确认后才关闭."""
+        breaker = DeviceCircuitBreaker(failure_threshold=1, cooloff_seconds=60)
+        breaker.record_failure("connect_error")
+        breaker.record_advertisement()
+        assert breaker.state == CIRCUIT_OPEN
+
+        clock.now += 61
+        breaker.record_success()
+        assert breaker.state == CIRCUIT_HALF_OPEN
+        breaker.record_advertisement()
+        assert breaker.state == CIRCUIT_CLOSED
+
+
+class TestDeviceCircuitBreakerIntegration:
+    """测试设备层快速失败."""
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast_without_enqueue(self, make_device):
+        """断路器打开时操作立即失败，不进入队列."""
+        device = make_device()
+        for _ in range(10):
+            device.circuit_breaker.record_failure("connect_error")
+
+        with pytest.raises(BleakError):
+            await device.async_start_alarm()
+        assert device.operation_queue_size == 0
+        assert device._actor_task is None
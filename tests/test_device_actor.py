@@ -0,0 +1,153 @@
+"""测试单设备 actor 的任务模型与串行执行."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anti_loss_tag import device as device_module
+
+
+def _patch_bluetooth():
+    return (
+        patch.object(
+            device_module.bluetooth,
+            "async_register_callback",
+            return_value=lambda: None,
+        ),
+        patch.object(
+            device_module.bluetooth,
+            "async_track_unavailable",
+            return_value=lambda: None,
+        ),
+    )
+
+
+class TestDeviceActor:
+    """测试 actor 生命周期."""
+
+    @pytest.mark.asyncio
+    async def test_started_device_owns_single_task(self, make_device):
+        """启动后每个设备只有一个 actor 任务，电量轮询由定时器驱动."""
+        register, track = _patch_bluetooth()
+        with register, track:
+            before = len(asyncio.all_tasks())
+            device = make_device(options={"maintain_connection": False})
+            device.async_start()
+            await asyncio.sleep(0)
+
+            assert len(asyncio.all_tasks()) - before == 1
+            assert device.operation_worker_running
+            assert device.battery_timer_armed
+
+            device.async_stop()
+            await asyncio.sleep(0.01)
+
+        assert len(asyncio.all_tasks()) == before
+        assert not device.battery_timer_armed
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_pending_operations(self, make_device):
+        """停止时进行中与排队中的操作都被取消，之后的提交立即失败."""
+        device = make_device()
+        started = asyncio.Event()
+
+        async def _slow() -> None:
+            started.set()
+            await asyncio.sleep(30)
+
+        inflight = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="sync_disconnect_policy",
+                action=_slow,
+                priority=device._op_priority_policy,
+            )
+        )
+        queued = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="start_alarm", action=_slow, priority=device._op_priority_alarm
+            )
+        )
+        await started.wait()
+
+        device.async_stop()
+        await asyncio.sleep(0.01)
+        assert inflight.cancelled()
+        assert queued.cancelled()
+        assert device.operation_queue_size == 0
+
+        with pytest.raises(device_module.BleakError):
+            await device._async_enqueue_operation(
+                name="start_alarm", action=_slow, priority=device._op_priority_alarm
+            )
+
+    @pytest.mark.asyncio
+    async def test_stop_disconnects_after_preemptible_op_unwinds(self, make_device):
+        """停止时先等可抢占操作的子任务清理完毕，再执行断开."""
+        device = make_device()
+        started = asyncio.Event()
+        order: list[str] = []
+
+        async def _battery_read() -> None:
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                order.append("child cancel begin")
+                await asyncio.sleep(0.02)
+                order.append("child cancel end")
+                raise
+
+        async def _disconnect(_self) -> None:
+            order.append("disconnect_impl")
+
+        read = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="read_battery",
+                action=_battery_read,
+                priority=device._op_priority_battery,
+                preemptible=True,
+            )
+        )
+        await started.wait()
+
+        with patch.object(
+            device_module.AntiLossTagDevice, "_async_disconnect_impl", _disconnect
+        ):
+            device.async_stop()
+            await asyncio.sleep(0.1)
+
+        assert order == ["child cancel begin", "child cancel end", "disconnect_impl"]
+        assert read.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_operations_never_overlap(self, make_device):
+        """actor 串行执行操作，无需 GATT 锁."""
+        device = make_device()
+        active = 0
+        max_active = 0
+
+        async def _op() -> None:
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+
+        await asyncio.wait_for(
+            asyncio.gather(
+                *(
+                    device._async_enqueue_operation(
+                        name="sync_disconnect_policy",
+                        action=_op,
+                        priority=device._op_priority_policy,
+                    )
+                    for _ in range(10)
+                )
+            ),
+            timeout=2.0,
+        )
+        assert max_active == 1
+        device._actor_task.cancel()
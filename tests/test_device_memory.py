@@ -0,0 +1,104 @@
+"""测试单标签运行时内存预算（千标签部署可预测）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+import gc
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.anti_loss_tag import device as device_module
+from custom_components.anti_loss_tag.const import DOMAIN
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+
+TAGS = 200
+# 未启动的设备对象（含 RSSI 环形缓冲）每标签预算
+IDLE_BUDGET_BYTES = 3 * 1024
+# 启动后（含 actor 任务与电量定时器）每标签预算
+STARTED_BUDGET_BYTES = 6 * 1024
+
+
+def _shared_hass() -> MagicMock:
+    loop = asyncio.get_running_loop()
+    hass = MagicMock()
+    hass.loop = loop
+    hass.data = {DOMAIN: {}}
+    hass.async_create_task = lambda coro, *args, **kwargs: loop.create_task(coro)
+    return hass
+
+
+def _entries() -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            data={"address": f"AA:BB:CC:DD:{i // 256:02X}:{i % 256:02X}", "name": "t"},
+            options={"maintain_connection": False},
+        )
+        for i in range(TAGS)
+    ]
+
+
+def _measure(build) -> tuple[float, list]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        devices = build()
+        gc.collect()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    grown = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return grown / TAGS, devices
+
+
+class TestDeviceMemory:
+    """测试设备运行时状态的内存占用."""
+
+    @pytest.mark.asyncio
+    async def test_device_has_no_instance_dict(self, make_device):
+        """运行时状态放在 __slots__ 中，没有实例 __dict__."""
+        device = make_device()
+        assert not hasattr(device, "__dict__")
+        with pytest.raises(AttributeError):
+            device.unexpected_attribute = 1
+
+    @pytest.mark.asyncio
+    async def test_idle_device_within_budget(self):
+        """未启动设备的每标签内存不超过预算."""
+        hass = _shared_hass()
+        entries = _entries()
+        per_tag, devices = _measure(
+            lambda: [AntiLossTagDevice(hass, entry) for entry in entries]
+        )
+        assert len(devices) == TAGS
+        assert per_tag < IDLE_BUDGET_BYTES, f"{per_tag:.0f} B per tag"
+
+    @pytest.mark.asyncio
+    async def test_started_device_within_budget(self):
+        """启动后（actor + 定时器）的每标签内存不超过预算，停止后任务全部退出."""
+        hass = _shared_hass()
+        entries = _entries()
+        with patch.object(
+            device_module.bluetooth, "async_register_callback", return_value=None
+        ), patch.object(
+            device_module.bluetooth, "async_track_unavailable", return_value=None
+        ):
+            before_tasks = len(asyncio.all_tasks())
+
+            def _build() -> list[AntiLossTagDevice]:
+                devices = [AntiLossTagDevice(hass, entry) for entry in entries]
+                for device in devices:
+                    device.async_start()
+                return devices
+
+            per_tag, devices = _measure(_build)
+            await asyncio.sleep(0)
+            for device in devices:
+                device.async_stop()
+            await asyncio.sleep(0.01)
+
+        assert per_tag < STARTED_BUDGET_BYTES, f"{per_tag:.0f} B per tag"
+        assert len(asyncio.all_tasks()) == before_tasks
@@ -0,0 +1,85 @@
+"""测试字段级变更检测（只写入受影响的实体）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import pytest
+
+from custom_components.anti_loss_tag.device import DeviceField
+
+
+class TestFieldChangeDetection:
+    """测试按订阅字段分发更新."""
+
+    @pytest.mark.asyncio
+    async def test_only_subscribers_of_changed_fields_are_called(self, make_device):
+        """仅 RSSI 变化时只通知 RSSI 订阅者."""
+        device = make_device()
+        calls: dict[str, int] = {}
+
+        def _listener(name: str):
+            calls[name] = 0
+
+            def _call() -> None:
+                calls[name] += 1
+
+            return _call
+
+        device.async_add_listener(_listener("rssi"), DeviceField.RSSI)
+        device.async_add_listener(
+            _listener("battery"),
+            DeviceField.BATTERY | DeviceField.AVAILABLE | DeviceField.CONNECTED,
+        )
+        device.async_add_listener(_listener("connected"), DeviceField.CONNECTED)
+        device.async_add_listener(_listener("policy"), DeviceField.POLICY)
+        device.async_add_listener(_listener("legacy"))
+
+        device._async_dispatch_update()
+        assert all(count == 1 for count in calls.values())
+
+        device._rssi_published = -70
+        device._async_dispatch_update()
+        assert calls == {
+            "rssi": 2,
+            "battery": 1,
+            "connected": 1,
+            "policy": 1,
+            "legacy": 2,
+        }
+
+        device._connected = True
+        device._async_dispatch_update()
+        assert calls["connected"] == 2
+        assert calls["battery"] == 2
+        assert calls["rssi"] == 2
+
+        # 无字段变化时不写入订阅者
+        device._async_dispatch_update()
+        assert calls["rssi"] == 2
+        assert calls["connected"] == 2
+
+    @pytest.mark.asyncio
+    async def test_rssi_stream_cuts_state_writes(self, make_device):
+        """RSSI 为主的更新流中，写入次数显著低于全量通知."""
+        device = make_device()
+        subscriptions = [
+            DeviceField.RSSI,
+            DeviceField.BATTERY | DeviceField.AVAILABLE | DeviceField.CONNECTED,
+            DeviceField.AVAILABLE,
+            DeviceField.CONNECTED,
+            DeviceField.ALARM,
+            DeviceField.AVAILABLE | DeviceField.CONNECTED,
+            DeviceField.AVAILABLE | DeviceField.CONNECTED,
+            DeviceField.POLICY,
+        ]
+        for fields in subscriptions:
+            device.async_add_listener(lambda: None, fields)
+
+        updates = 100
+        device._async_dispatch_update()
+        calls_before = device.listener_calls
+        for i in range(updates):
+            device._rssi_published = -60 - (i % 20)
+            device._async_dispatch_update()
+
+        written = device.listener_calls - calls_before
+        assert written * 5 <= updates * len(subscriptions)
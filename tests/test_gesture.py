@@ -0,0 +1,109 @@
+"""测试按键手势识别（单击/双击/三击/长按）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+
+import pytest
+
+from custom_components.anti_loss_tag.gesture import ButtonGestureRecognizer
+
+WINDOW = 0.03
+
+
+def _recognizer(multi_press_window: float = WINDOW, long_press: float = 0.06):
+    fired: list[str] = []
+    recognizer = ButtonGestureRecognizer(
+        asyncio.get_running_loop(),
+        lambda gesture, _raw: fired.append(gesture),
+        multi_press_window=multi_press_window,
+        long_press=long_press,
+    )
+    return recognizer, fired
+
+
+class TestButtonGestureRecognizer:
+    """测试手势状态机."""
+
+    @pytest.mark.asyncio
+    async def test_press_counts_within_window(self):
+        """连击窗口内的按下次数决定 single/double，第三次按下立即发出 triple."""
+        recognizer, fired = _recognizer()
+
+        recognizer.press(b"\x01")
+        await asyncio.sleep(WINDOW * 2)
+        recognizer.press(b"\x01")
+        recognizer.press(b"\x01")
+        await asyncio.sleep(WINDOW * 2)
+        assert fired == ["single", "double"]
+
+        recognizer.press(b"\x01")
+        recognizer.press(b"\x01")
+        recognizer.press(b"\x01")
+        assert fired == ["single", "double", "triple"]
+
+    @pytest.mark.asyncio
+    async def test_single_fast_path_without_multi_press(self):
+        """关闭连击窗口时，single 在按下回调内立即发出."""
+        recognizer, fired = _recognizer(multi_press_window=0.0)
+        recognizer.press(b"\x01")
+        assert fired == ["single"]
+
+    @pytest.mark.asyncio
+    async def test_long_press_requires_release_support(self):
+        """观察到松开后才识别长按；未上报松开的固件按下视为瞬时点击."""
+        recognizer, fired = _recognizer(multi_press_window=0.0, long_press=0.03)
+
+        recognizer.press(b"\x01")
+        await asyncio.sleep(0.06)
+        assert fired == ["single"]
+
+        recognizer.release()
+        assert recognizer.release_seen
+
+        # 按住超过阈值：long；阈值前松开：single
+        recognizer.press(b"\x01")
+        await asyncio.sleep(0.06)
+        recognizer.release()
+        recognizer.press(b"\x01")
+        recognizer.release()
+        assert fired == ["single", "long", "single"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_drops_pending_sequence(self):
+        """取消后不再发出待定手势."""
+        recognizer, fired = _recognizer()
+        recognizer.press(b"\x01")
+        recognizer.cancel()
+        await asyncio.sleep(WINDOW * 2)
+        assert fired == []
+
+
+class TestDeviceGestures:
+    """测试设备把 FFE1 通知交给手势状态机."""
+
+    @pytest.mark.asyncio
+    async def test_press_is_immediate_and_gesture_follows(self, make_device):
+        """press 事件立即分发，手势结果随后以同一监听器分发."""
+        device = make_device(options={"button_multi_press_window_ms": 30})
+        events = []
+        device.async_add_button_listener(events.append)
+
+        device._on_button_notification(0, bytearray(b"\x01"))
+        device._on_button_notification(0, bytearray(b"\x01"))
+        assert [e.gesture for e in events] == ["press", "press"]
+
+        await asyncio.sleep(0.06)
+        assert [e.gesture for e in events] == ["press", "press", "double"]
+        assert device.button_gesture_counts == {"double": 1}
+
+    @pytest.mark.asyncio
+    async def test_fast_path_from_options(self, make_device):
+        """选项关闭连击窗口时，press 之后立即分发 single."""
+        device = make_device(options={"button_multi_press_window_ms": 0})
+        events = []
+        device.async_add_button_listener(events.append)
+
+        device._on_button_notification(0, bytearray(b"\x01"))
+        assert [e.gesture for e in events] == ["press", "single"]
+        assert device._gesture.multi_press_window == 0.0
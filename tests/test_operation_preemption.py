@@ -0,0 +1,132 @@
+"""测试交互操作对后台 GATT 操作的抢占."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+
+import pytest
+
+
+class TestOperationPreemption:
+    """测试后台操作被交互操作抢占并重新入队."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_op_preempts_background_op(self, make_device):
+        """交互操作到达时，进行中的后台操作被中断并在之后重新执行."""
+        device = make_device()
+        order: list[str] = []
+        background_started = asyncio.Event()
+        background_runs = 0
+
+        async def _background() -> str:
+            nonlocal background_runs
+            background_runs += 1
+            order.append(f"background_start_{background_runs}")
+            background_started.set()
+            if background_runs == 1:
+                await asyncio.sleep(30)
+            order.append("background_done")
+            return "battery"
+
+        async def _interactive() -> str:
+            order.append("alarm")
+            return "alarm"
+
+        background = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="read_battery",
+                action=_background,
+                priority=device._op_priority_battery,
+                preemptible=True,
+            )
+        )
+        await background_started.wait()
+
+        alarm_result = await asyncio.wait_for(
+            device._async_enqueue_operation(
+                name="start_alarm",
+                action=_interactive,
+                priority=device._op_priority_alarm,
+            ),
+            timeout=1.0,
+        )
+        assert alarm_result == "alarm"
+        assert await asyncio.wait_for(background, timeout=1.0) == "battery"
+
+        assert order == [
+            "background_start_1",
+            "alarm",
+            "background_start_2",
+            "background_done",
+        ]
+        assert device.preempt_count == 1
+        # 实测的是交互操作从提交到开始执行的等待，而非估算值
+        assert 0 <= device.last_preempt_wait_ms < 1000
+        assert device.preempt_wait_ms_total == device.last_preempt_wait_ms
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_non_preemptible_op_is_not_interrupted(self, make_device):
+        """不可抢占操作（如写入）不会被中断."""
+        device = make_device()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _write() -> None:
+            started.set()
+            await release.wait()
+
+        write = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="sync_disconnect_policy",
+                action=_write,
+                priority=device._op_priority_battery,
+            )
+        )
+        await started.wait()
+
+        async def _alarm() -> None:
+            return None
+
+        alarm = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="start_alarm", action=_alarm, priority=device._op_priority_alarm
+            )
+        )
+        await asyncio.sleep(0)
+        assert device.preempt_count == 0
+        release.set()
+        await asyncio.wait_for(asyncio.gather(write, alarm), timeout=1.0)
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_preemption_deferred_while_shielded(self, make_device):
+        """连接后初始化期间到达的抢占请求推迟到该阶段结束."""
+        device = make_device()
+        started = asyncio.Event()
+
+        async def _background() -> None:
+            started.set()
+            await asyncio.sleep(30)
+
+        background = asyncio.ensure_future(
+            device._async_enqueue_operation(
+                name="read_battery",
+                action=_background,
+                priority=device._op_priority_battery,
+                preemptible=True,
+            )
+        )
+        await started.wait()
+
+        device._preempt_shielded = True
+        device._maybe_preempt_inflight(device._op_priority_alarm)
+        assert device.preempt_count == 0
+        assert device._preempt_deferred_priority == device._op_priority_alarm
+
+        device._preempt_shielded = False
+        device._maybe_preempt_inflight(device._preempt_deferred_priority)
+        assert device.preempt_count == 1
+
+        device._actor_task.cancel()
+        background.cancel()
@@ -0,0 +1,110 @@
+"""测试基于实测广播间隔的自适应离线检测."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anti_loss_tag import device as device_module
+from custom_components.anti_loss_tag.presence_monitor import PresenceTimerWheel
+
+
+class TestPresenceTimerWheel:
+    """测试全局时间轮."""
+
+    @pytest.mark.asyncio
+    async def test_expires_after_deadline_and_touch_pushes_back(self):
+        """截止时间到达后触发；期间 touch 会推后截止时间."""
+        wheel = PresenceTimerWheel(
+            asyncio.get_running_loop(), tick_seconds=0.01, slots=8
+        )
+        fired: list[str] = []
+
+        wheel.async_touch("a", time.monotonic() + 0.03, lambda: fired.append("a"))
+        wheel.async_touch("b", time.monotonic() + 0.03, lambda: fired.append("b"))
+        await asyncio.sleep(0.02)
+        wheel.async_touch("b", time.monotonic() + 0.2, lambda: fired.append("b"))
+        await asyncio.sleep(0.05)
+        assert fired == ["a"]
+        assert wheel.tracked == 1
+
+        await asyncio.sleep(0.25)
+        assert fired == ["a", "b"]
+        assert wheel.expired_total == 2
+        assert not wheel.running
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_ticking(self):
+        """取消最后一个 key 后时间轮停止 tick."""
+        wheel = PresenceTimerWheel(asyncio.get_running_loop(), tick_seconds=0.01)
+        wheel.async_touch("a", time.monotonic() + 1.0, lambda: None)
+        assert wheel.running
+        wheel.async_cancel("a")
+        assert not wheel.running
+        assert wheel.tracked == 0
+
+
+class TestAdaptivePresence:
+    """测试设备侧的阈值计算与离线判定."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_follows_measured_interval(self, make_device):
+        """阈值 = k × p95 广播间隔（带下限），超时后判定离开."""
+        device = make_device(options={"maintain_connection": False})
+        wheel = PresenceTimerWheel(asyncio.get_running_loop(), tick_seconds=0.01)
+        device._presence_wheel = wheel
+        now = [1000.0]
+
+        with patch.object(device_module.time, "monotonic", lambda: now[0]):
+            for _ in range(10):
+                now[0] += 2.0
+                device._async_on_bluetooth_event(SimpleNamespace(rssi=-60), None)
+
+            assert device.presence_interval_p95 == pytest.approx(2.0)
+            assert device.presence_timeout == pytest.approx(6.0)
+            assert device.available
+
+            now[0] += 7.0
+            device._async_on_presence_timeout()
+
+        assert not device.available
+        assert device.presence_timeouts == 1
+        assert device.last_loss_detection_latency == pytest.approx(7.0)
+        wheel.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_connected_tag_is_not_declared_gone(self, make_device):
+        """已连接的标签停止广播不视为离开."""
+        device = make_device()
+        device._available = True
+        device._connected = True
+        device._async_on_presence_timeout()
+        assert device.available
+        assert device.presence_timeouts == 0
+
+    @pytest.mark.asyncio
+    async def test_tag_lost_while_connected_goes_unavailable_after_disconnect(
+        self, make_device
+    ):
+        """连接期间超时会重新登记；断开后收不到广播即判定离开."""
+        device = make_device()
+        wheel = PresenceTimerWheel(asyncio.get_running_loop(), tick_seconds=0.01)
+        device._presence_wheel = wheel
+        device._presence_wheel_timeout = 0.05
+        device._async_on_bluetooth_event(SimpleNamespace(rssi=-60), None)
+        device._connected = True
+
+        await asyncio.sleep(0.12)
+        assert device.available
+        assert wheel.tracked == 1
+
+        device._on_disconnect(None)
+        await asyncio.sleep(0.12)
+
+        assert not device.available
+        assert device.presence_timeouts == 1
+        wheel.async_shutdown()
@@ -0,0 +1,119 @@
+"""测试重试策略（decorrelated jitter + 共享预算）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from bleak.exc import BleakError
+
+from custom_components.anti_loss_tag.retry_policy import (
+    RETRY_POLICIES,
+    RetryPolicy,
+    get_retry_policy,
+)
+
+
+class TestRetrySession:
+    """测试重试会话."""
+
+    def test_decorrelated_jitter_within_bounds(self):
+        """退避落在 [base, min(cap, prev*3)] 区间内."""
+        policy = RetryPolicy(
+            name="t",
+            max_retries=50,
+            base_delay=0.5,
+            max_delay=4.0,
+            budget_seconds=10_000.0,
+            connect_attempts=1,
+        )
+        session = policy.new_session()
+        prev = policy.base_delay
+        for _ in range(50):
+            delay = session.next_delay()
+            assert delay is not None
+            assert policy.base_delay <= delay <= min(policy.max_delay, prev * 3)
+            prev = delay
+
+    def test_budget_exhaustion_uses_monotonic_clock(self):
+        """预算耗尽后不再给出退避."""
+        policy = RetryPolicy(
+            name="t",
+            max_retries=10,
+            base_delay=1.0,
+            max_delay=1.0,
+            budget_seconds=5.0,
+            connect_attempts=1,
+        )
+        now = time.monotonic()
+        with patch(
+            "custom_components.anti_loss_tag.retry_policy.time.monotonic",
+            return_value=now,
+        ):
+            session = policy.new_session()
+        with patch(
+            "custom_components.anti_loss_tag.retry_policy.time.monotonic",
+            return_value=now + 4.5,
+        ):
+            # 剩余预算不足以容纳一次退避
+            assert session.next_delay() is None
+            assert not session.exhausted
+        with patch(
+            "custom_components.anti_loss_tag.retry_policy.time.monotonic",
+            return_value=now + 5.5,
+        ):
+            assert session.exhausted
+
+    def test_unknown_purpose_falls_back_to_general(self):
+        """未知用途使用 general 策略."""
+        assert get_retry_policy("nope") is RETRY_POLICIES["general"]
+        for purpose in ("interactive_alarm", "policy_sync", "background_battery"):
+            assert get_retry_policy(purpose).name == purpose
+
+
+class TestOperationRetry:
+    """测试设备操作层使用策略重试."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_op_retries_within_policy(self, make_device):
+        """交互操作按策略的最大重试次数重试后失败."""
+        device = make_device()
+        device._connection_error_classification = "connect_error"
+        attempts = 0
+
+        async def _action() -> None:
+            nonlocal attempts
+            attempts += 1
+            raise BleakError("boom")
+
+        with patch(
+            "custom_components.anti_loss_tag.retry_policy.random.uniform",
+            return_value=0.0,
+        ):
+            with pytest.raises(BleakError):
+                await asyncio.wait_for(
+                    device._async_enqueue_operation(
+                        name="start_alarm",
+                        action=_action,
+                        priority=device._op_priority_alarm,
+                        purpose="interactive_alarm",
+                    ),
+                    timeout=2.0,
+                )
+        assert attempts == RETRY_POLICIES["interactive_alarm"].max_retries + 1
+        device._actor_task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_connect_backoff_shares_operation_session(self, make_device):
+        """连接层退避从当前操作会话抽取."""
+        device = make_device()
+        session = RETRY_POLICIES["interactive_alarm"].new_session()
+        device._active_retry_session = session
+        backoff = device._apply_connect_backoff(
+            max_backoff=60, connect_purpose="interactive_alarm"
+        )
+        assert backoff <= RETRY_POLICIES["interactive_alarm"].max_delay
+        assert device._connect_retry_session is None
+        assert device._cooldown_until_ts > time.monotonic()
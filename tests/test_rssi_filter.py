@@ -0,0 +1,57 @@
+"""测试 RSSI 环形缓冲与平滑滤波."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import pytest
+
+from custom_components.anti_loss_tag.rssi_filter import (
+    RSSI_FILTER_EMA,
+    RSSI_FILTER_KALMAN,
+    RssiFilter,
+)
+
+
+class TestRssiFilter:
+    """测试滤波器输出与缓冲区统计."""
+
+    @pytest.mark.parametrize("mode", [RSSI_FILTER_EMA, RSSI_FILTER_KALMAN])
+    def test_smoothing_reduces_jitter(self, mode):
+        """平滑值的波动明显小于原始抖动，并收敛到均值附近."""
+        rssi_filter = RssiFilter(mode)
+        raw = [-60 + (4 if i % 2 else -4) for i in range(200)]
+        smoothed = [rssi_filter.add(float(i), value) for i, value in enumerate(raw)]
+
+        tail = smoothed[-50:]
+        assert max(tail) - min(tail) < 8
+        assert abs(sum(tail) / len(tail) + 60) < 1.0
+        assert rssi_filter.mode == mode
+
+    def test_ring_buffer_is_bounded(self):
+        """缓冲区固定大小，方差与采样率基于窗口内样本."""
+        rssi_filter = RssiFilter(size=8)
+        assert rssi_filter.variance is None
+        assert rssi_filter.sample_rate is None
+
+        for i in range(100):
+            rssi_filter.add(i * 0.5, -70)
+        assert rssi_filter.sample_count == 8
+        assert rssi_filter.variance == 0.0
+        assert rssi_filter.sample_rate == pytest.approx(2.0)
+
+        rssi_filter.add(50.0, -60)
+        assert rssi_filter.variance > 0.0
+
+    def test_values_clamped_and_reset(self):
+        """超出单字节范围的值被截断；reset 清空状态."""
+        rssi_filter = RssiFilter()
+        rssi_filter.add(0.0, -200)
+        rssi_filter.add(1.0, -200)
+        assert rssi_filter.variance == 0.0
+
+        rssi_filter.reset()
+        assert rssi_filter.smoothed is None
+        assert rssi_filter.sample_count == 0
+
+    def test_unknown_mode_falls_back_to_ema(self):
+        """未知模式回退到 EMA."""
+        assert RssiFilter("median").mode == RSSI_FILTER_EMA
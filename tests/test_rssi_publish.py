@@ -0,0 +1,75 @@
+"""测试 RSSI 死区与发布间隔."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.anti_loss_tag import device as device_module
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRssiPublish:
+    """测试信号强度传感器的发布节流."""
+
+    @pytest.mark.asyncio
+    async def test_jitter_within_deadband_is_not_published(self, make_device):
+        """死区内的抖动不发布；超出死区需满足最小间隔."""
+        device = make_device(
+            options={
+                "rssi_deadband_db": 4,
+                "rssi_min_publish_interval_s": 10,
+                "rssi_max_publish_interval_s": 300,
+            }
+        )
+        now = 1000.0
+        assert device._maybe_publish_rssi(-60, now)
+        assert device.rssi == -60
+
+        for value in (-57, -63, -58, -62):
+            now += 20
+            assert not device._maybe_publish_rssi(value, now)
+            assert device.rssi == -60
+
+        # 超出死区且满足最小间隔：发布
+        now += 20
+        assert device._maybe_publish_rssi(-70.4, now)
+        assert device.rssi == -70
+
+        # 超出死区但距上次发布未到最小间隔：不发布
+        now += 5
+        assert not device._maybe_publish_rssi(-80, now)
+        now += 10
+        assert device._maybe_publish_rssi(-80, now)
+        assert device.rssi == -80
+
+    @pytest.mark.asyncio
+    async def test_max_interval_forces_publish(self, make_device):
+        """最大间隔到期时即使变化很小也发布."""
+        device = make_device(options={"rssi_max_publish_interval_s": 60})
+        assert device._maybe_publish_rssi(-60, 1000.0)
+        assert not device._maybe_publish_rssi(-61, 1030.0)
+        assert device._maybe_publish_rssi(-61, 1061.0)
+        assert device.rssi == -61
+
+    @pytest.mark.asyncio
+    async def test_raw_stream_kept_for_every_advertisement(self, make_device):
+        """每条广播都更新原始 RSSI，发布值保持稳定."""
+        device = make_device()
+        clock = _Clock()
+        with patch.object(device_module.time, "monotonic", clock):
+            device._async_on_bluetooth_event(SimpleNamespace(rssi=-60), None)
+            for value in (-57, -63, -59):
+                clock.now += 1
+                device._async_on_bluetooth_event(SimpleNamespace(rssi=value), None)
+                assert device.rssi_raw == value
+        assert device.rssi == -60
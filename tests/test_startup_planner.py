@@ -0,0 +1,152 @@
+"""测试集成级启动错峰规划."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.anti_loss_tag import device as device_module
+from custom_components.anti_loss_tag.const import DOMAIN
+from custom_components.anti_loss_tag.device import AntiLossTagDevice
+from custom_components.anti_loss_tag.startup_planner import StartupPlanner
+
+
+def _start(device) -> None:
+    with patch.object(
+        device_module.bluetooth, "async_register_callback", return_value=lambda: None
+    ), patch.object(
+        device_module.bluetooth, "async_track_unavailable", return_value=lambda: None
+    ):
+        device.async_start()
+
+
+def _make_planned_device(make_device, planner, **kwargs):
+    device = make_device(**kwargs)
+    device._startup_planner = planner
+    return device
+
+
+class TestStartupPlanner:
+    """测试时隙分配与车队就绪统计."""
+
+    def test_slots_are_spread_by_fleet_and_capacity(self):
+        """相邻时隙间隔 = 单次连接耗时 / 槽位数，窗口随车队规模伸缩."""
+        planner = StartupPlanner(
+            fleet_size=9, slot_capacity=3, seconds_per_connect=6.0, min_delay=0.5
+        )
+        assert planner.spacing_seconds == pytest.approx(2.0)
+        assert planner.window_seconds == pytest.approx(18.5)
+
+        delays = [planner.async_reserve(f"tag{i}") for i in range(4)]
+        for index, delay in enumerate(delays):
+            slot = 0.5 + 2.0 * index
+            assert slot - 0.01 <= delay <= slot + 0.5 + 0.01
+        assert planner.outstanding == 4
+
+        larger = StartupPlanner(fleet_size=90, slot_capacity=3, seconds_per_connect=6.0)
+        assert larger.window_seconds > 9 * planner.window_seconds
+
+    def test_fleet_size_is_read_when_needed(self):
+        """车队规模回调在读取时求值，条目增删后窗口随之变化."""
+        entries = ["a"]
+        planner = StartupPlanner(
+            fleet_size=lambda: len(entries),
+            slot_capacity=1,
+            seconds_per_connect=2.0,
+            min_delay=0.0,
+        )
+        assert planner.window_seconds == pytest.approx(2.0)
+
+        entries.extend(["b", "c"])
+        assert planner.fleet_size == 3
+        assert planner.window_seconds == pytest.approx(6.0)
+
+        entries.clear()
+        assert planner.fleet_size == 1
+
+    def test_time_to_fleet_ready(self):
+        """全部设备就绪（或被移除）后记录 time-to-fleet-ready."""
+        planner = StartupPlanner(fleet_size=2, slot_capacity=1, seconds_per_connect=1.0)
+        planner.async_reserve("a")
+        planner.async_reserve("b")
+        planner.async_mark_ready("a")
+        assert planner.time_to_fleet_ready is None
+
+        planner.async_forget("b")
+        assert planner.time_to_fleet_ready is not None
+        assert planner.ready_total == 1
+
+        # 之后单独新增的设备开始新一轮统计
+        planner.async_reserve("c")
+        assert planner.time_to_fleet_ready is None
+
+
+class TestDeviceStartupSlot:
+    """测试设备按启动时隙推迟后台连接."""
+
+    @pytest.mark.asyncio
+    async def test_background_connect_waits_for_slot(self, make_device):
+        """时隙到达前的后台连接请求只记录，时隙到达后执行."""
+        planner = StartupPlanner(
+            fleet_size=1, slot_capacity=1, seconds_per_connect=60.0, min_delay=60.0
+        )
+        device = _make_planned_device(make_device, planner)
+        ensure = AsyncMock(return_value=True)
+        with patch.object(AntiLossTagDevice, "async_ensure_connected", ensure):
+            _start(device)
+            assert device.last_battery_sleep_reason == "startup"
+            assert device.last_battery_sleep_seconds >= 60.0
+
+            device._request_connect()
+            await asyncio.sleep(0.01)
+            assert ensure.await_count == 0
+            assert device._startup_connect_deferred
+
+            device._startup_handle.cancel()
+            device._async_on_startup_slot()
+            await asyncio.sleep(0.01)
+            assert ensure.await_count == 1
+        device.async_stop()
+        assert planner.outstanding == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_operation_bypasses_slot(self, make_device):
+        """报警等交互操作不受启动时隙限制."""
+        planner = StartupPlanner(
+            fleet_size=1, slot_capacity=1, seconds_per_connect=60.0, min_delay=60.0
+        )
+        device = _make_planned_device(make_device, planner)
+        with patch.object(AntiLossTagDevice, "_async_write_bytes", AsyncMock()) as write:
+            _start(device)
+            assert device._startup_handle is not None
+            await device.async_start_alarm()
+            assert write.await_count == 1
+        device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_ready_after_slot_with_known_battery(self, make_device):
+        """电量已知且无需维持连接时，时隙到达即视为就绪."""
+        planner = StartupPlanner(fleet_size=1, slot_capacity=1, seconds_per_connect=1.0)
+        device = _make_planned_device(
+            make_device, planner, options={"maintain_connection": False}
+        )
+        device._battery = 80
+        _start(device)
+        assert planner.outstanding == 1
+
+        device._startup_handle.cancel()
+        device._async_on_startup_slot()
+        assert planner.outstanding == 0
+        assert planner.time_to_fleet_ready is not None
+        device.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_device_reads_shared_planner(self, make_device):
+        """设备从 hass.data 读取集成级规划器."""
+        device = make_device()
+        assert device._startup_planner is None
+        planner = StartupPlanner(fleet_size=1, slot_capacity=1, seconds_per_connect=1.0)
+        device.hass.data[DOMAIN]["_startup_planner"] = planner
+        assert AntiLossTagDevice(device.hass, device.entry)._startup_planner is planner
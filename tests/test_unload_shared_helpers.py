@@ -0,0 +1,68 @@
+"""测试卸载最后一个条目时停止全局共享组件."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+
+from custom_components.anti_loss_tag import async_unload_entry
+from custom_components.anti_loss_tag.const import DOMAIN
+
+_HELPERS = (
+    "_battery_scheduler",
+    "_presence_wheel",
+    "_update_batcher",
+    "_advert_router",
+)
+
+
+def _entry(entry_id: str, state: ConfigEntryState) -> MagicMock:
+    entry = MagicMock()
+    entry.entry_id = entry_id
+    entry.state = state
+    return entry
+
+
+def _hass(entries: list[MagicMock]) -> MagicMock:
+    hass = MagicMock()
+    hass.data = {DOMAIN: {key: MagicMock() for key in _HELPERS}}
+    hass.data[DOMAIN]["_conn_mgr"] = MagicMock()
+    hass.data[DOMAIN]["_startup_planner"] = MagicMock()
+    hass.config_entries.async_entries.return_value = entries
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    return hass
+
+
+class TestUnloadSharedHelpers:
+    """测试全局组件的生命周期."""
+
+    @pytest.mark.asyncio
+    async def test_helpers_kept_while_other_entries_loaded(self):
+        """仍有其他已加载条目时保留全局组件."""
+        entry = _entry("a", ConfigEntryState.LOADED)
+        other = _entry("b", ConfigEntryState.LOADED)
+        hass = _hass([entry, other])
+        helpers = dict(hass.data[DOMAIN])
+
+        assert await async_unload_entry(hass, entry)
+
+        entry.runtime_data.async_stop.assert_called_once()
+        assert hass.data[DOMAIN] == helpers
+        for key in _HELPERS:
+            helpers[key].async_shutdown.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_last_entry_shuts_down_helpers(self):
+        """最后一个条目卸载时停止并移除全部全局组件."""
+        entry = _entry("a", ConfigEntryState.LOADED)
+        other = _entry("b", ConfigEntryState.NOT_LOADED)
+        hass = _hass([entry, other])
+        helpers = dict(hass.data[DOMAIN])
+
+        assert await async_unload_entry(hass, entry)
+
+        assert DOMAIN not in hass.data
+        for key in _HELPERS:
+            helpers[key].async_shutdown.assert_called_once()
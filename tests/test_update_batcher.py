@@ -0,0 +1,108 @@
+"""测试集成级实体更新批处理器."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+
+import pytest
+
+from custom_components.anti_loss_tag.device import DeviceField
+from custom_components.anti_loss_tag.update_batcher import EntityUpdateBatcher
+
+
+class TestEntityUpdateBatcher:
+    """测试批处理合并与指标."""
+
+    @pytest.mark.asyncio
+    async def test_marks_coalesce_into_single_flush(self):
+        """同一 tick 内的多次标记只触发一次批量刷新."""
+        batcher = EntityUpdateBatcher(asyncio.get_running_loop())
+        flushed: list[str] = []
+
+        def _flush_a() -> None:
+            flushed.append("a")
+
+        def _flush_b() -> None:
+            flushed.append("b")
+
+        for _ in range(3):
+            batcher.async_mark_dirty(_flush_a)
+        batcher.async_mark_dirty(_flush_b)
+        assert batcher.pending == 2
+        assert flushed == []
+
+        await asyncio.sleep(0)
+        assert flushed == ["a", "b"]
+        assert batcher.flush_count == 1
+        assert batcher.marks_total == 4
+        assert batcher.writes_saved == 2
+        assert batcher.devices_flushed == 2
+        assert batcher.max_flush_latency_ms >= 0.0
+
+    @pytest.mark.asyncio
+    async def test_discard_and_interval(self):
+        """停止的设备被移出批次；刷新之后的标记至少间隔 interval 再刷新."""
+        batcher = EntityUpdateBatcher(asyncio.get_running_loop(), interval=0.02)
+        flushed: list[str] = []
+
+        def _flush() -> None:
+            flushed.append("x")
+
+        batcher.async_mark_dirty(_flush)
+        batcher.async_discard(_flush)
+        batcher.async_mark_dirty(lambda: flushed.append("y"))
+        await asyncio.sleep(0)
+        assert flushed == ["y"]
+
+        batcher.async_mark_dirty(lambda: flushed.append("z"))
+        await asyncio.sleep(0)
+        assert flushed == ["y"]
+
+        await asyncio.sleep(0.05)
+        assert flushed == ["y", "z"]
+        assert batcher.last_flush_latency_ms >= 15.0
+        batcher.async_shutdown()
+
+    @pytest.mark.asyncio
+    async def test_device_bursts_write_less_than_changes(self, make_device):
+        """多设备连续变化时，写入次数远少于变化次数."""
+        loop = asyncio.get_running_loop()
+        batcher = EntityUpdateBatcher(loop, interval=0.05)
+        devices = []
+        writes = 0
+        changes = 0
+
+        def _write() -> None:
+            nonlocal writes
+            writes += 1
+
+        for i in range(20):
+            device = make_device(address=f"AA:BB:CC:DD:EE:{i:02X}")
+            device._update_batcher = batcher
+            device.async_add_listener(_write, DeviceField.RSSI)
+            devices.append(device)
+
+        def _burst(base: int) -> None:
+            nonlocal changes
+            for step in range(4):
+                for device in devices:
+                    device._rssi_published = base - step
+                    device._async_dispatch_update()
+                    changes += 1
+
+        _burst(-60)
+        assert writes == 0
+        await asyncio.sleep(0)
+        assert writes == 20
+
+        # 窗口内的第二轮变化合并到尾沿刷新
+        _burst(-70)
+        await asyncio.sleep(0)
+        assert writes == 20
+        await asyncio.sleep(0.1)
+
+        assert writes == 40
+        assert changes == 160
+        assert batcher.flush_count == 2
+        assert batcher.writes_saved == changes - writes
+        batcher.async_shutdown()
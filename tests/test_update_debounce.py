@@ -0,0 +1,52 @@
+"""测试实体更新的首沿 + 尾沿合并（由批处理器负责）."""
+# Copyright (c) 2025-2026 MMMM
+# See LICENSE file for details
+
+import asyncio
+
+import pytest
+
+from custom_components.anti_loss_tag.update_batcher import EntityUpdateBatcher
+
+
+class TestUpdateDebounce:
+    """测试窗口内更新被合并而不是丢弃."""
+
+    @pytest.mark.asyncio
+    async def test_trailing_flush_publishes_final_state(self, make_device):
+        """窗口内的断开更新在窗口结束时发布."""
+        device = make_device()
+        device._update_batcher = EntityUpdateBatcher(
+            asyncio.get_running_loop(), interval=0.05
+        )
+        seen: list[bool] = []
+        device.async_add_listener(lambda: seen.append(device.connected))
+
+        device._connected = True
+        device._async_dispatch_update()
+        await asyncio.sleep(0)
+        assert seen == [True]
+
+        device._connected = False
+        device._async_dispatch_update()
+        device._async_dispatch_update()
+        await asyncio.sleep(0)
+        assert seen == [True]
+        assert device._update_batcher.pending == 1
+
+        await asyncio.sleep(0.1)
+        assert seen == [True, False]
+        assert device._update_batcher.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_stop_discards_pending_flush(self, make_device):
+        """停止设备时移出尚未刷新的批次."""
+        device = make_device()
+        batcher = EntityUpdateBatcher(asyncio.get_running_loop(), interval=0.05)
+        device._update_batcher = batcher
+        device._async_dispatch_update()
+        assert batcher.pending == 1
+
+        device.async_stop()
+        assert batcher.pending == 0
+        batcher.async_shutdown()